@@ -4,6 +4,7 @@ import logging
 from collections import defaultdict
 from src.database.db import Database
 from src.database.models import BCPlayer, BCMatchPlayerStats, BCBestPlayer
+from src.services.bc_data_service import BCDataService
 from sqlalchemy import func
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
@@ -29,6 +30,7 @@ def merge_duplicates(db_path='data/volleyball.db', dry_run=False):
 
         merged_count = 0
         deleted_count = 0
+        primary_ids = set()
 
         for g in groups:
             players = s.query(BCPlayer).filter_by(
@@ -88,13 +90,19 @@ def merge_duplicates(db_path='data/volleyball.db', dry_run=False):
                 for bp in dup_bps:
                     bp.player_id = primary.id
 
-                # Delete duplicate player
+                # Delete duplicate player. Flush the moves first: otherwise deleting
+                # it loads its old awards from the DB and clears their player_id
+                s.flush()
                 s.delete(dup)
                 deleted_count += 1
 
+            primary_ids.add(primary.id)
             merged_count += 1
 
         if not dry_run:
+            # The primaries' cached match totals / mvp_count now cover the moved rows
+            s.flush()
+            BCDataService(s).refresh_player_stats(primary_ids)
             s.commit()
 
         logger.info(f"\nMerged {merged_count} groups, deleted {deleted_count} duplicate players")
@@ -0,0 +1,37 @@
+"""One-time migration: add and fill the cached bc_players match totals / mvp_count columns."""
+import sqlite3
+import sys
+
+COLUMNS = ('match_count', 'total_points', 'total_attacks', 'total_serves', 'total_blocks', 'mvp_count')
+
+
+def migrate(db_path='data/volleyball.db'):
+    conn = sqlite3.connect(db_path)
+    cur = conn.cursor()
+
+    # Add columns if not exist
+    columns = [row[1] for row in cur.execute("PRAGMA table_info(bc_players)")]
+    for column in COLUMNS:
+        if column not in columns:
+            cur.execute(f"ALTER TABLE bc_players ADD COLUMN {column} INTEGER DEFAULT 0")
+            print(f"Added '{column}' column to bc_players table")
+        else:
+            print(f"Column '{column}' already exists")
+
+    cur.execute("""
+        UPDATE bc_players SET
+            match_count = (SELECT COUNT(*) FROM bc_match_player_stats s WHERE s.player_id = bc_players.id),
+            total_points = (SELECT COALESCE(SUM(points), 0) FROM bc_match_player_stats s WHERE s.player_id = bc_players.id),
+            total_attacks = (SELECT COALESCE(SUM(attacks), 0) FROM bc_match_player_stats s WHERE s.player_id = bc_players.id),
+            total_serves = (SELECT COALESCE(SUM(serves), 0) FROM bc_match_player_stats s WHERE s.player_id = bc_players.id),
+            total_blocks = (SELECT COALESCE(SUM(blocks), 0) FROM bc_match_player_stats s WHERE s.player_id = bc_players.id),
+            mvp_count = (SELECT COUNT(*) FROM bc_best_players b WHERE b.player_id = bc_players.id)
+    """)
+    conn.commit()
+    print(f"Updated totals for {cur.rowcount} BC players")
+    conn.close()
+
+
+if __name__ == '__main__':
+    db_path = sys.argv[1] if len(sys.argv) > 1 else 'data/volleyball.db'
+    migrate(db_path)
@@ -0,0 +1,30 @@
+"""One-time migration: add the generated players.full_name / referees.full_name columns."""
+import sqlite3
+import sys
+
+from src.database.models import FULL_NAME_SQL
+
+
+def migrate(db_path='data/volleyball.db'):
+    conn = sqlite3.connect(db_path)
+    cur = conn.cursor()
+
+    # Add columns if not exist (virtual, so existing rows need no backfill)
+    for table in ('players', 'referees'):
+        columns = [row[1] for row in cur.execute(f"PRAGMA table_xinfo({table})")]
+        if 'full_name' not in columns:
+            cur.execute(
+                f"ALTER TABLE {table} ADD COLUMN full_name VARCHAR(310) "
+                f"GENERATED ALWAYS AS ({FULL_NAME_SQL}) VIRTUAL"
+            )
+            print(f"Added 'full_name' column to {table} table")
+        else:
+            print(f"Column 'full_name' already exists in {table}")
+
+    conn.commit()
+    conn.close()
+
+
+if __name__ == '__main__':
+    db_path = sys.argv[1] if len(sys.argv) > 1 else 'data/volleyball.db'
+    migrate(db_path)
@@ -0,0 +1,31 @@
+"""One-time migration: add and fill the cached players.mvp_count / match_count columns."""
+import sqlite3
+import sys
+
+
+def migrate(db_path='data/volleyball.db'):
+    conn = sqlite3.connect(db_path)
+    cur = conn.cursor()
+
+    # Add columns if not exist
+    columns = [row[1] for row in cur.execute("PRAGMA table_info(players)")]
+    for column in ('mvp_count', 'match_count'):
+        if column not in columns:
+            cur.execute(f"ALTER TABLE players ADD COLUMN {column} INTEGER DEFAULT 0")
+            print(f"Added '{column}' column to players table")
+        else:
+            print(f"Column '{column}' already exists")
+
+    cur.execute("""
+        UPDATE players SET
+            mvp_count = (SELECT COUNT(*) FROM best_players WHERE best_players.player_id = players.id),
+            match_count = (SELECT COUNT(*) FROM match_players WHERE match_players.player_id = players.id)
+    """)
+    conn.commit()
+    print(f"Updated counts for {cur.rowcount} players")
+    conn.close()
+
+
+if __name__ == '__main__':
+    db_path = sys.argv[1] if len(sys.argv) > 1 else 'data/volleyball.db'
+    migrate(db_path)
@@ -0,0 +1,35 @@
+"""One-time migration: add and fill the cached referees.match_count / avg_rating columns."""
+import sqlite3
+import sys
+
+
+def migrate(db_path='data/volleyball.db'):
+    conn = sqlite3.connect(db_path)
+    cur = conn.cursor()
+
+    # Add columns if not exist
+    columns = [row[1] for row in cur.execute("PRAGMA table_info(referees)")]
+    for column, column_type in (('match_count', 'INTEGER DEFAULT 0'), ('avg_rating', 'FLOAT')):
+        if column not in columns:
+            cur.execute(f"ALTER TABLE referees ADD COLUMN {column} {column_type}")
+            print(f"Added '{column}' column to referees table")
+        else:
+            print(f"Column '{column}' already exists")
+
+    cur.execute("""
+        UPDATE referees SET
+            match_count = (SELECT COUNT(*) FROM matches WHERE matches.referee_id = referees.id),
+            avg_rating = (
+                SELECT (COALESCE(SUM(referee_rating_home), 0) + COALESCE(SUM(referee_rating_away), 0)) * 1.0
+                       / NULLIF(COUNT(referee_rating_home) + COUNT(referee_rating_away), 0)
+                FROM matches WHERE matches.referee_id = referees.id
+            )
+    """)
+    conn.commit()
+    print(f"Updated stats for {cur.rowcount} referees")
+    conn.close()
+
+
+if __name__ == '__main__':
+    db_path = sys.argv[1] if len(sys.argv) > 1 else 'data/volleyball.db'
+    migrate(db_path)
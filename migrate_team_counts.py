@@ -0,0 +1,35 @@
+"""One-time migration: add and fill the cached teams.match_count / wins columns."""
+import sqlite3
+import sys
+
+
+def migrate(db_path='data/volleyball.db'):
+    conn = sqlite3.connect(db_path)
+    cur = conn.cursor()
+
+    # Add columns if not exist
+    columns = [row[1] for row in cur.execute("PRAGMA table_info(teams)")]
+    for column in ('match_count', 'wins'):
+        if column not in columns:
+            cur.execute(f"ALTER TABLE teams ADD COLUMN {column} INTEGER DEFAULT 0")
+            print(f"Added '{column}' column to teams table")
+        else:
+            print(f"Column '{column}' already exists")
+
+    cur.execute("""
+        UPDATE teams SET
+            match_count = (SELECT COUNT(*) FROM matches WHERE matches.home_team_id = teams.id)
+                        + (SELECT COUNT(*) FROM matches WHERE matches.away_team_id = teams.id),
+            wins = (SELECT COUNT(*) FROM matches
+                    WHERE matches.home_team_id = teams.id AND matches.home_score > matches.away_score)
+                 + (SELECT COUNT(*) FROM matches
+                    WHERE matches.away_team_id = teams.id AND matches.away_score > matches.home_score)
+    """)
+    conn.commit()
+    print(f"Updated counts for {cur.rowcount} teams")
+    conn.close()
+
+
+if __name__ == '__main__':
+    db_path = sys.argv[1] if len(sys.argv) > 1 else 'data/volleyball.db'
+    migrate(db_path)
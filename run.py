@@ -4,6 +4,7 @@
 import argparse
 import logging
 import sys
+import time
 
 # Setup logging
 logging.basicConfig(
@@ -27,6 +28,22 @@ def run_web(host: str = '127.0.0.1', port: int = 5000, debug: bool = False):
     app.run(host=host, port=port, debug=debug, threaded=True)
 
 
+def run_updater():
+    """Run the auto-updater on its own, next to a web server started with VB_AUTOUPDATE_IN_WEB=0."""
+    from src.database.db import Database
+    from src.services.scheduler import AutoUpdater
+
+    db = Database()
+    db.create_tables()
+    updater = AutoUpdater(db)
+    updater.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        updater.stop()
+
+
 def run_cli_parse_matches(start_id: int, end_id: int):
     """Run match parsing from command line."""
     from src.database.db import Database
@@ -77,6 +94,9 @@ def main():
     web_parser.add_argument('--port', type=int, default=5000, help='Port to bind to')
     web_parser.add_argument('--debug', action='store_true', help='Enable debug mode')
 
+    # Standalone auto-updater command
+    subparsers.add_parser('updater', help='Run the auto-updater without the web interface')
+
     # Parse matches command
     parse_parser = subparsers.add_parser('parse', help='Parse matches from CLI')
     parse_parser.add_argument('--start', type=int, required=True, help='Start match ID')
@@ -86,6 +106,8 @@ def main():
 
     if args.command == 'web':
         run_web(args.host, args.port, args.debug)
+    elif args.command == 'updater':
+        run_updater()
     elif args.command == 'parse':
         run_cli_parse_matches(args.start, args.end)
     else:
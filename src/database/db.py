@@ -1,16 +1,62 @@
 """Database connection and session management."""
 
 import os
+import hashlib
+import logging
 from contextlib import contextmanager
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import sessionmaker, Session
 
 from .models import Base
 
+logger = logging.getLogger(__name__)
+
 
 class Database:
     """Database connection manager."""
 
+    # WAL lets readers (the web API) run alongside parser writes, and
+    # synchronous=NORMAL skips the fsync on every commit in WAL mode.
+    SQLITE_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-65536",  # 64 MB
+    )
+
+    # Compiled-statement cache entries: headroom over SQLAlchemy's default
+    # of 500 for the VM and BC endpoints plus the parsers' statements.
+    QUERY_CACHE_SIZE = 1200
+
+    # Connection pool: room for the web server's request threads (see wsgi.py)
+    # plus the parser and auto-updater threads, so connections are not
+    # opened and closed per request. LIFO keeps reusing the most recent ones,
+    # whose page caches (cache_size above) are warm.
+    POOL_OPTIONS = {"pool_size": 12, "max_overflow": 8, "pool_use_lifo": True}
+
+    # Indexes since superseded by a declared one (e.g. widened with a sort
+    # column), dropped from existing databases by create_tables.
+    REPLACED_INDEXES = (
+        "ix_match_referee_id",
+        "ix_bc_match_home_team_id",
+        "ix_bc_match_away_team_id",
+        "ix_bc_stats_player_id",
+    )
+
+    # Trigram FTS5 indexes (table -> name columns) serving the API's
+    # substring searches, which a plain LIKE '%...%' can only table-scan.
+    SEARCH_INDEXES = {
+        "teams": ("name",),
+        "players": ("last_name", "first_name", "patronymic"),
+        "referees": ("last_name", "first_name", "patronymic"),
+        "bc_teams": ("name",),
+        "bc_players": ("last_name", "first_name"),
+        "bc_referees": ("last_name", "first_name"),
+    }
+
+    _checksum = None  # see _schema_checksum
+
     def __init__(self, db_path: str = None):
         if db_path is None:
             # Default path: data/volleyball.db relative to project root
@@ -21,21 +67,132 @@ class Database:
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
         self.db_path = db_path
-        self.engine = create_engine(f"sqlite:///{db_path}", echo=False)
+        self.engine = create_engine(
+            f"sqlite:///{db_path}", echo=False, query_cache_size=self.QUERY_CACHE_SIZE,
+            **self.POOL_OPTIONS
+        )
+        event.listen(self.engine, "connect", self._set_sqlite_pragmas)
         self.SessionLocal = sessionmaker(bind=self.engine)
+        self.search_enabled = False  # set by create_tables once the FTS tables exist
+
+    @classmethod
+    def _set_sqlite_pragmas(cls, dbapi_con, connection_record):
+        cursor = dbapi_con.cursor()
+        for pragma in cls.SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
 
     def create_tables(self):
-        """Create all tables in the database."""
+        """Create all tables in the database.
+
+        The schema checksum is kept in PRAGMA user_version once everything
+        is in place, so later startups on an up-to-date file skip the
+        per-table and per-index existence checks.
+        """
+        checksum = self._schema_checksum()
+        with self.engine.connect() as conn:
+            if conn.exec_driver_sql("PRAGMA user_version").scalar() == checksum:
+                self.search_enabled = True
+                return
         Base.metadata.create_all(self.engine)
+        self._create_missing_indexes()
+        self._create_search_indexes()
+        if self.search_enabled:
+            # Without FTS the full check keeps running, retrying the FTS setup
+            with self.engine.begin() as conn:
+                conn.exec_driver_sql(f"PRAGMA user_version = {checksum}")
+
+    @classmethod
+    def _schema_checksum(cls) -> int:
+        """Checksum of the declared schema, fitting SQLite's 32-bit user_version."""
+        if cls._checksum is None:
+            # Names and types only: reprs of whole tables carry addresses of callable defaults
+            parts = [repr(cls.REPLACED_INDEXES), repr(cls.SEARCH_INDEXES)]
+            for table in Base.metadata.sorted_tables:
+                parts.append(table.name)
+                for c in table.columns:
+                    # DefaultClause keeps its SQL in .arg, Computed in .sqltext
+                    default = getattr(c.server_default, "arg", getattr(c.server_default, "sqltext", None))
+                    parts.append(f"{c.name} {c.type!r} {c.nullable} {default}")
+                parts.extend(sorted(
+                    f"{i.name} {i.unique} {', '.join(map(str, i.expressions))}" for i in table.indexes
+                ))
+            digest = hashlib.sha256("\n".join(parts).encode()).hexdigest()
+            cls._checksum = int(digest[:7], 16) or 1
+        return cls._checksum
+
+    def _create_missing_indexes(self):
+        """Add indexes declared after a table was created (create_all skips existing tables)."""
+        with self.engine.begin() as conn:
+            existing = {
+                row[0] for row in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'")
+            }
+            for name in self.REPLACED_INDEXES:
+                if name in existing:
+                    conn.exec_driver_sql(f"DROP INDEX {name}")
+            created = False
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    if index.name not in existing:
+                        index.create(conn)
+                        created = True
+            if created:
+                # Refresh planner statistics so the new indexes get picked
+                conn.exec_driver_sql("ANALYZE")
+
+    def _create_search_indexes(self):
+        """Create the external-content FTS tables and the triggers that keep them in sync.
+
+        Without FTS5/trigram support (SQLite < 3.34) searches fall back to LIKE.
+        """
+        try:
+            with self.engine.begin() as conn:
+                for table, columns in self.SEARCH_INDEXES.items():
+                    fts = f"{table}_fts"
+                    if conn.exec_driver_sql(
+                        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts,)
+                    ).first():
+                        continue
+                    cols = ", ".join(columns)
+                    new = ", ".join(f"new.{c}" for c in columns)
+                    old = ", ".join(f"old.{c}" for c in columns)
+                    conn.exec_driver_sql(
+                        f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='{table}', "
+                        f"content_rowid='id', tokenize='trigram')"
+                    )
+                    conn.exec_driver_sql(
+                        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+                        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END"
+                    )
+                    conn.exec_driver_sql(
+                        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+                        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); END"
+                    )
+                    conn.exec_driver_sql(
+                        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN "
+                        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); "
+                        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END"
+                    )
+                    conn.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+            self.search_enabled = True
+        except OperationalError as e:
+            logger.warning("Full-text search unavailable, falling back to LIKE: %s", e)
 
     def drop_tables(self):
         """Drop all tables (use with caution!)."""
+        with self.engine.begin() as conn:
+            for table in self.SEARCH_INDEXES:
+                conn.exec_driver_sql(f"DROP TABLE IF EXISTS {table}_fts")
+            conn.exec_driver_sql("PRAGMA user_version = 0")
         Base.metadata.drop_all(self.engine)
 
     @contextmanager
-    def session(self) -> Session:
-        """Context manager for database sessions."""
-        session = self.SessionLocal()
+    def session(self, **options) -> Session:
+        """Context manager for database sessions.
+
+        options override sessionmaker settings (e.g. autoflush=False).
+        """
+        session = self.SessionLocal(**options)
         try:
             yield session
             session.commit()
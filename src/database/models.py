@@ -4,13 +4,19 @@ from datetime import datetime
 from typing import Optional, List
 from sqlalchemy import (
     String, Integer, Float, DateTime, ForeignKey, Text, Boolean,
-    create_engine, UniqueConstraint
+    create_engine, UniqueConstraint, Index, Computed
 )
 from sqlalchemy.orm import (
     DeclarativeBase, Mapped, mapped_column, relationship
 )
 
 
+# VM player/referee name: last, first and (if known) patronymic. Mapped as a
+# virtual generated column: SQLite builds it while reading rows, and it can
+# be selected, sorted and indexed like any other column.
+FULL_NAME_SQL = "last_name || ' ' || first_name || coalesce(' ' || nullif(patronymic, ''), '')"
+
+
 class Base(DeclarativeBase):
     """Base class for all models."""
     pass
@@ -95,6 +101,10 @@ class Team(Base):
     organization: Mapped[Optional[str]] = mapped_column(String(200))
     gender: Mapped[Optional[str]] = mapped_column(String(10))  # "М" / "Ж" / null
 
+    # Cached counts for the team list, kept up to date by DataService.save_matches
+    match_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    wins: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+
     # Relationships
     home_matches: Mapped[List["Match"]] = relationship(
         back_populates="home_team", foreign_keys="Match.home_team_id"
@@ -107,6 +117,12 @@ class Team(Base):
     def __repr__(self):
         return f"<Team {self.name}>"
 
+    __table_args__ = (
+        Index('ix_team_name', 'name'),
+        Index('ix_team_match_count', match_count.desc()),
+        Index('ix_team_wins', wins.desc()),
+    )
+
 
 class Player(Base):
     """Игрок."""
@@ -117,22 +133,27 @@ class Player(Base):
     last_name: Mapped[str] = mapped_column(String(100))
     first_name: Mapped[str] = mapped_column(String(100))
     patronymic: Mapped[Optional[str]] = mapped_column(String(100))
+    full_name: Mapped[str] = mapped_column(String(310), Computed(FULL_NAME_SQL, persisted=False))
     birth_year: Mapped[Optional[int]] = mapped_column(Integer)
     height: Mapped[Optional[int]] = mapped_column(Integer)
     position: Mapped[Optional[str]] = mapped_column(String(50))
     photo_url: Mapped[Optional[str]] = mapped_column(String(500))
 
+    # Cached counts for the player list, kept up to date by DataService.save_matches
+    mvp_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    match_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+
     # Relationships
     match_appearances: Mapped[List["MatchPlayer"]] = relationship(back_populates="player")
     best_player_awards: Mapped[List["BestPlayer"]] = relationship(back_populates="player")
     roster_entries: Mapped[List["TeamRoster"]] = relationship(back_populates="player")
 
-    @property
-    def full_name(self) -> str:
-        parts = [self.last_name, self.first_name]
-        if self.patronymic:
-            parts.append(self.patronymic)
-        return " ".join(parts)
+    # Descending, so ties keep id order when the list is read straight off the index
+    __table_args__ = (
+        Index('ix_player_mvp_count', mvp_count.desc()),
+        Index('ix_player_match_count', match_count.desc()),
+        Index('ix_player_last_name', 'last_name'),
+    )
 
     def __repr__(self):
         return f"<Player {self.full_name}>"
@@ -147,20 +168,23 @@ class Referee(Base):
     last_name: Mapped[str] = mapped_column(String(100))
     first_name: Mapped[str] = mapped_column(String(100))
     patronymic: Mapped[Optional[str]] = mapped_column(String(100))
+    full_name: Mapped[str] = mapped_column(String(310), Computed(FULL_NAME_SQL, persisted=False))
+
+    # Cached stats for the referee list, kept up to date by DataService.save_matches
+    match_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    avg_rating: Mapped[Optional[float]] = mapped_column(Float)  # over home and away ratings
 
     # Relationships
     matches: Mapped[List["Match"]] = relationship(back_populates="referee")
 
-    @property
-    def full_name(self) -> str:
-        parts = [self.last_name, self.first_name]
-        if self.patronymic:
-            parts.append(self.patronymic)
-        return " ".join(parts)
-
     def __repr__(self):
         return f"<Referee {self.full_name}>"
 
+    __table_args__ = (
+        Index('ix_referee_match_count', match_count.desc()),
+        Index('ix_referee_name', 'last_name', 'first_name'),  # player-is-referee lookup
+    )
+
 
 class Match(Base):
     """Матч."""
@@ -198,7 +222,7 @@ class Match(Base):
 
     # Метаданные
     parsed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    raw_html: Mapped[Optional[str]] = mapped_column(Text)  # Для отладки
+    raw_html: Mapped[Optional[str]] = mapped_column(Text, deferred=True)  # Для отладки; не грузится со списками
 
     # Relationships
     home_team: Mapped[Optional["Team"]] = relationship(
@@ -212,6 +236,14 @@ class Match(Base):
     players: Mapped[List["MatchPlayer"]] = relationship(back_populates="match")
     best_players: Mapped[List["BestPlayer"]] = relationship(back_populates="match")
 
+    # Listing sorts by date; team and referee pages filter by these ids, newest first
+    __table_args__ = (
+        Index('ix_match_date_time', 'date_time'),
+        Index('ix_match_home_team_date', 'home_team_id', 'date_time'),
+        Index('ix_match_away_team_date', 'away_team_id', 'date_time'),
+        Index('ix_match_referee_date', 'referee_id', 'date_time'),
+    )
+
     def __repr__(self):
         home = self.home_team.name if self.home_team else "?"
         away = self.away_team.name if self.away_team else "?"
@@ -234,6 +266,8 @@ class MatchPlayer(Base):
 
     __table_args__ = (
         UniqueConstraint('match_id', 'player_id', name='unique_match_player'),
+        Index('ix_matchplayer_player_id', 'player_id'),
+        Index('ix_matchplayer_team_id', 'team_id'),
     )
 
     def __repr__(self):
@@ -258,6 +292,7 @@ class BestPlayer(Base):
 
     __table_args__ = (
         UniqueConstraint('match_id', 'team_id', name='unique_best_player_per_team'),
+        Index('ix_bestplayer_player_id', 'player_id'),
     )
 
     def __repr__(self):
@@ -337,6 +372,9 @@ class BCTeam(Base):
     name: Mapped[str] = mapped_column(String(200))
     logo_url: Mapped[Optional[str]] = mapped_column(String(500))
     is_women: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Cached aggregates, refreshed by BCDataService when matches are saved
+    match_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    wins: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     division_entries: Mapped[List["BCDivisionTeam"]] = relationship(back_populates="team")
     home_matches: Mapped[List["BCMatch"]] = relationship(
@@ -346,6 +384,12 @@ class BCTeam(Base):
         back_populates="away_team", foreign_keys="BCMatch.away_team_id"
     )
 
+    __table_args__ = (
+        Index('ix_bc_team_name', 'name'),
+        Index('ix_bc_team_match_count', match_count.desc()),
+        Index('ix_bc_team_wins', wins.desc()),
+    )
+
     def __repr__(self):
         return f"<BCTeam {self.name}>"
 
@@ -386,10 +430,27 @@ class BCPlayer(Base):
     weight: Mapped[Optional[int]] = mapped_column(Integer)
     position: Mapped[Optional[str]] = mapped_column(String(50))
     photo_url: Mapped[Optional[str]] = mapped_column(String(500))
+    # Cached totals for the player list, refreshed by BCDataService when matches are saved
+    match_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    total_points: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    total_attacks: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    total_serves: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    total_blocks: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    mvp_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     match_stats: Mapped[List["BCMatchPlayerStats"]] = relationship(back_populates="player")
     best_player_awards: Mapped[List["BCBestPlayer"]] = relationship(back_populates="player")
 
+    __table_args__ = (
+        Index('ix_bc_player_match_count', match_count.desc()),
+        Index('ix_bc_player_total_points', total_points.desc()),
+        Index('ix_bc_player_total_attacks', total_attacks.desc()),
+        Index('ix_bc_player_total_serves', total_serves.desc()),
+        Index('ix_bc_player_total_blocks', total_blocks.desc()),
+        Index('ix_bc_player_mvp_count', mvp_count.desc()),
+        Index('ix_bc_player_last_name', 'last_name'),
+    )
+
     @property
     def full_name(self) -> str:
         return f"{self.last_name} {self.first_name}"
@@ -456,6 +517,12 @@ class BCMatch(Base):
     best_players: Mapped[List["BCBestPlayer"]] = relationship(back_populates="match")
     referees: Mapped[List["BCMatchReferee"]] = relationship(back_populates="match")
 
+    __table_args__ = (
+        Index('ix_bc_match_date_time', 'date_time'),
+        Index('ix_bc_match_home_team_date', 'home_team_id', 'date_time'),
+        Index('ix_bc_match_away_team_date', 'away_team_id', 'date_time'),
+    )
+
     def __repr__(self):
         return f"<BCMatch {self.site_id}>"
 
@@ -481,6 +548,7 @@ class BCMatchPlayerStats(Base):
 
     __table_args__ = (
         UniqueConstraint('match_id', 'player_id', name='unique_bc_match_player'),
+        Index('ix_bc_stats_player_match', 'player_id', 'match_id'),
     )
 
     def __repr__(self):
@@ -506,6 +574,10 @@ class BCBestPlayer(Base):
     player: Mapped[Optional["BCPlayer"]] = relationship(back_populates="best_player_awards")
     team: Mapped[Optional["BCTeam"]] = relationship()
 
+    __table_args__ = (
+        Index('ix_bc_bestplayer_player_id', 'player_id'),
+    )
+
     def __repr__(self):
         return f"<BCBestPlayer match={self.match_id}>"
 
@@ -523,6 +595,7 @@ class BCMatchReferee(Base):
 
     __table_args__ = (
         UniqueConstraint('match_id', 'referee_id', name='unique_bc_match_referee'),
+        Index('ix_bc_match_referee_referee_id', 'referee_id'),
     )
 
     def __repr__(self):
@@ -1,4 +1,4 @@
 from .base_parser import BaseParser
-from .match_parser import MatchParser
+from .match_parser import MatchParser, MatchFetchError
 from .team_parser import TeamParser
 from .roster_parser import RosterParser
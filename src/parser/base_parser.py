@@ -2,8 +2,12 @@
 
 import time
 import logging
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional
+from urllib.parse import urlparse, parse_qs
 from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
@@ -14,44 +18,74 @@ class BaseParser:
 
     BASE_URL = "https://volleymsk.ru"
     RATE_LIMIT = 0.05  # seconds between requests (50ms)
+    POOL_SIZE = 32  # kept-alive connections per session (covers the fetch pools)
 
-    def __init__(self, rate_limit: float = None):
+    def __init__(self, rate_limit: float = None, session: requests.Session = None):
         self.rate_limit = rate_limit or self.RATE_LIMIT
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Parsers of one site can share a session to reuse its pooled connections
+        self.session = session or self.create_session()
+        self._last_request_time = 0
+        self._rate_lock = threading.Lock()
+
+    @classmethod
+    def create_session(cls) -> requests.Session:
+        """Create an HTTP session with browser headers and a keep-alive pool."""
+        session = requests.Session()
+        session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
                           "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "ru-RU,ru;q=0.9,en;q=0.8",
         })
-        self._last_request_time = 0
+        adapter = HTTPAdapter(
+            pool_connections=cls.POOL_SIZE,
+            pool_maxsize=cls.POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def _wait_rate_limit(self):
-        """Wait to respect rate limiting."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
+        """Wait to respect rate limiting (safe to call from several threads)."""
+        with self._rate_lock:
+            elapsed = time.time() - self._last_request_time
+            if elapsed < self.rate_limit:
+                time.sleep(self.rate_limit - elapsed)
+            self._last_request_time = time.time()
 
-    def fetch_page(self, url: str, timeout: int = 30) -> Optional[BeautifulSoup]:
-        """Fetch a page and return BeautifulSoup object."""
+    def fetch_content(self, url: str, timeout: int = 30) -> Optional[bytes]:
+        """Fetch a page and return its raw body, or None on an error or empty response."""
         self._wait_rate_limit()
 
         try:
             response = self.session.get(url, timeout=timeout)
-            self._last_request_time = time.time()
 
             response.raise_for_status()
 
-            # Site uses windows-1251 encoding
-            response.encoding = 'windows-1251'
-
-            soup = BeautifulSoup(response.text, 'lxml')
-            return soup
-
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
 
+        if not response.content:
+            logger.warning(f"Empty response from {url}")
+            return None
+        return response.content
+
+    @staticmethod
+    def make_soup(content: bytes) -> BeautifulSoup:
+        """Parse a fetched page body."""
+        # Site uses windows-1251 encoding. lxml decodes the raw bytes in C,
+        # instead of requests decoding them to str first
+        return BeautifulSoup(content, 'lxml', from_encoding='windows-1251')
+
+    def fetch_page(self, url: str, timeout: int = 30) -> Optional[BeautifulSoup]:
+        """Fetch a page and return BeautifulSoup object."""
+        content = self.fetch_content(url, timeout)
+        if content is None:
+            return None
+        return self.make_soup(content)
+
     def get_match_url(self, match_id: int) -> str:
         """Get URL for a match page."""
         return f"{self.BASE_URL}/ap/match.php?match_id={match_id}"
@@ -104,7 +138,6 @@ class BaseParser:
         if not url:
             return None
 
-        from urllib.parse import urlparse, parse_qs
         parsed = urlparse(url)
         params = parse_qs(parsed.query)
 
@@ -10,20 +10,57 @@ from .base_parser import BaseParser
 
 logger = logging.getLogger(__name__)
 
+TOURNAMENT_LINK_RE = re.compile(r'trntable\.php')
+TEAM_LINK_RE = re.compile(r'team\.php\?id=\d+')
+DATE_TIME_RE = re.compile(r'(\d{2}\.\d{2}\.\d{4}),?\s*(\d{2}:\d{2})')  # "26.01.2026, 20:00"
+SCORE_RE = re.compile(r'(\d+)\s*-\s*(\d+)')  # "1 - 3"
+SET_SCORES_RE = re.compile(r'\(([^)]+)\)')  # "(19:25, 19:25, 25:19, 21:25)"
+SCORE_PREFIX_RE = re.compile(r'^\d+\s*-\s*\d+')
+RATING_AWAY_RE = re.compile(r'Гости[:\s]*(\d+)\s*([^Х\d]*)')
+RATING_HOME_RE = re.compile(r'Хозяева[:\s]*(\d+)\s*(.*)$')
+TITLE_RE = re.compile(r':::\s*(.+?)\s*-\s*(.+?),\s*(\d{2}\.\d{2}\.\d{4}),\s*(\d{2}:\d{2})\s*:::')
+PLAYER_PHOTO_RE = re.compile(r'/uploads/player/t/(\d+)')
+# "Матч не найден" / "Страница не найдена" in the page's windows-1251 bytes,
+# first letter dropped so either case matches
+NOT_FOUND_MARKERS = tuple(
+    phrase.encode('windows-1251') for phrase in ("атч не найден", "траница не найдена")
+)
+
+
+def _parse_date_time(date_str: str, time_str: str) -> datetime:
+    """Build a datetime from "26.01.2026" and "20:00" (the regexes guarantee the shape).
+
+    Raises ValueError for out-of-range values, like strptime.
+    """
+    day, month, year = date_str.split('.')
+    hour, minute = time_str.split(':')
+    return datetime(int(year), int(month), int(day), int(hour), int(minute))
+
+
+class MatchFetchError(Exception):
+    """Raised when a match page could not be fetched, as opposed to a missing match."""
+
 
 class MatchParser(BaseParser):
     """Parser for match pages (match.php)."""
 
+    def __init__(self, *args, keep_raw_html: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Re-serializing the soup costs about a third of a page's parse time
+        # and nothing stores it, so it is only kept for debugging
+        self.keep_raw_html = keep_raw_html
+
     def parse_match(self, match_id: int) -> Optional[Dict[str, Any]]:
-        """Parse a match page and return structured data."""
+        """Parse a match page and return structured data.
+
+        The page markup is included as "raw_html" only with keep_raw_html.
+        Returns None if the match does not exist; raises MatchFetchError if
+        the page could not be fetched.
+        """
         url = self.get_match_url(match_id)
-        soup = self.fetch_page(url)
+        soup = self._fetch_match_page(url)
 
         if soup is None:
-            return None
-
-        # Check if match exists
-        if self._is_match_not_found(soup):
             logger.debug(f"Match {match_id} not found")
             return None
 
@@ -31,11 +68,14 @@ class MatchParser(BaseParser):
             data = {
                 "site_id": match_id,
                 "url": url,
-                "raw_html": str(soup),
             }
+            if self.keep_raw_html:
+                data["raw_html"] = str(soup)
 
-            # Find the main match info table (gray background table)
-            main_table = self._find_main_table(soup)
+            # Gray background tables hold the match info and the rosters;
+            # both are picked from this one document scan
+            tables = soup.find_all('table', bgcolor="#CCCCCC")
+            main_table = self._find_main_table(tables)
 
             if main_table:
                 # Parse all data from the main table
@@ -48,7 +88,7 @@ class MatchParser(BaseParser):
                 data.update({k: v for k, v in header_data.items() if not data.get(k)})
 
             # Parse team rosters from separate tables
-            rosters = self._parse_rosters(soup, data.get("home_team"), data.get("away_team"))
+            rosters = self._parse_rosters(tables, main_table, data.get("home_team"), data.get("away_team"))
             data["home_roster"] = rosters.get("home", [])
             data["away_roster"] = rosters.get("away", [])
 
@@ -63,15 +103,31 @@ class MatchParser(BaseParser):
             traceback.print_exc()
             return None
 
+    def _fetch_match_page(self, url: str) -> Optional[BeautifulSoup]:
+        """Fetch and parse a match page; None if the match does not exist.
+
+        Not-found pages are mostly recognized from the raw bytes, before parsing.
+        Raises MatchFetchError if the page could not be fetched.
+        """
+        content = self.fetch_content(url)
+        if content is None:
+            raise MatchFetchError(f"could not fetch {url}")
+        if any(marker in content for marker in NOT_FOUND_MARKERS):
+            return None
+        soup = self.make_soup(content)
+        if self._is_match_not_found(soup):
+            return None
+        return soup
+
     def _is_match_not_found(self, soup: BeautifulSoup) -> bool:
         """Check if the match page indicates match not found."""
         text = soup.get_text().lower()
         return "матч не найден" in text or "страница не найдена" in text
 
-    def _find_main_table(self, soup: BeautifulSoup) -> Optional[Tag]:
-        """Find the main table with match info (gray background table)."""
-        # Look for table with bgcolor="#CCCCCC" which contains match results
-        for table in soup.find_all('table', bgcolor="#CCCCCC"):
+    def _find_main_table(self, tables: List[Tag]) -> Optional[Tag]:
+        """Find the main table with match info among the gray background tables."""
+        # The table with bgcolor="#CCCCCC" which contains match results
+        for table in tables:
             text = table.get_text()
             if 'Результат матча' in text:
                 return table
@@ -107,17 +163,15 @@ class MatchParser(BaseParser):
             second_cell_text = self.clean_text(cells[1].get_text()) if len(cells) > 1 else ""
 
             # Tournament path (first row with link to trntable.php)
-            link = row.find('a', href=re.compile(r'trntable\.php'))
+            link = row.find('a', href=TOURNAMENT_LINK_RE)
             if link and '>' in link.get_text():
                 data["tournament_path"] = self.clean_text(link.get_text())
 
             # Date/time row (format: "26.01.2026, 20:00")
-            date_match = re.search(r'(\d{2}\.\d{2}\.\d{4}),?\s*(\d{2}:\d{2})', first_cell_text)
+            date_match = DATE_TIME_RE.search(first_cell_text)
             if date_match:
                 try:
-                    data["date_time"] = datetime.strptime(
-                        f"{date_match.group(1)} {date_match.group(2)}", "%d.%m.%Y %H:%M"
-                    )
+                    data["date_time"] = _parse_date_time(date_match.group(1), date_match.group(2))
                 except ValueError:
                     pass
 
@@ -127,7 +181,7 @@ class MatchParser(BaseParser):
                 continue
 
             # Teams and score row
-            team_links = row.find_all('a', href=re.compile(r'team\.php\?id=\d+'))
+            team_links = row.find_all('a', href=TEAM_LINK_RE)
             if len(team_links) >= 2:
                 # Home team
                 home_id = self.extract_id_from_url(team_links[0]['href'], 'id')
@@ -143,13 +197,13 @@ class MatchParser(BaseParser):
                 if len(cells) > 1:
                     score_text = cells[1].get_text()
                     # Main score pattern: "1 - 3"
-                    score_match = re.search(r'(\d+)\s*-\s*(\d+)', score_text)
+                    score_match = SCORE_RE.search(score_text)
                     if score_match:
                         data["home_score"] = int(score_match.group(1))
                         data["away_score"] = int(score_match.group(2))
 
                     # Set scores pattern: "(19:25, 19:25, 25:19, 21:25)"
-                    sets_match = re.search(r'\(([^)]+)\)', score_text)
+                    sets_match = SET_SCORES_RE.search(score_text)
                     if sets_match:
                         data["set_scores"] = sets_match.group(1)
 
@@ -163,13 +217,13 @@ class MatchParser(BaseParser):
                 rating_text = second_cell_text
 
                 # Parse "Гости: 4 отличное, идеальное судейство"
-                guests_match = re.search(r'Гости[:\s]*(\d+)\s*([^Х\d]*)', rating_text)
+                guests_match = RATING_AWAY_RE.search(rating_text)
                 if guests_match:
                     data["referee_rating_away"] = int(guests_match.group(1))
                     data["referee_rating_away_text"] = self.clean_text(guests_match.group(2))
 
                 # Parse "Хозяева: 4 отличное, идеальное судейство"
-                hosts_match = re.search(r'Хозяева[:\s]*(\d+)\s*(.*)$', rating_text)
+                hosts_match = RATING_HOME_RE.search(rating_text)
                 if hosts_match:
                     data["referee_rating_home"] = int(hosts_match.group(1))
                     data["referee_rating_home_text"] = self.clean_text(hosts_match.group(2))
@@ -181,7 +235,7 @@ class MatchParser(BaseParser):
 
             # Best player row (team name in first cell, player name in second)
             # Skip if second_cell contains score pattern or is empty
-            if second_cell_text and not re.match(r'^\d+\s*-\s*\d+', second_cell_text) and 'Лучшие' not in second_cell_text:
+            if second_cell_text and not SCORE_PREFIX_RE.match(second_cell_text) and 'Лучшие' not in second_cell_text:
                 if data.get("home_team") and data["home_team"]["name"] == first_cell_text:
                     data["best_players"].append({
                         "team": data["home_team"].copy(),
@@ -204,26 +258,22 @@ class MatchParser(BaseParser):
         }
 
         # Look for title or header with ::: markers
-        title_pattern = re.compile(r':::\s*(.+?)\s*-\s*(.+?),\s*(\d{2}\.\d{2}\.\d{4}),\s*(\d{2}:\d{2})\s*:::')
-
-        for text_node in soup.find_all(string=title_pattern):
-            match = title_pattern.search(text_node)
+        for text_node in soup.find_all(string=TITLE_RE):
+            match = TITLE_RE.search(text_node)
             if match:
                 home_name, away_name, date_str, time_str = match.groups()
                 data["home_team"] = {"name": self.clean_text(home_name)}
                 data["away_team"] = {"name": self.clean_text(away_name)}
 
                 try:
-                    data["date_time"] = datetime.strptime(
-                        f"{date_str} {time_str}", "%d.%m.%Y %H:%M"
-                    )
+                    data["date_time"] = _parse_date_time(date_str, time_str)
                 except ValueError:
                     pass
                 break
 
         # Extract team IDs from links if not found
         if data["home_team"] and not data["home_team"].get("site_id"):
-            for link in soup.find_all('a', href=re.compile(r'team\.php\?id=\d+')):
+            for link in soup.find_all('a', href=TEAM_LINK_RE):
                 team_id = self.extract_id_from_url(link['href'], 'id')
                 team_name = self.clean_text(link.get_text())
 
@@ -235,8 +285,9 @@ class MatchParser(BaseParser):
 
         return data
 
-    def _parse_rosters(self, soup: BeautifulSoup, home_team: dict, away_team: dict) -> Dict[str, List]:
-        """Parse team rosters from the match page."""
+    def _parse_rosters(self, tables: List[Tag], main_table: Optional[Tag],
+                       home_team: dict, away_team: dict) -> Dict[str, List]:
+        """Parse team rosters from the match page's gray background tables."""
         rosters = {"home": [], "away": []}
 
         if not home_team or not away_team:
@@ -245,14 +296,10 @@ class MatchParser(BaseParser):
         home_name = home_team.get("name", "")
         away_name = away_team.get("name", "")
 
-        # Find the roster table (second table with bgcolor="#CCCCCC", after main results table)
-        tables = soup.find_all('table', bgcolor="#CCCCCC")
-
+        # The roster table is the gray table after the main results table
         for table in tables:
-            text = table.get_text()
-
             # Skip the main info table
-            if 'Результат матча' in text:
+            if table is main_table:
                 continue
 
             # This should be the roster table - it has two columns with team names
@@ -311,7 +358,7 @@ class MatchParser(BaseParser):
                     photo_url = None
                     if img and img.get('src'):
                         src = img['src']
-                        id_match = re.search(r'/uploads/player/t/(\d+)', src)
+                        id_match = PLAYER_PHOTO_RE.search(src)
                         if id_match:
                             player_id = int(id_match.group(1))
                             # Build full photo URL
@@ -342,27 +389,29 @@ class MatchParser(BaseParser):
                 return "unknown"
         return "unknown"
 
+    def _probe_match(self, match_id: int) -> bool:
+        """Whether a match page exists; a fetch that fails twice counts as a miss."""
+        url = self.get_match_url(match_id)
+        for attempt in range(2):
+            try:
+                return self._fetch_match_page(url) is not None
+            except MatchFetchError as e:
+                logger.warning(f"Probing match {match_id} failed (attempt {attempt + 1}): {e}")
+        return False
+
     def find_max_match_id(self, start_from: int = 50000, step: int = 1000) -> int:
         """Find approximate maximum match_id by binary search."""
         logger.info("Searching for maximum match_id...")
 
         upper = start_from
-        while True:
-            url = self.get_match_url(upper)
-            soup = self.fetch_page(url)
-            if soup and not self._is_match_not_found(soup):
-                upper += step
-            else:
-                break
+        while self._probe_match(upper):
+            upper += step
 
         lower = max(1, upper - step)
 
         while lower < upper - 1:
             mid = (lower + upper) // 2
-            url = self.get_match_url(mid)
-            soup = self.fetch_page(url)
-
-            if soup and not self._is_match_not_found(soup):
+            if self._probe_match(mid):
                 lower = mid
             else:
                 upper = mid
@@ -3,8 +3,12 @@
 import re
 import time
 import logging
+import threading
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from functools import lru_cache
+from typing import Dict, Optional
 from datetime import datetime
 from bs4 import BeautifulSoup
 
@@ -16,37 +20,88 @@ RUSSIAN_MONTHS = {
     'сентября': 9, 'октября': 10, 'ноября': 11, 'декабря': 12,
 }
 
+SEASON_NUM_RE = re.compile(r'/season-(\d+)')
+DATE_TIME_RE = re.compile(r'(\d{2})\.(\d{2})\.(\d{4})\s*(?:\([^)]*\))?\s*-?\s*(\d{2}):(\d{2})')
+DATE_RE = re.compile(r'(\d{2})\.(\d{2})\.(\d{4})')
+TEXT_DATE_TIME_RE = re.compile(r'(\d{1,2})\s+(\w+)\s+(\d{4})\s+года\s+\w+,?\s*(\d{2}):(\d{2})')
+TEXT_DATE_RE = re.compile(r'(\d{1,2})\s+(\w+)\s+(\d{4})')
+
+# Returned by conditional fetches when the page hasn't changed
+NOT_MODIFIED = object()
+
+
+@lru_cache(maxsize=None)
+def _entity_id_re(entity: str) -> re.Pattern:
+    return re.compile(rf'/{entity}/(\d+)')
+
 
 class BCBaseParser:
     """Base class for Business Champions League parsers."""
 
     BASE_URL = "https://volleyball.businesschampions.ru"
     RATE_LIMIT = 0.1  # 100ms between requests
+    POOL_SIZE = 32  # kept-alive connections per session (covers the fetch pools)
 
-    def __init__(self, rate_limit: float = None):
+    def __init__(self, rate_limit: float = None, session: requests.Session = None):
         self.rate_limit = rate_limit or self.RATE_LIMIT
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Parsers of one site can share a session to reuse its pooled connections
+        self.session = session or self.create_session()
+        self._last_request_time = 0
+        self._rate_lock = threading.Lock()
+
+    @classmethod
+    def create_session(cls) -> requests.Session:
+        """Create an HTTP session with browser headers and a keep-alive pool."""
+        session = requests.Session()
+        session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
                           "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "ru-RU,ru;q=0.9,en;q=0.8",
         })
-        self._last_request_time = 0
+        adapter = HTTPAdapter(
+            pool_connections=cls.POOL_SIZE,
+            pool_maxsize=cls.POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def _wait_rate_limit(self):
-        """Wait to respect rate limiting."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
+        """Wait to respect rate limiting (safe to call from several threads)."""
+        with self._rate_lock:
+            elapsed = time.time() - self._last_request_time
+            if elapsed < self.rate_limit:
+                time.sleep(self.rate_limit - elapsed)
+            self._last_request_time = time.time()
+
+    def fetch_page(self, url: str, timeout: int = 30,
+                   validators: Optional[Dict[str, str]] = None) -> Optional[BeautifulSoup]:
+        """Fetch a page and return BeautifulSoup object. UTF-8 encoding.
 
-    def fetch_page(self, url: str, timeout: int = 30) -> Optional[BeautifulSoup]:
-        """Fetch a page and return BeautifulSoup object. UTF-8 encoding."""
+        If validators is given, the request is conditional on its "etag" and
+        "last_modified" from an earlier response: NOT_MODIFIED is returned on
+        304, and validators is updated in place from a full response.
+        """
         self._wait_rate_limit()
+        headers = {}
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
         try:
-            response = self.session.get(url, timeout=timeout)
-            self._last_request_time = time.time()
+            response = self.session.get(url, timeout=timeout, headers=headers)
+            if response.status_code == 304:
+                return NOT_MODIFIED
             response.raise_for_status()
+            if validators is not None:
+                validators.clear()
+                if response.headers.get("ETag"):
+                    validators["etag"] = response.headers["ETag"]
+                if response.headers.get("Last-Modified"):
+                    validators["last_modified"] = response.headers["Last-Modified"]
             response.encoding = 'utf-8'
             return BeautifulSoup(response.text, 'lxml')
         except requests.exceptions.RequestException as e:
@@ -83,7 +138,7 @@ class BCBaseParser:
         """Extract entity ID from path-based URL like /season-30/players/7561."""
         if not url:
             return None
-        match = re.search(rf'/{entity}/(\d+)', url)
+        match = _entity_id_re(entity).search(url)
         return int(match.group(1)) if match else None
 
     @staticmethod
@@ -91,7 +146,7 @@ class BCBaseParser:
         """Extract season number from URL."""
         if not url:
             return None
-        match = re.search(r'/season-(\d+)', url)
+        match = SEASON_NUM_RE.search(url)
         return int(match.group(1)) if match else None
 
     @staticmethod
@@ -116,7 +171,7 @@ class BCBaseParser:
         date_str = date_str.strip()
 
         # Format: "11.10.2025 (Сб) - 10:00"
-        m = re.match(r'(\d{2})\.(\d{2})\.(\d{4})\s*(?:\([^)]*\))?\s*-?\s*(\d{2}):(\d{2})', date_str)
+        m = DATE_TIME_RE.match(date_str)
         if m:
             try:
                 return datetime(int(m.group(3)), int(m.group(2)), int(m.group(1)),
@@ -125,7 +180,7 @@ class BCBaseParser:
                 pass
 
         # Format: "11.10.2025"
-        m = re.match(r'(\d{2})\.(\d{2})\.(\d{4})', date_str)
+        m = DATE_RE.match(date_str)
         if m:
             try:
                 return datetime(int(m.group(3)), int(m.group(2)), int(m.group(1)))
@@ -133,7 +188,7 @@ class BCBaseParser:
                 pass
 
         # Format: "26 Октября 2025 года Вс, 11:00 мск"
-        m = re.match(r'(\d{1,2})\s+(\w+)\s+(\d{4})\s+года\s+\w+,?\s*(\d{2}):(\d{2})', date_str)
+        m = TEXT_DATE_TIME_RE.match(date_str)
         if m:
             month = RUSSIAN_MONTHS.get(m.group(2).lower())
             if month:
@@ -144,7 +199,7 @@ class BCBaseParser:
                     pass
 
         # Format: "26 Октября 2025 года"
-        m = re.match(r'(\d{1,2})\s+(\w+)\s+(\d{4})', date_str)
+        m = TEXT_DATE_RE.match(date_str)
         if m:
             month = RUSSIAN_MONTHS.get(m.group(2).lower())
             if month:
@@ -7,6 +7,8 @@ from .base_parser import BCBaseParser
 
 logger = logging.getLogger(__name__)
 
+DATE_TEXT_RE = re.compile(r'\d{4}\s+года|\d{2}:\d{2}\s*мск')
+
 
 class BCMatchParser(BCBaseParser):
     """Parser for /season-N/matches/{ID} pages."""
@@ -103,7 +105,7 @@ class BCMatchParser(BCBaseParser):
         # Date/time from text-center div (after the bold div)
         for div in soup.find_all('div', class_='text-center'):
             text = self.clean_text(div.get_text())
-            if re.search(r'\d{4}\s+года', text) or re.search(r'\d{2}:\d{2}\s*мск', text):
+            if DATE_TEXT_RE.search(text):
                 result["date_time"] = self.parse_bc_date(text)
                 break
 
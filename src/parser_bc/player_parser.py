@@ -7,6 +7,8 @@ from .base_parser import BCBaseParser
 
 logger = logging.getLogger(__name__)
 
+NUMBER_RE = re.compile(r'\d+')
+
 
 class BCPlayerParser(BCBaseParser):
     """Parser for /season-N/players/{ID} pages."""
@@ -69,12 +71,12 @@ class BCPlayerParser(BCBaseParser):
                     result["position"] = val
                 elif 'рост' in key:
                     try:
-                        result["height"] = int(re.search(r'\d+', val).group())
+                        result["height"] = int(NUMBER_RE.search(val).group())
                     except (AttributeError, ValueError):
                         pass
                 elif 'вес' in key:
                     try:
-                        result["weight"] = int(re.search(r'\d+', val).group())
+                        result["weight"] = int(NUMBER_RE.search(val).group())
                     except (AttributeError, ValueError):
                         pass
                 elif 'дата рожд' in key or 'рожден' in key:
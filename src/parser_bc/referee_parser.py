@@ -7,6 +7,8 @@ from .base_parser import BCBaseParser
 
 logger = logging.getLogger(__name__)
 
+GAMES_COUNT_RE = re.compile(r'Игр:\s*(\d+)')
+
 
 class BCRefereeParser(BCBaseParser):
     """Parser for /season-N/referees and /season-N/referees/{ID} pages."""
@@ -50,7 +52,7 @@ class BCRefereeParser(BCBaseParser):
             match_count = None
             if parent:
                 text = parent.get_text()
-                m = re.search(r'Игр:\s*(\d+)', text)
+                m = GAMES_COUNT_RE.search(text)
                 if m:
                     match_count = int(m.group(1))
 
@@ -3,27 +3,35 @@
 import re
 import logging
 from typing import Optional, List, Dict
-from .base_parser import BCBaseParser
+from .base_parser import BCBaseParser, NOT_MODIFIED
 
 logger = logging.getLogger(__name__)
 
+SCORE_RE = re.compile(r'(\d+)\s*[-:]\s*(\d+)')
+
 
 class BCScheduleParser(BCBaseParser):
     """Parser for /season-N/championship/schedule and /season-N/cup/schedule."""
 
-    def parse_schedule(self, season_num: int, tournament_type: str = "championship") -> List[Dict]:
+    def parse_schedule(self, season_num: int, tournament_type: str = "championship",
+                       validators: Optional[Dict[str, str]] = None) -> Optional[List[Dict]]:
         """Parse schedule page and return list of match stubs.
 
         Args:
             season_num: Season number (1-30)
             tournament_type: "championship" or "cup"
+            validators: ETag/Last-Modified of an earlier fetch for a conditional
+                request (see fetch_page); updated in place
 
         Returns:
             List of match dicts with: site_id, date_str, venue, division_name,
-            round_name, home_team, away_team, home_score, away_score
+            round_name, home_team, away_team, home_score, away_score.
+            None if validators were given and the page hasn't changed.
         """
         url = self.get_schedule_url(season_num, tournament_type)
-        soup = self.fetch_page(url)
+        soup = self.fetch_page(url, validators=validators)
+        if soup is NOT_MODIFIED:
+            return None
         if not soup:
             return []
 
@@ -136,7 +144,7 @@ class BCScheduleParser(BCBaseParser):
             result["site_id"] = match_id
 
             score_text = self.clean_text(score_link.get_text())
-            score_match = re.match(r'(\d+)\s*[-:]\s*(\d+)', score_text)
+            score_match = SCORE_RE.match(score_text)
             if score_match:
                 result["home_score"] = int(score_match.group(1))
                 result["away_score"] = int(score_match.group(2))
@@ -1,8 +1,10 @@
 """Service for saving BC parsed data to database."""
 
 import logging
-from typing import Dict, Any, Optional, List
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Set, Iterable
 from datetime import datetime
+from sqlalchemy import select, insert, update, exists, bindparam, func, union
 from sqlalchemy.orm import Session
 
 from src.database.models import (
@@ -12,12 +14,58 @@ from src.database.models import (
 
 logger = logging.getLogger(__name__)
 
+# site_id is unique but not the primary key, so session.get() can't be used;
+# these statements are built once and reused from the compiled cache.
+_MATCH_BY_SITE_ID = select(BCMatch).where(BCMatch.site_id == bindparam("site_id")).limit(1)
+_MATCH_EXISTS = select(exists().where(BCMatch.site_id == bindparam("site_id")))
+
+
+@dataclass(slots=True)
+class MatchStub:
+    """Schedule data for a match, used to fill gaps in the parsed detail page."""
+    site_id: int
+    tournament_type: Optional[str] = None
+    division_name: Optional[str] = None
+    round_name: Optional[str] = None
+    venue: Optional[str] = None
+
+    @classmethod
+    def from_schedule(cls, m: Dict) -> "MatchStub":
+        return cls(
+            site_id=m["site_id"],
+            tournament_type=m.get("tournament_type"),
+            division_name=m.get("division_name"),
+            round_name=m.get("round_name"),
+            venue=m.get("venue"),
+        )
+
+    def fill(self, match_data: Dict):
+        """Preserve schedule data where the detail page has none."""
+        match_data.setdefault("tournament_type", self.tournament_type)
+        match_data.setdefault("division_name", self.division_name)
+        match_data.setdefault("round_name", self.round_name)
+        match_data.setdefault("venue", self.venue)
+
 
 class BCDataService:
     """Service for saving and retrieving BC volleyball data."""
 
     def __init__(self, session: Session):
         self.session = session
+        # site_id -> object loaded by this service; teams and referees recur on
+        # nearly every match of a season, so most lookups skip SQL
+        self._matches: Dict[int, BCMatch] = {}
+        self._teams: Dict[int, BCTeam] = {}
+        self._referees: Dict[int, BCReferee] = {}
+
+    def _get_match(self, site_id: int) -> Optional[BCMatch]:
+        """Find a match by site_id, skipping SQL for matches this service already saw."""
+        match = self._matches.get(site_id)
+        if match is None:
+            match = self.session.scalars(_MATCH_BY_SITE_ID, {"site_id": site_id}).first()
+            if match is not None:
+                self._matches[site_id] = match
+        return match
 
     def get_or_create_season(self, number: int, name: str = "") -> BCSeason:
         season = self.session.query(BCSeason).filter_by(number=number).first()
@@ -40,7 +88,9 @@ class BCDataService:
         return division
 
     def get_or_create_team(self, site_id: int, name: str = None, **kwargs) -> BCTeam:
-        team = self.session.query(BCTeam).filter_by(site_id=site_id).first()
+        team = self._teams.get(site_id)
+        if team is None:
+            team = self.session.query(BCTeam).filter_by(site_id=site_id).first()
         if not team:
             team = BCTeam(
                 site_id=site_id,
@@ -57,6 +107,7 @@ class BCDataService:
                 team.logo_url = kwargs["logo_url"]
             if kwargs.get("is_women") is not None:
                 team.is_women = kwargs["is_women"]
+        self._teams[site_id] = team
         return team
 
     def get_or_create_player(self, site_id: int, **kwargs) -> BCPlayer:
@@ -106,7 +157,9 @@ class BCDataService:
         return player
 
     def get_or_create_referee(self, site_id: int, **kwargs) -> BCReferee:
-        referee = self.session.query(BCReferee).filter_by(site_id=site_id).first()
+        referee = self._referees.get(site_id)
+        if referee is None:
+            referee = self.session.query(BCReferee).filter_by(site_id=site_id).first()
         if not referee:
             referee = BCReferee(
                 site_id=site_id,
@@ -119,6 +172,7 @@ class BCDataService:
         else:
             if kwargs.get("photo_url") and not referee.photo_url:
                 referee.photo_url = kwargs["photo_url"]
+        self._referees[site_id] = referee
         return referee
 
     def save_division_team(self, division_id: int, team_id: int,
@@ -149,7 +203,7 @@ class BCDataService:
                 dt.points = points
 
     def match_exists(self, site_id: int) -> bool:
-        return self.session.query(BCMatch).filter_by(site_id=site_id).count() > 0
+        return site_id in self._matches or self.session.scalar(_MATCH_EXISTS, {"site_id": site_id})
 
     def save_match(self, match_data: Dict[str, Any], season_id: int) -> Optional[BCMatch]:
         """Save full match data."""
@@ -157,12 +211,15 @@ class BCDataService:
         if not site_id:
             return None
 
-        match = self.session.query(BCMatch).filter_by(site_id=site_id).first()
+        match = self._get_match(site_id)
         if not match:
             match = BCMatch(site_id=site_id, season_id=season_id)
             self.session.add(match)
+            self._matches[site_id] = match
         else:
             match.season_id = season_id
+        # Teams the match counted for before this save, which may change below
+        changed_teams = {match.home_team_id, match.away_team_id}
 
         match.date_time = match_data.get("date_time")
         match.venue = match_data.get("venue")
@@ -193,20 +250,33 @@ class BCDataService:
             match.away_team_id = away_team.id
 
         self.session.flush()
+        changed_teams.update((match.home_team_id, match.away_team_id))
+        changed_teams.discard(None)
+        self.refresh_team_counts(changed_teams)
+
+        # Players with stats or awards in the match before this save
+        changed_players = set(self.session.execute(union(
+            select(BCMatchPlayerStats.player_id).where(BCMatchPlayerStats.match_id == match.id),
+            select(BCBestPlayer.player_id).where(BCBestPlayer.match_id == match.id),
+        )).scalars())
 
         # Player stats
-        self._save_player_stats(match, match_data)
+        changed_players |= self._save_player_stats(match, match_data)
 
         # Best players
-        self._save_best_players(match, match_data)
+        changed_players |= self._save_best_players(match, match_data)
+
+        self.session.flush()
+        changed_players.discard(None)
+        self.refresh_player_stats(changed_players)
 
         # Referees
         self._save_referees(match, match_data)
 
         return match
 
-    def _save_player_stats(self, match: BCMatch, match_data: Dict):
-        """Save per-player match statistics."""
+    def _save_player_stats(self, match: BCMatch, match_data: Dict) -> Set[int]:
+        """Save per-player match statistics. Returns the ids of the players saved."""
         # Clear existing
         self.session.query(BCMatchPlayerStats).filter_by(match_id=match.id).delete()
 
@@ -251,11 +321,13 @@ class BCDataService:
                     blocks=ps.get("blocks"),
                 )
                 self.session.add(mps)
+        return added
 
-    def _save_best_players(self, match: BCMatch, match_data: Dict):
-        """Save best players."""
+    def _save_best_players(self, match: BCMatch, match_data: Dict) -> Set[int]:
+        """Save best players. Returns the ids of the players saved."""
         self.session.query(BCBestPlayer).filter_by(match_id=match.id).delete()
 
+        added = set()
         for bp_data in match_data.get("best_players", []):
             player_id = None
             team_id = None
@@ -273,6 +345,7 @@ class BCDataService:
                     first_name=parsed["first_name"],
                 )
                 player_id = player.id
+                added.add(player_id)
 
             bp = BCBestPlayer(
                 match_id=match.id,
@@ -285,6 +358,7 @@ class BCDataService:
                 blocks=bp_data.get("blocks"),
             )
             self.session.add(bp)
+        return added
 
     def _save_referees(self, match: BCMatch, match_data: Dict):
         """Save match referees (many-to-many)."""
@@ -307,7 +381,7 @@ class BCDataService:
         if not site_id:
             return None
 
-        match = self.session.query(BCMatch).filter_by(site_id=site_id).first()
+        match = self._get_match(site_id)
         if match:
             return match  # Already exists, don't overwrite with basic data
 
@@ -338,8 +412,96 @@ class BCDataService:
 
         self.session.add(match)
         self.session.flush()
+        self._matches[site_id] = match
+        self.refresh_team_counts({match.home_team_id, match.away_team_id} - {None})
         return match
 
+    def save_schedule_matches(self, matches: List[Dict], season_id: int) -> Set[int]:
+        """Insert schedule rows of matches not stored yet in one statement.
+
+        Like save_schedule_match, stored matches are left as they are and the
+        first row wins for a site_id listed twice. Returns the inserted site_ids.
+        """
+        site_ids = {m["site_id"] for m in matches if m.get("site_id")}
+        if not site_ids:
+            return set()
+        stored = set(self.session.execute(
+            select(BCMatch.site_id).where(BCMatch.site_id.in_(site_ids))
+        ).scalars())
+
+        rows = {}
+        for m in matches:
+            site_id = m.get("site_id")
+            if not site_id or site_id in stored or site_id in rows:
+                continue
+            row = {
+                "site_id": site_id,
+                "season_id": season_id,
+                "date_time": m.get("date_time"),
+                "venue": m.get("venue"),
+                "division_name": m.get("division_name"),
+                "round_name": m.get("round_name"),
+                "tournament_type": m.get("tournament_type"),
+                "home_score": m.get("home_score"),
+                "away_score": m.get("away_score"),
+                "status": m.get("status", "unknown"),
+                "home_team_id": None,
+                "away_team_id": None,
+            }
+            for side in ("home", "away"):
+                team = m.get(f"{side}_team")
+                if team and team.get("site_id"):
+                    row[f"{side}_team_id"] = self.get_or_create_team(team["site_id"], team.get("name")).id
+            rows[site_id] = row
+
+        if rows:
+            self.session.execute(insert(BCMatch), list(rows.values()))
+            self.refresh_team_counts(
+                {row[f"{side}_team_id"] for row in rows.values() for side in ("home", "away")} - {None}
+            )
+        return set(rows)
+
+    def refresh_player_stats(self, player_ids: Optional[Iterable[int]] = None):
+        """Recompute the cached BCPlayer match totals and mvp_count (all players if ids is None)."""
+        own = BCMatchPlayerStats.player_id == BCPlayer.id
+
+        def total(column):
+            return select(func.coalesce(func.sum(column), 0)).where(own).scalar_subquery()
+
+        stmt = update(BCPlayer).values(
+            match_count=select(func.count(BCMatchPlayerStats.id)).where(own).scalar_subquery(),
+            total_points=total(BCMatchPlayerStats.points),
+            total_attacks=total(BCMatchPlayerStats.attacks),
+            total_serves=total(BCMatchPlayerStats.serves),
+            total_blocks=total(BCMatchPlayerStats.blocks),
+            mvp_count=select(func.count(BCBestPlayer.id)).where(
+                BCBestPlayer.player_id == BCPlayer.id
+            ).scalar_subquery(),
+        )
+        if player_ids is not None:
+            player_ids = set(player_ids)
+            if not player_ids:
+                return
+            stmt = stmt.where(BCPlayer.id.in_(player_ids))
+        self.session.execute(stmt)
+
+    def refresh_team_counts(self, team_ids: Optional[Iterable[int]] = None):
+        """Recompute the cached BCTeam.match_count / wins (all teams if ids is None)."""
+        def count(*criteria):
+            return select(func.count(BCMatch.id)).where(*criteria).scalar_subquery()
+
+        stmt = update(BCTeam).values(
+            match_count=count(BCMatch.home_team_id == BCTeam.id) + count(BCMatch.away_team_id == BCTeam.id),
+            wins=count(BCMatch.home_team_id == BCTeam.id, BCMatch.home_score > BCMatch.away_score)
+            + count(BCMatch.away_team_id == BCTeam.id, BCMatch.away_score > BCMatch.home_score),
+        )
+        if team_ids is not None:
+            team_ids = set(team_ids)
+            if not team_ids:
+                return
+            stmt = stmt.where(BCTeam.id.in_(team_ids))
+        self.session.execute(stmt)
+
     def get_stats(self) -> Dict[str, int]:
         """Get BC database statistics."""
         return {
@@ -352,15 +514,50 @@ class BCDataService:
 
     def get_season_match_ids(self, season_id: int) -> List[int]:
         """Get all match site_ids for a season."""
-        matches = self.session.query(BCMatch.site_id).filter_by(season_id=season_id).all()
-        return [m[0] for m in matches]
+        return self.session.execute(
+            select(BCMatch.site_id).where(BCMatch.season_id == season_id)
+        ).scalars().all()
+
+    def get_season_match_stubs(self, season_id: int) -> List[MatchStub]:
+        """Get schedule data for all matches of a season."""
+        rows = self.session.execute(
+            select(
+                BCMatch.site_id, BCMatch.tournament_type, BCMatch.division_name,
+                BCMatch.round_name, BCMatch.venue,
+            ).where(BCMatch.season_id == season_id)
+        ).all()
+        return [MatchStub(**r._mapping) for r in rows]
+
+    def get_match_ids_with_stats(self, site_ids: List[int]) -> Set[int]:
+        """Get site_ids (out of the given ones) of matches that already have player stats."""
+        if not site_ids:
+            return set()
+        return set(self.session.execute(
+            select(BCMatch.site_id).distinct().join(
+                BCMatchPlayerStats, BCMatchPlayerStats.match_id == BCMatch.id
+            ).where(BCMatch.site_id.in_(site_ids))
+        ).scalars())
+
+    def get_unparsed_match_stubs(self, season_id: int) -> List[MatchStub]:
+        """Get schedule data of a season's matches whose detail page was never saved.
+
+        save_match sets parsed_at, so these are the schedule rows whose parse
+        failed or was cut short.
+        """
+        rows = self.session.execute(
+            select(BCMatch.site_id, BCMatch.tournament_type, BCMatch.division_name,
+                   BCMatch.round_name, BCMatch.venue)
+            .where(BCMatch.season_id == season_id, BCMatch.parsed_at.is_(None))
+            .order_by(BCMatch.site_id)
+        )
+        return [MatchStub(*row) for row in rows]
 
     def get_season_player_ids(self, season_id: int) -> List[int]:
         """Get unique player site_ids from match stats for a season."""
-        from sqlalchemy import distinct
-        results = self.session.query(distinct(BCPlayer.site_id)).join(
-            BCMatchPlayerStats, BCMatchPlayerStats.player_id == BCPlayer.id
-        ).join(
-            BCMatch, BCMatch.id == BCMatchPlayerStats.match_id
-        ).filter(BCMatch.season_id == season_id).all()
-        return [r[0] for r in results]
+        return self.session.execute(
+            select(BCPlayer.site_id).distinct().join(
+                BCMatchPlayerStats, BCMatchPlayerStats.player_id == BCPlayer.id
+            ).join(
+                BCMatch, BCMatch.id == BCMatchPlayerStats.match_id
+            ).where(BCMatch.season_id == season_id)
+        ).scalars().all()
@@ -2,29 +2,30 @@
 
 import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Iterator, Tuple
 
 from src.database.db import Database
 from src.parser_bc import (
     BCSeasonParser, BCScheduleParser, BCMatchParser,
     BCTeamParser, BCPlayerParser, BCRefereeParser
 )
-from src.database.models import BCMatch, BCMatchPlayerStats
-from src.services.bc_data_service import BCDataService
+from src.services.bc_data_service import BCDataService, MatchStub
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
 class StepProgress:
     """Progress for a single parsing step."""
-
-    def __init__(self, name: str):
-        self.name = name
-        self.status = "pending"  # pending, running, completed, failed, skipped
-        self.total = 0
-        self.done = 0
-        self.errors = 0
+    name: str
+    status: str = "pending"  # pending, running, completed, failed, skipped
+    total: int = 0
+    done: int = 0
+    errors: int = 0
+    failed_ids: List[int] = field(default_factory=list)  # summarized in the log at step end
 
     def to_dict(self) -> Dict:
         return {
@@ -38,16 +39,19 @@ class StepProgress:
 class BCParsingService:
     """Service for managing BC parsing jobs with per-step progress bars."""
 
-    STEPS = ["schedule", "teams", "matches", "players", "referees"]
+    STEPS = ("schedule", "teams", "matches", "players", "referees")
+    # Pages fetched concurrently for the job thread
+    FETCH_WORKERS = 3
 
     def __init__(self, db: Database):
         self.db = db
-        self.season_parser = BCSeasonParser()
-        self.schedule_parser = BCScheduleParser()
-        self.match_parser = BCMatchParser()
-        self.team_parser = BCTeamParser()
-        self.player_parser = BCPlayerParser()
-        self.referee_parser = BCRefereeParser()
+        http = BCSeasonParser.create_session()  # one connection pool for the site
+        self.season_parser = BCSeasonParser(session=http)
+        self.schedule_parser = BCScheduleParser(session=http)
+        self.match_parser = BCMatchParser(session=http)
+        self.team_parser = BCTeamParser(session=http)
+        self.player_parser = BCPlayerParser(session=http)
+        self.referee_parser = BCRefereeParser(session=http)
 
         self._status = "idle"  # idle, running, paused, stopped, completed
         self._season_num = 0
@@ -55,9 +59,15 @@ class BCParsingService:
         self._mode = ""  # full, schedule, matches, players, referees, all-seasons
         self._steps: Dict[str, StepProgress] = {}
         self._last_error = ""
+        self.data_version = 0  # bumped as steps and jobs end, for readers' caches
 
         self._stop_flag = threading.Event()
         self._pause_flag = threading.Event()
+        # Jobs run on a daemon thread so a running or paused job never holds up
+        # interpreter exit; the pool only serves its short page fetches
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.FETCH_WORKERS, thread_name_prefix="bc-fetch"
+        )
         self._current_thread: Optional[threading.Thread] = None
 
         # For all-seasons mode
@@ -104,37 +114,37 @@ class BCParsingService:
         """Parse entire season: schedule → teams → matches → players → referees."""
         if self.is_running:
             raise RuntimeError("Parsing already in progress")
-        self._launch_thread(self._full_season_worker, season_num, skip_existing)
+        self._launch_job(self._full_season_worker, season_num, skip_existing)
 
     def start_all_seasons(self, start: int, end: int, skip_existing: bool = True):
         """Parse multiple seasons sequentially."""
         if self.is_running:
             raise RuntimeError("Parsing already in progress")
-        self._launch_thread(self._all_seasons_worker, start, end, skip_existing)
+        self._launch_job(self._all_seasons_worker, start, end, skip_existing)
 
     def start_schedule(self, season_num: int):
         """Parse only schedule for a season."""
         if self.is_running:
             raise RuntimeError("Parsing already in progress")
-        self._launch_thread(self._schedule_only_worker, season_num)
+        self._launch_job(self._schedule_only_worker, season_num)
 
     def start_matches(self, season_num: int, skip_existing: bool = True):
         """Parse only match details for a season."""
         if self.is_running:
             raise RuntimeError("Parsing already in progress")
-        self._launch_thread(self._matches_only_worker, season_num, skip_existing)
+        self._launch_job(self._matches_only_worker, season_num, skip_existing)
 
     def start_players(self, season_num: int):
         """Parse only player details for a season."""
         if self.is_running:
             raise RuntimeError("Parsing already in progress")
-        self._launch_thread(self._players_only_worker, season_num)
+        self._launch_job(self._players_only_worker, season_num)
 
     def start_referees(self, season_num: int):
         """Parse only referees for a season."""
         if self.is_running:
             raise RuntimeError("Parsing already in progress")
-        self._launch_thread(self._referees_only_worker, season_num)
+        self._launch_job(self._referees_only_worker, season_num)
 
     def pause(self):
         if self._status == "running":
@@ -156,16 +166,43 @@ class BCParsingService:
 
     # ---- Internal methods ----
 
-    def _launch_thread(self, target, *args):
+    def _launch_job(self, target, *args):
         self._stop_flag.clear()
         self._pause_flag.clear()
         self._reset_steps()
         self._status = "running"
         self._last_error = ""
 
-        self._current_thread = threading.Thread(target=target, args=args, daemon=True)
+        self._current_thread = threading.Thread(
+            target=self._run_job, args=(target, *args), daemon=True
+        )
         self._current_thread.start()
 
+    def _run_job(self, target, *args):
+        try:
+            target(*args)
+        finally:
+            # Stopped or failed jobs have committed their saves too
+            self.data_version += 1
+
+    def _fetch_concurrently(self, fetch: Callable, items: List) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+        """Run fetch(item) on the executor, FETCH_WORKERS items at a time.
+
+        Yields (item, result, error) in input order. Pause/stop are checked
+        between batches; on stop the generator simply ends.
+        """
+        for i in range(0, len(items), self.FETCH_WORKERS):
+            self._check_pause()
+            if self._check_stop():
+                return
+            batch = items[i:i + self.FETCH_WORKERS]
+            futures = [self._executor.submit(fetch, item) for item in batch]
+            for item, future in zip(batch, futures):
+                try:
+                    yield item, future.result(), None
+                except Exception as e:
+                    yield item, None, e
+
     def _full_season_worker(self, season_num: int, skip_existing: bool):
         """Worker: full season parse."""
         self._season_num = season_num
@@ -214,6 +251,7 @@ class BCParsingService:
         self._all_seasons_total = end - start + 1
         logger.info(f"Starting parse for seasons {start}-{end}")
 
+        prefetched = None
         try:
             for season_num in range(start, end + 1):
                 if self._check_stop():
@@ -226,7 +264,8 @@ class BCParsingService:
 
                 logger.info(f"Parsing season {season_num}/{end}")
 
-                match_stubs = self._do_schedule(season_num)
+                match_stubs = self._do_schedule(season_num, prefetched)
+                prefetched = None
                 if self._check_stop():
                     self._status = "stopped"
                     return
@@ -246,6 +285,10 @@ class BCParsingService:
                     self._status = "stopped"
                     return
 
+                # Next season's schedule pages download while referees are saved
+                if season_num < end:
+                    prefetched = self._submit_schedule_fetches(season_num + 1)
+
                 self._do_referees(season_num)
                 if self._check_stop():
                     self._status = "stopped"
@@ -256,6 +299,12 @@ class BCParsingService:
             self._status = "failed"
             self._last_error = str(e)
             logger.error(f"All seasons parse failed: {e}", exc_info=True)
+        finally:
+            if prefetched:
+                season_future, schedule_futures = prefetched
+                season_future.cancel()
+                for _, future in schedule_futures:
+                    future.cancel()
 
     def _schedule_only_worker(self, season_num: int):
         self._season_num = season_num
@@ -274,13 +323,12 @@ class BCParsingService:
         self._season_num = season_num
         self._mode = "matches"
         try:
-            # Get match IDs from DB
+            # Get match stubs (with schedule data) from DB
             with self.db.session() as session:
                 svc = BCDataService(session)
                 season = svc.get_or_create_season(season_num)
-                match_ids = svc.get_season_match_ids(season.id)
+                match_stubs = svc.get_season_match_stubs(season.id)
 
-            match_stubs = [{"site_id": mid} for mid in match_ids]
             self._steps["schedule"].status = "skipped"
             self._steps["teams"].status = "skipped"
             self._do_matches(season_num, match_stubs, skip_existing)
@@ -323,10 +371,39 @@ class BCParsingService:
             self._status = "failed"
             self._last_error = str(e)
 
+    def _record_failure(self, step: StepProgress, kind: str, site_id: int, error: Exception):
+        """Count a per-item failure. Only the first one in a step logs a traceback."""
+        step.errors += 1
+        step.failed_ids.append(site_id)
+        self._last_error = f"{kind} {site_id}: {error}"
+        logger.error(f"{kind} {site_id} parse error: {error}",
+                     exc_info=error if step.errors == 1 else None)
+
+    def _log_failures(self, step: StepProgress):
+        """Log one summary line for all items that failed in a step."""
+        if step.failed_ids:
+            logger.error(f"{step.name}: {len(step.failed_ids)} items failed: "
+                         f"{', '.join(map(str, step.failed_ids))}")
+
     # ---- Step implementations ----
 
-    def _do_schedule(self, season_num: int) -> List[Dict]:
-        """Parse schedule (championship + cup) and save to DB."""
+    def _submit_schedule_fetches(self, season_num: int) -> Tuple[Future, List[Tuple[str, Future]]]:
+        """Start fetching the season page and both schedules on the executor."""
+        season_future = self._executor.submit(self.season_parser.parse_season, season_num)
+        schedule_futures = [
+            (tournament_type, self._executor.submit(
+                self.schedule_parser.parse_schedule, season_num, tournament_type
+            ))
+            for tournament_type in ("championship", "cup")
+        ]
+        return season_future, schedule_futures
+
+    def _do_schedule(self, season_num: int,
+                     prefetched: Optional[Tuple[Future, List[Tuple[str, Future]]]] = None) -> List[MatchStub]:
+        """Parse schedule (championship + cup) and save to DB.
+
+        prefetched: fetches already started by _submit_schedule_fetches.
+        """
         step = self._steps["schedule"]
         step.status = "running"
         step.total = 2  # championship + cup
@@ -334,38 +411,32 @@ class BCParsingService:
 
         all_matches = []
         try:
+            self._check_pause()
+            if self._check_stop():
+                return []
+
+            # Season name and both schedules are independent pages: fetch them together
+            season_future, schedule_futures = prefetched or self._submit_schedule_fetches(season_num)
+
             with self.db.session() as session:
                 svc = BCDataService(session)
                 season = svc.get_or_create_season(season_num)
 
-                # Parse season name
-                season_data = self.season_parser.parse_season(season_num)
+                season_data = season_future.result()
                 if season_data and season_data.get("name"):
                     season.name = season_data["name"]
 
-                # Championship schedule
-                self._check_pause()
-                if self._check_stop():
-                    return []
-                championship = self.schedule_parser.parse_schedule(season_num, "championship")
-                for m in championship:
-                    m["tournament_type"] = "championship"
-                    svc.save_schedule_match(m, season.id)
-                all_matches.extend(championship)
-                step.done = 1
-
-                # Cup schedule
-                self._check_pause()
-                if self._check_stop():
-                    return all_matches
-                cup = self.schedule_parser.parse_schedule(season_num, "cup")
-                for m in cup:
-                    m["tournament_type"] = "cup"
-                    svc.save_schedule_match(m, season.id)
-                all_matches.extend(cup)
-                step.done = 2
+                for tournament_type, future in schedule_futures:
+                    schedule = future.result()
+                    for m in schedule:
+                        m["tournament_type"] = tournament_type
+                        if m.get("site_id"):
+                            all_matches.append(MatchStub.from_schedule(m))
+                    svc.save_schedule_matches(schedule, season.id)
+                    step.done += 1
 
             step.status = "completed"
+            self.data_version += 1
             logger.info(f"Schedule: {len(all_matches)} matches for season {season_num}")
         except Exception as e:
             step.status = "failed"
@@ -402,6 +473,7 @@ class BCParsingService:
 
             step.done = 1
             step.status = "completed"
+            self.data_version += 1
             logger.info(f"Teams: {len(teams)} for season {season_num}")
         except Exception as e:
             step.status = "failed"
@@ -409,56 +481,52 @@ class BCParsingService:
             self._last_error = f"Teams: {e}"
             logger.error(f"Teams parse error: {e}", exc_info=True)
 
-    def _do_matches(self, season_num: int, match_stubs: List[Dict], skip_existing: bool):
+    def _do_matches(self, season_num: int, match_stubs: List[MatchStub], skip_existing: bool):
         """Parse match detail pages."""
         step = self._steps["matches"]
         step.status = "running"
         step.total = len(match_stubs)
         self._current_step = "matches"
 
+        with self.db.session() as session:
+            svc = BCDataService(session)
+            season_id = svc.get_or_create_season(season_num).id
+            parsed_ids = set()
+            if skip_existing:
+                parsed_ids = svc.get_match_ids_with_stats(
+                    [stub.site_id for stub in match_stubs]
+                )
+
+        todo = []
         for stub in match_stubs:
-            self._check_pause()
-            if self._check_stop():
-                return
-
-            match_site_id = stub.get("site_id")
-            if not match_site_id:
+            if stub.site_id in parsed_ids:
                 step.done += 1
-                continue
-
-            try:
-                with self.db.session() as session:
-                    svc = BCDataService(session)
-                    season = svc.get_or_create_season(season_num)
-
-                    if skip_existing:
-                        existing = session.query(
-                            BCMatchPlayerStats
-                        ).join(BCMatch).filter(
-                            BCMatch.site_id == match_site_id
-                        ).first()
-                        if existing:
-                            step.done += 1
-                            continue
-
-                    match_data = self.match_parser.parse_match(season_num, match_site_id)
-                    if match_data:
-                        # Preserve schedule data
-                        match_data.setdefault("tournament_type", stub.get("tournament_type"))
-                        match_data.setdefault("division_name", stub.get("division_name"))
-                        match_data.setdefault("round_name", stub.get("round_name"))
-                        match_data.setdefault("venue", stub.get("venue"))
-                        svc.save_match(match_data, season.id)
+            else:
+                todo.append(stub)
+
+        fetched = self._fetch_concurrently(
+            lambda stub: self.match_parser.parse_match(season_num, stub.site_id), todo
+        )
+        for stub, match_data, error in fetched:
+            match_site_id = stub.site_id
+            if error is None and match_data:
+                try:
+                    stub.fill(match_data)
+                    with self.db.session() as session:
+                        BCDataService(session).save_match(match_data, season_id)
+                except Exception as e:
+                    error = e
 
-                step.done += 1
-            except Exception as e:
-                step.errors += 1
-                step.done += 1
-                self._last_error = f"Match {match_site_id}: {e}"
-                logger.error(f"Match {match_site_id} parse error: {e}")
+            if error is not None:
+                self._record_failure(step, "Match", match_site_id, error)
+            step.done += 1
 
+        self._log_failures(step)
+        if self._check_stop():
+            return
         if step.status == "running":
             step.status = "completed"
+            self.data_version += 1
 
     def _do_players(self, season_num: int):
         """Parse player detail pages for bio data."""
@@ -475,14 +543,12 @@ class BCParsingService:
 
             step.total = len(player_site_ids)
 
-            for player_site_id in player_site_ids:
-                self._check_pause()
-                if self._check_stop():
-                    return
-
-                try:
-                    player_data = self.player_parser.parse_player(season_num, player_site_id)
-                    if player_data:
+            fetched = self._fetch_concurrently(
+                lambda pid: self.player_parser.parse_player(season_num, pid), player_site_ids
+            )
+            for player_site_id, player_data, error in fetched:
+                if error is None and player_data:
+                    try:
                         with self.db.session() as session:
                             svc = BCDataService(session)
                             svc.get_or_create_player(
@@ -495,15 +561,19 @@ class BCParsingService:
                                 position=player_data.get("position"),
                                 photo_url=player_data.get("photo_url"),
                             )
-                    step.done += 1
-                except Exception as e:
-                    step.errors += 1
-                    step.done += 1
-                    self._last_error = f"Player {player_site_id}: {e}"
-                    logger.error(f"Player {player_site_id} parse error: {e}")
+                    except Exception as e:
+                        error = e
+
+                if error is not None:
+                    self._record_failure(step, "Player", player_site_id, error)
+                step.done += 1
 
+            self._log_failures(step)
+            if self._check_stop():
+                return
             if step.status == "running":
                 step.status = "completed"
+                self.data_version += 1
         except Exception as e:
             step.status = "failed"
             self._last_error = f"Players: {e}"
@@ -535,6 +605,7 @@ class BCParsingService:
 
             step.done = 1
             step.status = "completed"
+            self.data_version += 1
             logger.info(f"Referees: {len(refs)} for season {season_num}")
         except Exception as e:
             step.status = "failed"
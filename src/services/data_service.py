@@ -1,7 +1,10 @@
 """Service for saving parsed data to database."""
 
 import logging
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Iterable, List, Set, Tuple
+from sqlalchemy import select, insert, update, delete, func, exists, tuple_, bindparam
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from src.database.models import (
@@ -11,239 +14,473 @@ from src.database.models import (
 
 logger = logging.getLogger(__name__)
 
+# Player columns filled from parsed data (besides site_id)
+PLAYER_FIELDS = ("last_name", "first_name", "patronymic", "birth_year", "height", "position", "photo_url")
+
+# Hot lookups are built once and reused with bound values; the engine's
+# compiled cache then only ever sees these few statement shapes.
+_MATCH_BY_SITE_ID = select(Match).where(Match.site_id == bindparam("site_id")).limit(1)
+_MATCH_EXISTS = select(exists().where(Match.site_id == bindparam("site_id")))
+
+
+@lru_cache(maxsize=None)
+def _referee_query(by_first_name: bool, by_patronymic: bool):
+    stmt = select(Referee.id).where(Referee.last_name == bindparam("last_name"))
+    if by_first_name:
+        stmt = stmt.where(Referee.first_name == bindparam("first_name"))
+    if by_patronymic:
+        stmt = stmt.where(Referee.patronymic == bindparam("patronymic"))
+    return stmt.limit(1)
+
 
 class DataService:
     """Service for saving and retrieving volleyball data."""
 
     def __init__(self, session: Session):
         self.session = session
+        self._team_cache: Dict[int, Tuple[int, str]] = {}  # site_id -> (id, name)
+
+    def clear_cache(self):
+        """Forget cached ids, e.g. after rolling back rows they may refer to."""
+        self._team_cache.clear()
+
+    def prime_team_cache(self, site_ids: Iterable[int]):
+        """Load ids of already known teams in one query."""
+        missing = [sid for sid in set(site_ids) if sid not in self._team_cache]
+        if not missing:
+            return
+        rows = self.session.execute(
+            select(Team.site_id, Team.id, Team.name).where(Team.site_id.in_(missing))
+        )
+        for site_id, team_id, name in rows:
+            self._team_cache[site_id] = (team_id, name)
+
+    def _upsert_teams(self, teams: Dict[int, Optional[str]]) -> Dict[int, int]:
+        """Create missing teams and rename changed ones. Returns site_id -> id.
+
+        teams maps site_id -> name (None keeps the stored name). At most two
+        statements are issued; teams already cached with the same name cost nothing.
+        """
+        named, unnamed = [], []
+        for site_id, name in teams.items():
+            cached = self._team_cache.get(site_id)
+            if name and (not cached or cached[1] != name):
+                named.append({"site_id": site_id, "name": name})
+            elif not name and not cached:
+                unnamed.append({"site_id": site_id, "name": f"Team {site_id}"})
+
+        for rows, rename in ((named, True), (unnamed, False)):
+            if not rows:
+                continue
+            stmt = sqlite_insert(Team).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Team.site_id],
+                set_={"name": stmt.excluded.name if rename else Team.name},
+            ).returning(Team.site_id, Team.id, Team.name)
+            for site_id, team_id, team_name in self.session.execute(stmt):
+                self._team_cache[site_id] = (team_id, team_name)
+
+        return {site_id: self._team_cache[site_id][0] for site_id in teams}
+
+    def get_or_create_team_id(self, site_id: int, name: str = None) -> int:
+        """Get id of existing team or create new one, renaming it if name changed."""
+        return self._upsert_teams({site_id: name})[site_id]
 
     def get_or_create_team(self, site_id: int, name: str = None) -> Team:
         """Get existing team or create new one."""
-        team = self.session.query(Team).filter_by(site_id=site_id).first()
-        if not team:
-            team = Team(site_id=site_id, name=name or f"Team {site_id}")
-            self.session.add(team)
-            self.session.flush()
-        elif name and team.name != name:
-            team.name = name
-        return team
-
-    def get_or_create_player(self, site_id: int, last_name: str = None,
-                              first_name: str = None, patronymic: str = None,
-                              **kwargs) -> Player:
+        return self.session.get(Team, self.get_or_create_team_id(site_id, name), populate_existing=True)
+
+    def get_or_create_player_id(self, site_id: int, **player_data) -> int:
+        """Get id of existing player or create new one.
+
+        Empty columns of an existing player are filled in the same statement.
+        """
+        return self._upsert_players([{**player_data, "site_id": site_id}])[site_id]
+
+    def get_or_create_player(self, site_id: int, **player_data) -> Player:
         """Get existing player or create new one."""
-        player = self.session.query(Player).filter_by(site_id=site_id).first()
-        if not player:
-            player = Player(
-                site_id=site_id,
-                last_name=last_name or "",
-                first_name=first_name or "",
-                patronymic=patronymic,
-                birth_year=kwargs.get("birth_year"),
-                height=kwargs.get("height"),
-                position=kwargs.get("position"),
-                photo_url=kwargs.get("photo_url"),
-            )
-            self.session.add(player)
-            self.session.flush()
-        else:
-            # Update with new data if available
-            if last_name and not player.last_name:
-                player.last_name = last_name
-            if first_name and not player.first_name:
-                player.first_name = first_name
-            if patronymic and not player.patronymic:
-                player.patronymic = patronymic
-            if kwargs.get("birth_year") and not player.birth_year:
-                player.birth_year = kwargs["birth_year"]
-            if kwargs.get("height") and not player.height:
-                player.height = kwargs["height"]
-            if kwargs.get("position") and not player.position:
-                player.position = kwargs["position"]
-            if kwargs.get("photo_url") and not player.photo_url:
-                player.photo_url = kwargs["photo_url"]
-        return player
+        return self.session.get(Player, self.get_or_create_player_id(site_id, **player_data),
+                                populate_existing=True)
+
+    def get_or_create_referee_id(self, last_name: str, first_name: str = None,
+                                 patronymic: str = None) -> int:
+        """Get id of existing referee or create new one.
+
+        Only given name parts are matched, so a partial name reuses a fuller record.
+        """
+        referee_id = self.session.scalar(
+            _referee_query(bool(first_name), bool(patronymic)),
+            {"last_name": last_name, "first_name": first_name, "patronymic": patronymic},
+        )
+        if referee_id is None:
+            referee_id = self.session.execute(
+                insert(Referee).values(
+                    last_name=last_name, first_name=first_name or "", patronymic=patronymic
+                ).returning(Referee.id)
+            ).scalar_one()
+        return referee_id
 
     def get_or_create_referee(self, last_name: str, first_name: str = None,
                                patronymic: str = None) -> Referee:
         """Get existing referee or create new one."""
-        query = self.session.query(Referee).filter_by(last_name=last_name)
-        if first_name:
-            query = query.filter_by(first_name=first_name)
-        if patronymic:
-            query = query.filter_by(patronymic=patronymic)
-
-        referee = query.first()
-        if not referee:
-            referee = Referee(
-                last_name=last_name,
-                first_name=first_name or "",
-                patronymic=patronymic,
-            )
-            self.session.add(referee)
-            self.session.flush()
-        return referee
+        return self.session.get(Referee, self.get_or_create_referee_id(last_name, first_name, patronymic))
 
     def save_match(self, match_data: Dict[str, Any]) -> Optional[Match]:
         """Save match data to database."""
-        site_id = match_data.get("site_id")
-        if not site_id:
-            logger.error("Match data missing site_id")
+        match_ids = self.save_matches([match_data])
+        if not match_ids:
             return None
-
-        # Check if match already exists
-        match = self.session.query(Match).filter_by(site_id=site_id).first()
-        if match:
-            logger.debug(f"Match {site_id} already exists, updating...")
-        else:
-            match = Match(site_id=site_id)
-            self.session.add(match)
-
-        # Basic info
-        match.date_time = match_data.get("date_time")
-        match.status = match_data.get("status", "unknown")
-        match.tournament_path = match_data.get("tournament_path")
-
-        # Score
-        match.home_score = match_data.get("home_score")
-        match.away_score = match_data.get("away_score")
-        match.set_scores = match_data.get("set_scores")
-
-        # Teams
-        if match_data.get("home_team"):
-            home_team_data = match_data["home_team"]
-            if home_team_data.get("site_id"):
-                home_team = self.get_or_create_team(
-                    home_team_data["site_id"],
-                    home_team_data.get("name")
-                )
-                match.home_team_id = home_team.id
-
-        if match_data.get("away_team"):
-            away_team_data = match_data["away_team"]
-            if away_team_data.get("site_id"):
-                away_team = self.get_or_create_team(
-                    away_team_data["site_id"],
-                    away_team_data.get("name")
-                )
-                match.away_team_id = away_team.id
-
-        # Referee
-        if match_data.get("referee"):
-            ref_data = match_data["referee"]
-            if ref_data.get("last_name"):
-                referee = self.get_or_create_referee(
-                    ref_data["last_name"],
-                    ref_data.get("first_name"),
-                    ref_data.get("patronymic")
+        return self.session.get(Match, next(iter(match_ids.values())), populate_existing=True)
+
+    def save_matches(self, matches: List[Dict[str, Any]]) -> Dict[int, int]:
+        """Save a batch of parsed matches using a few bulk statements.
+
+        Teams, players and matches are upserted in one statement each, and
+        rosters and best players are written for the whole batch at once.
+        If a site_id repeats, only its last entry is saved.
+        Returns site_id -> match id.
+        """
+        batch: Dict[int, Dict[str, Any]] = {}
+        for match_data in matches:
+            if not match_data.get("site_id"):
+                logger.error("Match data missing site_id")
+                continue
+            batch[match_data["site_id"]] = match_data
+        if not batch:
+            return {}
+
+        # Teams (later names win, as with one-by-one saves)
+        teams: Dict[int, Optional[str]] = {}
+        for match_data in batch.values():
+            team_refs = [match_data.get("home_team"), match_data.get("away_team")]
+            team_refs += [bp.get("team") for bp in match_data.get("best_players", [])]
+            for team in team_refs:
+                if team and team.get("site_id"):
+                    teams[team["site_id"]] = team.get("name") or teams.get(team["site_id"])
+        self.prime_team_cache(teams)
+        team_ids = self._upsert_teams(teams)
+
+        referee_ids = self._resolve_referees(
+            self._referee_key(match_data.get("referee") or {}) for match_data in batch.values()
+        )
+
+        # Teams and referees losing a match to a re-parse need their counts refreshed too
+        changed_teams, changed_referees = set(), set()
+        for home_id, away_id, referee_id in self.session.execute(
+            select(Match.home_team_id, Match.away_team_id, Match.referee_id)
+            .where(Match.site_id.in_(list(batch)))
+        ):
+            changed_teams.update((home_id, away_id))
+            changed_referees.add(referee_id)
+
+        # Matches
+        rows = []
+        for site_id, match_data in batch.items():
+            home = match_data.get("home_team") or {}
+            away = match_data.get("away_team") or {}
+            rows.append({
+                "site_id": site_id,
+                "date_time": match_data.get("date_time"),
+                "status": match_data.get("status", "unknown"),
+                "tournament_path": match_data.get("tournament_path"),
+                "home_score": match_data.get("home_score"),
+                "away_score": match_data.get("away_score"),
+                "set_scores": match_data.get("set_scores"),
+                "home_team_id": team_ids.get(home.get("site_id")),
+                "away_team_id": team_ids.get(away.get("site_id")),
+                "referee_id": referee_ids.get(self._referee_key(match_data.get("referee") or {})),
+                "referee_rating_home": match_data.get("referee_rating_home"),
+                "referee_rating_away": match_data.get("referee_rating_away"),
+                "referee_rating_home_text": match_data.get("referee_rating_home_text"),
+                "referee_rating_away_text": match_data.get("referee_rating_away_text"),
+            })
+        stmt = sqlite_insert(Match).values(rows)
+        set_ = {col: getattr(stmt.excluded, col) for col in rows[0] if col != "site_id"}
+        # Team and referee links are only replaced when the page had them
+        for col in ("home_team_id", "away_team_id", "referee_id"):
+            set_[col] = func.coalesce(getattr(stmt.excluded, col), getattr(Match, col))
+        stmt = stmt.on_conflict_do_update(index_elements=[Match.site_id], set_=set_).returning(
+            Match.site_id, Match.id, Match.home_team_id, Match.away_team_id, Match.referee_id
+        )
+        saved = {}
+        for site_id, match_id, home_id, away_id, referee_id in self.session.execute(stmt):
+            saved[site_id] = (match_id, home_id, away_id)
+            changed_referees.add(referee_id)
+
+        # Players: all roster entries and best players with a site_id in one upsert
+        players = []
+        for site_id, match_data in batch.items():
+            _, home_id, away_id = saved[site_id]
+            if home_id:
+                players += match_data.get("home_roster") or []
+            if away_id:
+                players += match_data.get("away_roster") or []
+            players += [bp["player"] for bp in match_data.get("best_players", [])
+                        if bp.get("player") and (bp.get("team") or {}).get("site_id")]
+        player_ids = self._upsert_players([p for p in players if p.get("site_id")])
+
+        changed = self._save_match_players(batch, saved, player_ids)
+        changed |= self._save_best_players(batch, saved, team_ids, player_ids)
+        self.refresh_player_counts(changed)
+        for _, home_id, away_id in saved.values():
+            changed_teams.update((home_id, away_id))
+        changed_teams.discard(None)
+        self.refresh_team_counts(changed_teams)
+        changed_referees.discard(None)
+        self.refresh_referee_stats(changed_referees)
+
+        return {site_id: match_id for site_id, (match_id, _, _) in saved.items()}
+
+    def refresh_player_counts(self, player_ids: Optional[Iterable[int]] = None):
+        """Recompute the cached Player.mvp_count / match_count (all players if ids is None)."""
+        stmt = update(Player).values(
+            mvp_count=select(func.count(BestPlayer.id))
+            .where(BestPlayer.player_id == Player.id).scalar_subquery(),
+            match_count=select(func.count(MatchPlayer.id))
+            .where(MatchPlayer.player_id == Player.id).scalar_subquery(),
+        )
+        if player_ids is not None:
+            player_ids = set(player_ids)
+            if not player_ids:
+                return
+            stmt = stmt.where(Player.id.in_(player_ids))
+        self.session.execute(stmt)
+
+    def refresh_team_counts(self, team_ids: Optional[Iterable[int]] = None):
+        """Recompute the cached Team.match_count / wins (all teams if ids is None)."""
+        def count(*criteria):
+            return select(func.count(Match.id)).where(*criteria).scalar_subquery()
+
+        stmt = update(Team).values(
+            match_count=count(Match.home_team_id == Team.id) + count(Match.away_team_id == Team.id),
+            wins=count(Match.home_team_id == Team.id, Match.home_score > Match.away_score)
+            + count(Match.away_team_id == Team.id, Match.away_score > Match.home_score),
+        )
+        if team_ids is not None:
+            team_ids = set(team_ids)
+            if not team_ids:
+                return
+            stmt = stmt.where(Team.id.in_(team_ids))
+        self.session.execute(stmt)
+
+    def refresh_referee_stats(self, referee_ids: Optional[Iterable[int]] = None):
+        """Recompute the cached Referee.match_count / avg_rating (all referees if ids is None)."""
+        own = Match.referee_id == Referee.id
+        ratings = (func.coalesce(func.sum(Match.referee_rating_home), 0)
+                   + func.coalesce(func.sum(Match.referee_rating_away), 0))
+        rated = func.count(Match.referee_rating_home) + func.count(Match.referee_rating_away)
+        stmt = update(Referee).values(
+            match_count=select(func.count(Match.id)).where(own).scalar_subquery(),
+            avg_rating=select(ratings * 1.0 / func.nullif(rated, 0)).where(own).scalar_subquery(),
+        )
+        if referee_ids is not None:
+            referee_ids = set(referee_ids)
+            if not referee_ids:
+                return
+            stmt = stmt.where(Referee.id.in_(referee_ids))
+        self.session.execute(stmt)
+
+    def _resolve_referees(self, keys: Iterable[Optional[Tuple]]) -> Dict[Tuple, int]:
+        """Map referee name keys of a batch to ids, loading candidates in one query.
+
+        Referees have no site_id and are matched by (partial) name like in
+        get_or_create_referee_id; a new one joins the candidates right away so
+        later keys in the batch can match it.
+        """
+        keys = list(dict.fromkeys(key for key in keys if key))
+        if not keys:
+            return {}
+        candidates: Dict[str, List[Tuple[int, str, Optional[str]]]] = {}
+        for referee_id, last_name, first_name, patronymic in self.session.execute(
+            select(Referee.id, Referee.last_name, Referee.first_name, Referee.patronymic)
+            .where(Referee.last_name.in_({key[0] for key in keys}))
+            .order_by(Referee.id)
+        ):
+            candidates.setdefault(last_name, []).append((referee_id, first_name, patronymic))
+
+        referee_ids = {}
+        for last_name, first_name, patronymic in keys:
+            referee_id = next((
+                rid for rid, first, patr in candidates.get(last_name, [])
+                if (not first_name or first == first_name) and (not patronymic or patr == patronymic)
+            ), None)
+            if referee_id is None:
+                referee_id = self.get_or_create_referee_id(last_name, first_name, patronymic)
+                candidates.setdefault(last_name, []).append((referee_id, first_name or "", patronymic))
+            referee_ids[(last_name, first_name, patronymic)] = referee_id
+        return referee_ids
+
+    @staticmethod
+    def _referee_key(ref_data: Dict[str, Any]) -> Optional[Tuple]:
+        if not ref_data.get("last_name"):
+            return None
+        return ref_data["last_name"], ref_data.get("first_name"), ref_data.get("patronymic")
+
+    def _upsert_players(self, players: List[Dict[str, Any]]) -> Dict[int, int]:
+        """Insert or fill in players in one statement. Returns site_id -> id.
+
+        Existing players only get their empty columns filled (COALESCE/NULLIF).
+        """
+        rows: Dict[int, Dict[str, Any]] = {}
+        for p in players:
+            row = rows.setdefault(p["site_id"], {"site_id": p["site_id"]})
+            for field in PLAYER_FIELDS:
+                if p.get(field) and not row.get(field):
+                    row[field] = p[field]
+        if not rows:
+            return {}
+        values = [
+            {**{field: None for field in PLAYER_FIELDS}, "last_name": "", "first_name": "", **row}
+            for row in rows.values()
+        ]
+
+        stmt = sqlite_insert(Player).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Player.site_id],
+            set_={
+                field: func.coalesce(
+                    func.nullif(getattr(Player, field), 0 if field in ("birth_year", "height") else ""),
+                    getattr(stmt.excluded, field),
                 )
-                match.referee_id = referee.id
-
-        match.referee_rating_home = match_data.get("referee_rating_home")
-        match.referee_rating_away = match_data.get("referee_rating_away")
-        match.referee_rating_home_text = match_data.get("referee_rating_home_text")
-        match.referee_rating_away_text = match_data.get("referee_rating_away_text")
-
-        self.session.flush()
-
-        # Save players in rosters
-        self._save_match_players(match, match_data)
-
-        # Save best players
-        self._save_best_players(match, match_data)
-
-        return match
-
-    def _save_match_players(self, match: Match, match_data: Dict[str, Any]):
-        """Save match roster (players who played)."""
-        # Clear existing roster
-        self.session.query(MatchPlayer).filter_by(match_id=match.id).delete()
-
-        # Track added players to avoid duplicates
-        added_player_ids = set()
-
-        # Home team players
-        if match.home_team_id and match_data.get("home_roster"):
-            for player_data in match_data["home_roster"]:
-                if player_data.get("site_id"):
-                    player = self.get_or_create_player(**player_data)
-                    if player.id not in added_player_ids:
-                        mp = MatchPlayer(
-                            match_id=match.id,
-                            player_id=player.id,
-                            team_id=match.home_team_id
-                        )
-                        self.session.add(mp)
-                        added_player_ids.add(player.id)
-
-        # Away team players
-        if match.away_team_id and match_data.get("away_roster"):
-            for player_data in match_data["away_roster"]:
-                if player_data.get("site_id"):
-                    player = self.get_or_create_player(**player_data)
-                    if player.id not in added_player_ids:
-                        mp = MatchPlayer(
-                            match_id=match.id,
-                            player_id=player.id,
-                            team_id=match.away_team_id
-                        )
-                        self.session.add(mp)
-                        added_player_ids.add(player.id)
-
-    def _save_best_players(self, match: Match, match_data: Dict[str, Any]):
-        """Save best players of the match."""
+                for field in PLAYER_FIELDS
+            },
+        ).returning(Player.site_id, Player.id)
+        return {site_id: player_id for site_id, player_id in self.session.execute(stmt)}
+
+    def _save_match_players(self, batch: Dict[int, Dict[str, Any]],
+                            saved: Dict[int, Tuple[int, Optional[int], Optional[int]]],
+                            player_ids: Dict[int, int]) -> Set[int]:
+        """Save match rosters (players who played).
+
+        Only rows that differ from the stored rosters are deleted or inserted.
+        Returns the ids of players whose appearances changed.
+        """
+        # match_id -> {player_id: team_id}; the first team a player appears in wins
+        incoming: Dict[int, Dict[int, int]] = {}
+        for site_id, match_data in batch.items():
+            match_id, home_id, away_id = saved[site_id]
+            roster = incoming[match_id] = {}
+            for team_id, key in ((home_id, "home_roster"), (away_id, "away_roster")):
+                if not team_id:
+                    continue
+                for player_data in match_data.get(key) or []:
+                    player_id = player_ids.get(player_data.get("site_id"))
+                    if player_id:
+                        roster.setdefault(player_id, team_id)
+
+        existing: Dict[int, Dict[int, int]] = {match_id: {} for match_id in incoming}
+        for match_id, player_id, team_id in self.session.execute(
+            select(MatchPlayer.match_id, MatchPlayer.player_id, MatchPlayer.team_id)
+            .where(MatchPlayer.match_id.in_(incoming))
+        ):
+            existing[match_id][player_id] = team_id
+
+        # A player who moved to the other team is removed and added again
+        to_delete, to_add = [], []
+        for match_id, roster in incoming.items():
+            stored = existing[match_id]
+            to_delete += [(match_id, pid) for pid, tid in stored.items() if roster.get(pid) != tid]
+            to_add += [{"match_id": match_id, "player_id": pid, "team_id": tid}
+                       for pid, tid in roster.items() if stored.get(pid) != tid]
+
+        if to_delete:
+            self.session.execute(delete(MatchPlayer).where(
+                tuple_(MatchPlayer.match_id, MatchPlayer.player_id).in_(to_delete)
+            ))
+        if to_add:
+            self.session.execute(insert(MatchPlayer), to_add)
+        return {pid for _, pid in to_delete} | {row["player_id"] for row in to_add}
+
+    def _save_best_players(self, batch: Dict[int, Dict[str, Any]],
+                           saved: Dict[int, Tuple[int, Optional[int], Optional[int]]],
+                           team_ids: Dict[int, int], player_ids: Dict[int, int]) -> Set[int]:
+        """Save best players of the matches.
+
+        Returns the ids of players who lost or gained an award.
+        """
+        match_ids = [match_id for match_id, _, _ in saved.values()]
         # Clear existing
-        self.session.query(BestPlayer).filter_by(match_id=match.id).delete()
+        changed = set(self.session.scalars(
+            delete(BestPlayer).where(BestPlayer.match_id.in_(match_ids)).returning(BestPlayer.player_id)
+        ))
+
+        roster_ids = self._find_roster_players_by_name(batch, saved)
 
-        for bp_data in match_data.get("best_players", []):
-            if bp_data.get("player") and bp_data.get("team"):
+        rows = []
+        for site_id, match_data in batch.items():
+            match_id = saved[site_id][0]
+            for bp_data in match_data.get("best_players", []):
+                if not (bp_data.get("player") and bp_data.get("team")):
+                    continue
                 player_info = bp_data["player"]
                 team_info = bp_data["team"]
 
                 if not team_info.get("site_id"):
                     continue
 
-                team = self.get_or_create_team(team_info["site_id"], team_info.get("name"))
+                team_id = team_ids[team_info["site_id"]]
                 player_id = None
                 player_name = None
 
                 # If we have site_id, use it directly
                 if player_info.get("site_id"):
-                    player = self.get_or_create_player(**player_info)
-                    player_id = player.id
+                    player_id = player_ids[player_info["site_id"]]
                 else:
                     # Try to find player by name in the match roster
                     first_name = player_info.get("first_name", "")
                     last_name = player_info.get("last_name", "")
 
                     if first_name and last_name:
-                        # Search in match_players for this match and team
-                        found_player = self.session.query(Player).join(
-                            MatchPlayer, MatchPlayer.player_id == Player.id
-                        ).filter(
-                            MatchPlayer.match_id == match.id,
-                            MatchPlayer.team_id == team.id,
-                            Player.first_name == first_name,
-                            Player.last_name == last_name
-                        ).first()
-
-                        if found_player:
-                            player_id = found_player.id
-                        else:
+                        player_id = roster_ids.get((match_id, first_name, last_name, team_id))
+                        if not player_id:
                             # Fallback: save as text
                             parts = [last_name, first_name]
                             if player_info.get("middle_name"):
                                 parts.append(player_info["middle_name"])
                             player_name = " ".join(parts)
 
-                bp = BestPlayer(
-                    match_id=match.id,
-                    player_id=player_id,
-                    team_id=team.id,
-                    player_name=player_name
-                )
-                self.session.add(bp)
+                rows.append({
+                    "match_id": match_id,
+                    "player_id": player_id,
+                    "team_id": team_id,
+                    "player_name": player_name,
+                })
+
+        if rows:
+            self.session.execute(insert(BestPlayer), rows)
+        changed.update(row["player_id"] for row in rows)
+        changed.discard(None)
+        return changed
+
+    def _find_roster_players_by_name(self, batch: Dict[int, Dict[str, Any]],
+                                     saved: Dict[int, Tuple[int, Optional[int], Optional[int]]]
+                                     ) -> Dict[Tuple[int, str, str, int], int]:
+        """Look up best players given only by name in the match rosters, in one query.
+
+        Returns (match_id, first_name, last_name, team_id) -> player id.
+        """
+        names = set()
+        for match_data in batch.values():
+            for bp in match_data.get("best_players", []):
+                if bp.get("player") and bp.get("team") and not bp["player"].get("site_id"):
+                    first, last = bp["player"].get("first_name", ""), bp["player"].get("last_name", "")
+                    if first and last:
+                        names.add((first, last))
+        if not names:
+            return {}
+
+        rows = self.session.execute(
+            select(MatchPlayer.match_id, Player.first_name, Player.last_name, MatchPlayer.team_id, Player.id)
+            .join(MatchPlayer, MatchPlayer.player_id == Player.id)
+            .where(
+                MatchPlayer.match_id.in_([match_id for match_id, _, _ in saved.values()]),
+                tuple_(Player.first_name, Player.last_name).in_(list(names)),
+            )
+        )
+        found = {}
+        for match_id, first_name, last_name, team_id, player_id in rows:
+            found.setdefault((match_id, first_name, last_name, team_id), player_id)
+        return found
 
     def save_roster(self, roster_data: Dict[str, Any]) -> bool:
         """Save roster data from members.php."""
@@ -254,42 +491,53 @@ class DataService:
         if not team_info.get("site_id"):
             return False
 
-        team = self.get_or_create_team(team_info["site_id"], team_info.get("name"))
-
-        for player_data in roster_data["players"]:
-            if player_data.get("site_id"):
-                player = self.get_or_create_player(**player_data)
-
-                # Check if roster entry exists
-                existing = self.session.query(TeamRoster).filter_by(
-                    roster_site_id=roster_data["roster_id"],
-                    player_id=player.id
-                ).first()
-
-                if not existing:
-                    roster = TeamRoster(
-                        team_id=team.id,
-                        player_id=player.id,
-                        roster_site_id=roster_data["roster_id"],
-                        jersey_number=player_data.get("jersey_number")
-                    )
-                    self.session.add(roster)
+        team_id = self.get_or_create_team_id(team_info["site_id"], team_info.get("name"))
+
+        players = [p for p in roster_data["players"] if p.get("site_id")]
+        player_ids = self._upsert_players(players)
+
+        # First entry per player wins; rows already in this roster are left as they are
+        rows: Dict[int, Dict[str, Any]] = {}
+        for player_data in players:
+            player_id = player_ids[player_data["site_id"]]
+            rows.setdefault(player_id, {
+                "team_id": team_id,
+                "player_id": player_id,
+                "roster_site_id": roster_data["roster_id"],
+                "jersey_number": player_data.get("jersey_number"),
+            })
+        if rows:
+            self.session.execute(
+                sqlite_insert(TeamRoster).values(list(rows.values()))
+                .on_conflict_do_nothing(index_elements=[TeamRoster.roster_site_id, TeamRoster.player_id])
+            )
 
         return True
 
+    def get_match_ids_in_range(self, start_id: int, end_id: int) -> Set[int]:
+        """Get site IDs of stored matches between start_id and end_id inclusive."""
+        return set(self.session.execute(
+            select(Match.site_id).where(Match.site_id.between(start_id, end_id))
+        ).scalars())
+
     def get_match_by_site_id(self, site_id: int) -> Optional[Match]:
         """Get match by site ID."""
-        return self.session.query(Match).filter_by(site_id=site_id).first()
+        return self.session.scalars(_MATCH_BY_SITE_ID, {"site_id": site_id}).first()
 
     def match_exists(self, site_id: int) -> bool:
         """Check if match already exists in database."""
-        return self.session.query(Match).filter_by(site_id=site_id).count() > 0
+        return self.session.scalar(_MATCH_EXISTS, {"site_id": site_id})
 
     def get_stats(self) -> Dict[str, int]:
         """Get database statistics."""
-        return {
-            "matches": self.session.query(Match).count(),
-            "teams": self.session.query(Team).count(),
-            "players": self.session.query(Player).count(),
-            "referees": self.session.query(Referee).count(),
+        counts = {
+            "matches": Match,
+            "teams": Team,
+            "players": Player,
+            "referees": Referee,
         }
+        row = self.session.execute(select(*(
+            select(func.count()).select_from(model).scalar_subquery().label(key)
+            for key, model in counts.items()
+        ))).one()
+        return dict(row._mapping)
@@ -2,8 +2,11 @@
 
 import logging
 import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, Iterable, Iterator, List, Tuple
 from dataclasses import dataclass, field
 
 from src.database.db import Database
@@ -14,7 +17,7 @@ from src.services.data_service import DataService
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsingProgress:
     """Current parsing progress."""
     job_type: str
@@ -27,24 +30,42 @@ class ParsingProgress:
     last_error: str = ""
     started_at: datetime = None
     estimated_remaining: int = 0
+    # (current_id, percent) of the last progress_percent computation
+    _percent_cache: Optional[Tuple[int, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def progress_percent(self) -> float:
+        cached = self._percent_cache
+        if cached is not None and cached[0] == self.current_id:
+            return cached[1]
         total = self.end_id - self.start_id + 1
         if total <= 0:
-            return 0
-        done = self.current_id - self.start_id
-        return min(100, max(0, (done / total) * 100))
+            percent = 0
+        else:
+            done = self.current_id - self.start_id
+            percent = min(100, max(0, (done / total) * 100))
+        self._percent_cache = (self.current_id, percent)
+        return percent
 
 
 class ParsingService:
     """Service for managing parsing jobs."""
 
+    EXISTING_IDS_WINDOW = 50000  # match ids checked per existence query
+    FETCH_WORKERS = 8  # pages fetched concurrently; parsers rate-limit themselves
+    SAVE_BATCH = 20  # fetched matches saved per transaction
+    # Batch workers flush explicitly and never reread objects after commit
+    BATCH_SESSION_OPTIONS = {"autoflush": False, "expire_on_commit": False}
+    NOTIFY_INTERVAL = 0.2  # seconds between per-item progress callbacks
+
     def __init__(self, db: Database):
         self.db = db
-        self.match_parser = MatchParser()
-        self.team_parser = TeamParser()
-        self.roster_parser = RosterParser()
+        http = MatchParser.create_session()  # one connection pool for the site
+        self.match_parser = MatchParser(session=http)
+        self.team_parser = TeamParser(session=http)
+        self.roster_parser = RosterParser(session=http)
 
         self._progress = ParsingProgress(
             job_type="",
@@ -53,9 +74,12 @@ class ParsingService:
             current_id=0
         )
         self._stop_flag = threading.Event()
-        self._pause_flag = threading.Event()
+        self._resume_event = threading.Event()  # cleared while paused
+        self._resume_event.set()
         self._current_thread: Optional[threading.Thread] = None
         self._callbacks: list = []
+        self._last_notify = 0.0
+        self.data_version = 0  # bumped on every commit, for readers' caches
 
     @property
     def progress(self) -> ParsingProgress:
@@ -69,8 +93,18 @@ class ParsingService:
         """Add callback to be called on progress updates."""
         self._callbacks.append(callback)
 
-    def _notify_progress(self):
-        """Notify all callbacks of progress update."""
+    def _notify_progress(self, throttled: bool = False):
+        """Notify all callbacks of progress update.
+
+        throttled: per-item update, skipped if callbacks ran less than
+        NOTIFY_INTERVAL ago. State changes are always delivered.
+        """
+        if not self._callbacks:
+            return
+        now = time.monotonic()
+        if throttled and now - self._last_notify < self.NOTIFY_INTERVAL:
+            return
+        self._last_notify = now
         for callback in self._callbacks:
             try:
                 callback(self._progress)
@@ -83,7 +117,7 @@ class ParsingService:
             raise RuntimeError("Parsing already in progress")
 
         self._stop_flag.clear()
-        self._pause_flag.clear()
+        self._resume_event.set()
 
         self._progress = ParsingProgress(
             job_type="matches",
@@ -101,53 +135,129 @@ class ParsingService:
         )
         self._current_thread.start()
 
-    def _parse_matches_worker(self, start_id: int, end_id: int, skip_existing: bool):
-        """Worker thread for parsing matches."""
-        logger.info(f"Starting match parsing from {start_id} to {end_id}")
+    def _fetch_ahead(self, fetch: Callable, ids: Iterable[int]) -> Iterator[Tuple[int, Any, Optional[Exception]]]:
+        """Run fetch(id) on a thread pool, keeping FETCH_WORKERS pages in flight.
 
+        Yields (id, result, error) in input order; the caller does all DB work.
+        No new fetches are started once stop is requested.
+        """
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.FETCH_WORKERS, thread_name_prefix="vm-fetch") as executor:
+            try:
+                for item_id in ids:
+                    if self._stop_flag.is_set():
+                        break
+                    pending.append((item_id, executor.submit(fetch, item_id)))
+                    if len(pending) < self.FETCH_WORKERS:
+                        continue
+                    yield self._future_result(*pending.popleft())
+                while pending and not self._stop_flag.is_set():
+                    yield self._future_result(*pending.popleft())
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    @staticmethod
+    def _future_result(item_id: int, future) -> Tuple[int, Any, Optional[Exception]]:
         try:
-            for match_id in range(start_id, end_id + 1):
-                # Check for stop/pause
-                if self._stop_flag.is_set():
-                    self._progress.status = "stopped"
-                    break
-
-                while self._pause_flag.is_set():
-                    self._progress.status = "paused"
-                    self._notify_progress()
-                    self._pause_flag.wait(1)
-
-                self._progress.status = "running"
-                self._progress.current_id = match_id
-
-                try:
-                    with self.db.session() as session:
-                        data_service = DataService(session)
-
-                        # Skip if already exists
-                        if skip_existing and data_service.match_exists(match_id):
-                            logger.debug(f"Match {match_id} already exists, skipping")
-                            continue
-
-                        # Parse match
-                        match_data = self.match_parser.parse_match(match_id)
-
-                        if match_data:
-                            data_service.save_match(match_data)
-                            self._progress.total_parsed += 1
-                            logger.info(f"Parsed match {match_id}")
-                        else:
-                            logger.debug(f"Match {match_id} not found or empty")
+            return item_id, future.result(), None
+        except Exception as e:
+            return item_id, None, e
+
+    def _match_ids_to_parse(self, data_service: DataService, start_id: int, end_id: int,
+                            skip_existing: bool) -> Iterator[int]:
+        """Yield match ids in range, leaving out stored ones if skip_existing."""
+        existing_ids = set()
+        for match_id in range(start_id, end_id + 1):
+            if skip_existing:
+                # Existing ids are loaded one window at a time
+                if (match_id - start_id) % self.EXISTING_IDS_WINDOW == 0:
+                    window_end = min(match_id + self.EXISTING_IDS_WINDOW - 1, end_id)
+                    existing_ids = data_service.get_match_ids_in_range(match_id, window_end)
+                if match_id in existing_ids:
+                    logger.debug(f"Match {match_id} already exists, skipping")
+                    continue
+            yield match_id
+
+    def _save_match_batch(self, session, data_service: DataService, batch: List[Tuple[int, Dict]]):
+        """Save fetched matches in one transaction.
+
+        If the batch fails, matches are retried one by one so only the bad
+        ones are counted as errors.
+        """
+        if not batch:
+            return
+        try:
+            data_service.save_matches([match_data for _, match_data in batch])
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            data_service.clear_cache()
+            if len(batch) > 1:
+                for item in batch:
+                    self._save_match_batch(session, data_service, [item])
+            else:
+                self._record_match_error(batch[0][0], e)
+            return
+
+        self.data_version += 1
+        self._progress.total_parsed += len(batch)
+        for match_id, _ in batch:
+            logger.info(f"Parsed match {match_id}")
+
+    def _record_match_error(self, match_id: int, error: Exception):
+        self._progress.total_errors += 1
+        self._progress.last_error = f"Match {match_id}: {str(error)}"
+        logger.error(f"Error parsing match {match_id}: {error}")
 
-                except Exception as e:
-                    self._progress.total_errors += 1
-                    self._progress.last_error = f"Match {match_id}: {str(e)}"
-                    logger.error(f"Error parsing match {match_id}: {e}")
+    def _parse_matches_worker(self, start_id: int, end_id: int, skip_existing: bool):
+        """Worker thread for parsing matches.
 
-                self._notify_progress()
+        Pages are fetched on a thread pool; this thread owns the session and
+        saves results in id order, SAVE_BATCH matches per transaction.
+        """
+        logger.info(f"Starting match parsing from {start_id} to {end_id}")
 
-            if not self._stop_flag.is_set():
-                self._progress.status = "completed"
+        try:
+            # One session for the whole run. Transactions only cover saving
+            # already fetched matches: SQLite holds the write lock until commit,
+            # and keeping it across page fetches would block the other parsers.
+            with self.db.session(**self.BATCH_SESSION_OPTIONS) as session:
+                data_service = DataService(session)
+                match_ids = self._match_ids_to_parse(data_service, start_id, end_id, skip_existing)
+                batch = []
+
+                for match_id, match_data, error in self._fetch_ahead(self.match_parser.parse_match, match_ids):
+                    # Check for stop/pause
+                    if self._stop_flag.is_set():
+                        break
+
+                    if not self._resume_event.is_set():
+                        self._save_match_batch(session, data_service, batch)
+                        batch = []
+                        if self._wait_while_paused():
+                            break
+
+                    self._progress.status = "running"
+                    self._progress.current_id = match_id
+
+                    if error is not None:
+                        self._record_match_error(match_id, error)
+                    elif match_data:
+                        batch.append((match_id, match_data))
+                    else:
+                        logger.debug(f"Match {match_id} not found or empty")
+
+                    if len(batch) >= self.SAVE_BATCH:
+                        self._save_match_batch(session, data_service, batch)
+                        batch = []
+
+                    self._notify_progress(throttled=True)
+
+                # Matches fetched before a stop are kept
+                self._save_match_batch(session, data_service, batch)
+
+            self._progress.status = "stopped" if self._stop_flag.is_set() else "completed"
 
         except Exception as e:
             self._progress.status = "failed"
@@ -164,7 +274,7 @@ class ParsingService:
             raise RuntimeError("Parsing already in progress")
 
         self._stop_flag.clear()
-        self._pause_flag.clear()
+        self._resume_event.set()
 
         self._progress = ParsingProgress(
             job_type="rosters",
@@ -187,38 +297,41 @@ class ParsingService:
         logger.info(f"Starting roster parsing from {start_id} to {end_id}")
 
         try:
-            for roster_id in range(start_id, end_id + 1):
-                if self._stop_flag.is_set():
-                    self._progress.status = "stopped"
-                    break
+            with self.db.session(**self.BATCH_SESSION_OPTIONS) as session:
+                data_service = DataService(session)
+                roster_ids = range(start_id, end_id + 1)
 
-                while self._pause_flag.is_set():
-                    self._progress.status = "paused"
-                    self._notify_progress()
-                    self._pause_flag.wait(1)
+                for roster_id, roster_data, error in self._fetch_ahead(self.roster_parser.parse_roster, roster_ids):
+                    if self._stop_flag.is_set():
+                        break
 
-                self._progress.status = "running"
-                self._progress.current_id = roster_id
+                    if self._wait_while_paused():
+                        break
 
-                try:
-                    roster_data = self.roster_parser.parse_roster(roster_id)
+                    self._progress.status = "running"
+                    self._progress.current_id = roster_id
 
-                    if roster_data and roster_data.get("players"):
-                        with self.db.session() as session:
-                            data_service = DataService(session)
+                    try:
+                        if error is not None:
+                            raise error
+
+                        if roster_data and roster_data.get("players"):
                             data_service.save_roster(roster_data)
+                            session.commit()
+                            self.data_version += 1
                             self._progress.total_parsed += 1
                             logger.info(f"Parsed roster {roster_id}")
 
-                except Exception as e:
-                    self._progress.total_errors += 1
-                    self._progress.last_error = f"Roster {roster_id}: {str(e)}"
-                    logger.error(f"Error parsing roster {roster_id}: {e}")
+                    except Exception as e:
+                        session.rollback()
+                        data_service.clear_cache()
+                        self._progress.total_errors += 1
+                        self._progress.last_error = f"Roster {roster_id}: {str(e)}"
+                        logger.error(f"Error parsing roster {roster_id}: {e}")
 
-                self._notify_progress()
+                    self._notify_progress(throttled=True)
 
-            if not self._stop_flag.is_set():
-                self._progress.status = "completed"
+            self._progress.status = "stopped" if self._stop_flag.is_set() else "completed"
 
         except Exception as e:
             self._progress.status = "failed"
@@ -227,19 +340,27 @@ class ParsingService:
         finally:
             self._notify_progress()
 
+    def _wait_while_paused(self) -> bool:
+        """Block the worker until resumed. Returns True if stopped meanwhile."""
+        if not self._resume_event.is_set():
+            self._progress.status = "paused"
+            self._notify_progress()
+            self._resume_event.wait()
+        return self._stop_flag.is_set()
+
     def pause(self):
         """Pause current parsing."""
         if self.is_running:
-            self._pause_flag.set()
+            self._resume_event.clear()
 
     def resume(self):
         """Resume paused parsing."""
-        self._pause_flag.clear()
+        self._resume_event.set()
 
     def stop(self):
         """Stop current parsing."""
         self._stop_flag.set()
-        self._pause_flag.clear()
+        self._resume_event.set()
         if self._current_thread:
             self._current_thread.join(timeout=5)
 
@@ -1,16 +1,22 @@
 """Background scheduler for auto-updating matches from both sources."""
 
+import json
 import logging
+import os
+import random
 import threading
 import time
-from datetime import datetime, timedelta
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from src.database.db import Database
 from src.database.models import (
-    Match, BCMatch, BCSeason, BCMatchPlayerStats
+    Match, BCSeason, BCMatchPlayerStats
 )
-from src.parser import MatchParser
+from src.parser import MatchParser, MatchFetchError
 from src.services.data_service import DataService
 from src.parser_bc import (
     BCSeasonParser, BCScheduleParser, BCMatchParser as BCMatchDetailParser,
@@ -22,91 +28,329 @@ from sqlalchemy import func
 logger = logging.getLogger(__name__)
 
 # Stop after this many consecutive empty pages
-VOLLEYMSK_EMPTY_THRESHOLD = 50
+VOLLEYMSK_EMPTY_THRESHOLD = int(os.getenv("VB_VM_EMPTY_THRESHOLD", "50"))
+# Quick "nothing new" checks probe this many ids after the max one, then doubling offsets
+VOLLEYMSK_DENSE_PROBES = 8
+# Walk the whole empty threshold at least this often (seconds), since the quick
+# check can miss a new match at an unprobed offset past a gap in the ids
+VOLLEYMSK_FULL_WALK_INTERVAL = int(os.getenv("VB_VM_FULL_WALK_INTERVAL", "86400"))
+# Match pages fetched concurrently while probing for new ones
+VOLLEYMSK_FETCH_WORKERS = 16
 # How often to check (seconds)
-CHECK_INTERVAL = 3600  # 1 hour
-# BC: how many consecutive non-existent seasons to check before giving up
-BC_SEASON_LOOKAHEAD = 2
+CHECK_INTERVAL = int(os.getenv("VB_CHECK_INTERVAL", "3600"))  # 1 hour
+# Per-source intervals, so e.g. BC can be polled less often than VolleyMSK
+VM_CHECK_INTERVAL = int(os.getenv("VB_VM_CHECK_INTERVAL", str(CHECK_INTERVAL)))
+BC_CHECK_INTERVAL = int(os.getenv("VB_BC_CHECK_INTERVAL", str(CHECK_INTERVAL)))
+# Max random delay added before the first check (seconds)
+START_JITTER = 300
+# BC: how many seasons past the latest stored one to check for a new season
+# (on an empty DB: how many missing seasons in a row end the bootstrap)
+BC_SEASON_LOOKAHEAD = int(os.getenv("VB_BC_SEASON_LOOKAHEAD", "2"))
+# BC matches saved per transaction
+BC_SAVE_BATCH = 50
+# BC pages fetched concurrently (the parser still rate-limits requests)
+BC_FETCH_WORKERS = 8
+# Failed fetches in a row that open a site's circuit, and how long it stays open (seconds)
+CIRCUIT_FAIL_THRESHOLD = 5
+CIRCUIT_COOLDOWN = 60
+# Requests per second allowed to each site across all of its parsers
+VM_MAX_RPS = 20
+BC_MAX_RPS = 10
+# Set to 0 to keep the updater out of the web process and run it on its own
+# (python run.py updater), so page parsing doesn't compete with requests for the GIL
+AUTOUPDATE_IN_WEB = os.getenv("VB_AUTOUPDATE_IN_WEB", "1") != "0"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of fetching while a site's circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Stops requests to a flapping site for a cooldown after repeated failures.
+
+    After the cooldown requests go through again; the first failure reopens
+    the circuit, a success closes it.
+    """
+
+    def __init__(self, name: str, fail_threshold: int = CIRCUIT_FAIL_THRESHOLD,
+                 cooldown: float = CIRCUIT_COOLDOWN):
+        self.name = name
+        self.fail_threshold = fail_threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return time.monotonic() < self._open_until
+
+    def check(self):
+        if self.is_open:
+            raise CircuitOpenError(f"{self.name} circuit open")
+
+    def record(self, ok: bool):
+        with self._lock:
+            if ok:
+                self._failures = 0
+                return
+            self._failures += 1
+            if self._failures >= self.fail_threshold:
+                if not self.is_open:
+                    logger.warning("%s: %d failed requests in a row, pausing for %ds",
+                                   self.name, self._failures, self.cooldown)
+                self._open_until = time.monotonic() + self.cooldown
+
+
+class TokenBucket:
+    """Blocking token bucket: at most `rate` requests/s with bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+@dataclass
+class UpdateSource:
+    """State of one source's update loop."""
+    name: str
+    update: Callable[[], str]
+    interval: int
+    wake: threading.Event = field(default_factory=threading.Event)  # cuts the wait short
+    thread: Optional[threading.Thread] = None
+    status: str = "idle"  # idle, running, error
+    last_run: Optional[datetime] = None
+    last_result: str = ""
 
 
 class AutoUpdater:
     """Background auto-updater for both data sources."""
 
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, on_saved: Optional[Callable[[str], None]] = None):
         self.db = db
+        # Called with "vm" or "bc" after each committed save, e.g. to drop readers' caches
+        self._on_saved = on_saved or (lambda source: None)
         self._stop_flag = threading.Event()
-        self._thread: Optional[threading.Thread] = None
-        self._last_run: Optional[datetime] = None
-        self._status = "idle"
-        self._last_vm_result = ""
-        self._last_bc_result = ""
+        # Each source runs in its own thread, so a slow or failing site
+        # doesn't hold back the other one
+        self._sources = {
+            "vm": UpdateSource("VolleyMSK", self._update_volleymsk, VM_CHECK_INTERVAL),
+            "bc": UpdateSource("BC", self._update_bc, BC_CHECK_INTERVAL),
+        }
+        self._season_cache: Dict[int, Dict] = {}  # season pages parsed during the current BC run
+        # Last runs survive restarts, so a redeploy doesn't re-probe both sites
+        self._state_path = os.path.join(os.path.dirname(db.db_path), "scheduler_state.json")
+        self._state_lock = threading.Lock()
+        # "season:kind" -> ETag/Last-Modified of the BC schedule pages
+        self._schedule_validators: Dict[str, Dict[str, str]] = {}
+        self._vm_breaker = CircuitBreaker("VolleyMSK")
+        self._bc_breaker = CircuitBreaker("BC")
+        self._vm_bucket = TokenBucket(VM_MAX_RPS)
+        self._bc_bucket = TokenBucket(BC_MAX_RPS)
+        self._vm_last_full_walk: Optional[float] = None  # monotonic; the first run walks
+        self._vm_parser: Optional[MatchParser] = None  # built on start() or the first update
+
+    def _ensure_parsers(self):
+        """Build the sites' HTTP sessions and parsers, only needed once updates run here."""
+        if self._vm_parser is not None:
+            return
+        # Kept across runs so hourly checks reuse open connections
+        self._vm_http = MatchParser.create_session()
+        self._bc_http = BCSeasonParser.create_session()
+        # Parsers only hold connection and rate-limit state, so they live as long as the updater
+        self._vm_parser = self._guard(MatchParser(session=self._vm_http), self._vm_breaker, self._vm_bucket)
+        (self._bc_season_parser, self._bc_schedule_parser, self._bc_match_parser,
+         self._bc_team_parser, self._bc_player_parser, self._bc_referee_parser) = (
+            self._guard(parser_cls(session=self._bc_http), self._bc_breaker, self._bc_bucket)
+            for parser_cls in (BCSeasonParser, BCScheduleParser, BCMatchDetailParser,
+                               BCTeamParser, BCPlayerParser, BCRefereeParser)
+        )
 
     def start(self):
-        """Start the auto-updater daemon thread."""
-        if self._thread and self._thread.is_alive():
+        """Start one auto-updater daemon thread per source."""
+        if self.is_running:
             logger.warning("AutoUpdater already running")
             return
 
+        self._ensure_parsers()  # before the threads, which share them
         self._stop_flag.clear()
-        self._thread = threading.Thread(target=self._run_loop, daemon=True)
-        self._thread.start()
-        logger.info("AutoUpdater started (interval: %ds)", CHECK_INTERVAL)
+        state = self._restore_state()
+        self._schedule_validators = state.get("bc_schedule_validators") or {}
+        for src in self._sources.values():
+            src.wake.clear()
+            src.thread = threading.Thread(target=self._run_loop, args=(src,), daemon=True)
+            src.thread.start()
+        logger.info("AutoUpdater started (intervals: VM %ds, BC %ds, VM empty threshold: %d, "
+                    "BC season lookahead: %d)", VM_CHECK_INTERVAL, BC_CHECK_INTERVAL,
+                    VOLLEYMSK_EMPTY_THRESHOLD, BC_SEASON_LOOKAHEAD)
 
     def stop(self):
         """Stop the auto-updater."""
         self._stop_flag.set()
-        if self._thread:
-            self._thread.join(timeout=10)
+        for src in self._sources.values():
+            src.wake.set()
+        for src in self._sources.values():
+            if src.thread:
+                src.thread.join(timeout=10)
         logger.info("AutoUpdater stopped")
 
+    @property
+    def is_running(self) -> bool:
+        """Whether update threads run in this process (False when it runs standalone)."""
+        return any(src.thread and src.thread.is_alive() for src in self._sources.values())
+
+    def trigger_now(self):
+        """Run the next update of both sources right away instead of waiting for the interval."""
+        for src in self._sources.values():
+            src.wake.set()
+
+    @staticmethod
+    def _wait(src: "UpdateSource", seconds: float):
+        """Sleep until the timeout, trigger_now() or stop()."""
+        src.wake.wait(seconds)
+        src.wake.clear()
+
     def get_status(self):
+        if not any(src.thread for src in self._sources.values()):
+            # Not started here: report the runs of the standalone updater
+            self._restore_state()
+        vm, bc = self._sources["vm"], self._sources["bc"]
+        statuses = {vm.status, bc.status}
+        last_runs = [src.last_run for src in (vm, bc) if src.last_run]
         return {
-            "status": self._status,
-            "last_run": self._last_run.isoformat() if self._last_run else None,
-            "last_vm_result": self._last_vm_result,
-            "last_bc_result": self._last_bc_result,
+            "status": next((s for s in ("running", "error") if s in statuses), "idle"),
+            "last_run": max(last_runs).isoformat() if last_runs else None,
+            "last_vm_result": vm.last_result,
+            "last_bc_result": bc.last_result,
+            "vm_status": vm.status,
+            "bc_status": bc.status,
+            "last_vm_run": vm.last_run.isoformat() if vm.last_run else None,
+            "last_bc_run": bc.last_run.isoformat() if bc.last_run else None,
         }
 
-    def _run_loop(self):
-        """Main loop: run immediately, then every CHECK_INTERVAL."""
-        # Initial delay to let app fully start
-        self._stop_flag.wait(10)
+    def _run_loop(self, src: "UpdateSource"):
+        """Source loop: run shortly after start, then every src.interval."""
+        # Initial delay to let app fully start, plus jitter so several
+        # instances don't poll the sites in lockstep
+        delay = 10 + random.uniform(0, min(START_JITTER, src.interval))
+        if src.last_run:
+            # Resume the schedule of the previous process instead of starting over
+            since_last = (datetime.now(timezone.utc) - src.last_run).total_seconds()
+            delay = max(delay, src.interval - since_last)
+        logger.info("AutoUpdater: first %s check in %.0fs", src.name, delay)
+        self._wait(src, delay)
 
         while not self._stop_flag.is_set():
             try:
-                self._status = "running"
-                self._last_run = datetime.now()
-
-                # Update VolleyMSK
-                vm_result = self._update_volleymsk()
-                self._last_vm_result = vm_result
-                logger.info("VolleyMSK update: %s", vm_result)
-
-                if self._stop_flag.is_set():
-                    break
+                src.status = "running"
+                src.last_run = datetime.now(timezone.utc)
+                started = time.monotonic()  # immune to wall-clock steps
 
-                # Update BC
-                bc_result = self._update_bc()
-                self._last_bc_result = bc_result
-                logger.info("BC update: %s", bc_result)
+                src.last_result = src.update()
+                logger.info("%s update: %s (%.1fs)", src.name, src.last_result,
+                            time.monotonic() - started)
 
-                self._status = "idle"
+                src.status = "idle"
+                self._save_state()
 
             except Exception as e:
-                self._status = "error"
-                logger.error("AutoUpdater error: %s", e, exc_info=True)
+                src.status = "error"
+                logger.error("AutoUpdater %s error: %s", src.name, e, exc_info=True)
 
             # Wait for next interval
-            self._stop_flag.wait(CHECK_INTERVAL)
+            self._wait(src, src.interval)
+
+    @staticmethod
+    def _guard(parser, breaker: CircuitBreaker, bucket: TokenBucket):
+        """Route the parser's page fetches through the site's breaker and rate limit.
+
+        Wraps fetch_content where the parser has it (fetch_page goes through it),
+        else fetch_page. Both return None on any request error, which counts as
+        a failure.
+        """
+        name = "fetch_content" if hasattr(parser, "fetch_content") else "fetch_page"
+        fetch = getattr(parser, name)
+
+        def guarded_fetch(*args, **kwargs):
+            breaker.check()
+            bucket.acquire()
+            page = fetch(*args, **kwargs)
+            breaker.record(page is not None)
+            return page
+
+        setattr(parser, name, guarded_fetch)
+        return parser
+
+    def _load_state(self) -> Dict:
+        try:
+            with open(self._state_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("AutoUpdater: ignoring unreadable state file: %s", e)
+            return {}
+
+    def _restore_state(self) -> Dict:
+        """Load the sources' last runs and results from the state file; returns the state."""
+        state = self._load_state()
+        for key, src in self._sources.items():
+            saved = state.get(key) or {}
+            if saved.get("last_run"):
+                src.last_run = datetime.fromisoformat(saved["last_run"])
+                src.last_result = saved.get("last_result", "")
+        return state
+
+    def _save_state(self):
+        """Write last run and result of each source and the schedule validators.
+
+        Only completed runs are written: a source that is running or whose
+        last run failed keeps its previously stored entry. Written atomically
+        under a lock, as both source threads save state.
+        """
+        with self._state_lock:
+            stored = self._load_state()
+            state = {}
+            for key, src in self._sources.items():
+                if src.status == "idle" and src.last_run:
+                    state[key] = {"last_run": src.last_run.isoformat(), "last_result": src.last_result}
+                elif stored.get(key):
+                    state[key] = stored[key]
+            state["bc_schedule_validators"] = dict(self._schedule_validators)
+            tmp_path = self._state_path + ".tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(state, f)
+                os.replace(tmp_path, self._state_path)
+            except OSError as e:
+                logger.warning("AutoUpdater: could not save state: %s", e)
 
     def _update_volleymsk(self) -> str:
         """Check for new VolleyMSK matches beyond current max."""
-        parser = MatchParser()
+        self._ensure_parsers()
+        parser = self._vm_parser
 
         with self.db.session() as session:
             max_id = session.query(func.max(Match.site_id)).filter(
                 Match.home_team_id.isnot(None)
             ).scalar() or 0
+            # Ids above max_id can only be matches stored without teams
+            existing = {site_id for (site_id,) in session.query(Match.site_id).filter(
+                Match.site_id > max_id
+            )}
 
         logger.info("VolleyMSK: checking new matches after site_id=%d", max_id)
 
@@ -114,129 +358,306 @@ class AutoUpdater:
         empty_streak = 0
         current_id = max_id + 1
 
-        while empty_streak < VOLLEYMSK_EMPTY_THRESHOLD:
-            if self._stop_flag.is_set():
-                break
+        with ThreadPoolExecutor(max_workers=VOLLEYMSK_FETCH_WORKERS,
+                                thread_name_prefix="vm-probe") as executor:
+            # Usually nothing is new: a few pages near max_id and at doubling
+            # offsets tell that without walking the whole empty threshold.
+            # A periodic full walk catches matches the probes step over.
+            full_walk_due = (self._vm_last_full_walk is None or
+                             time.monotonic() - self._vm_last_full_walk >= VOLLEYMSK_FULL_WALK_INTERVAL)
+            probes = {} if existing or full_walk_due else {
+                mid: executor.submit(parser.parse_match, mid)
+                for mid in self._sparse_probe_ids(current_id)
+            }
+            if probes and not any(self._may_be_match_page(f) for f in probes.values()):
+                if self._vm_breaker.is_open:
+                    return "+0 matches (circuit open)"
+                return f"+0 matches (probed up to {max(probes)})"
+
+            # Candidate ids are probed VOLLEYMSK_FETCH_WORKERS at a time; results are
+            # handled in id order so the empty-streak rule works as before
+            while empty_streak < VOLLEYMSK_EMPTY_THRESHOLD:
+                if self._stop_flag.is_set():
+                    break
 
-            try:
-                with self.db.session() as session:
-                    ds = DataService(session)
-                    if ds.match_exists(current_id):
-                        current_id += 1
+                ids = range(current_id, current_id + VOLLEYMSK_FETCH_WORKERS)
+                futures = {mid: probes.pop(mid, None) or executor.submit(parser.parse_match, mid)
+                           for mid in ids if mid not in existing}
+
+                found = []
+                circuit_open = False
+                for mid in ids:
+                    current_id = mid + 1
+                    if mid in existing:
                         empty_streak = 0
                         continue
-
-                    match_data = parser.parse_match(current_id)
+                    try:
+                        match_data = futures[mid].result()
+                    except CircuitOpenError:
+                        current_id = mid
+                        circuit_open = True
+                        break
+                    except MatchFetchError as e:
+                        # Unknown, so it neither ends nor extends the empty streak
+                        logger.warning("VolleyMSK: %d skipped: %s", mid, e)
+                        continue
+                    except Exception as e:
+                        logger.error("VolleyMSK: error parsing %d: %s", mid, e)
+                        match_data = None
                     if match_data and match_data.get("home_team"):
-                        ds.save_match(match_data)
-                        new_count += 1
+                        found.append(match_data)
                         empty_streak = 0
-                        logger.info("VolleyMSK: new match %d", current_id)
                     else:
                         empty_streak += 1
+                        if empty_streak >= VOLLEYMSK_EMPTY_THRESHOLD:
+                            break
+                for future in futures.values():
+                    future.cancel()
 
-            except Exception as e:
-                logger.error("VolleyMSK: error parsing %d: %s", current_id, e)
-                empty_streak += 1
+                new_count += self._save_volleymsk_matches(found)
+                if circuit_open:
+                    return f"+{new_count} matches (circuit open at {current_id})"
 
-            current_id += 1
+            if empty_streak >= VOLLEYMSK_EMPTY_THRESHOLD:
+                self._vm_last_full_walk = time.monotonic()
 
         return f"+{new_count} matches (checked up to {current_id - 1})"
 
+    @staticmethod
+    def _sparse_probe_ids(start_id: int) -> List[int]:
+        """The first VOLLEYMSK_DENSE_PROBES ids from start_id, then doubling offsets up to the empty threshold."""
+        ids = list(range(start_id, start_id + min(VOLLEYMSK_DENSE_PROBES, VOLLEYMSK_EMPTY_THRESHOLD)))
+        offset = VOLLEYMSK_DENSE_PROBES * 2
+        while offset <= VOLLEYMSK_EMPTY_THRESHOLD:
+            ids.append(start_id + offset - 1)
+            offset *= 2
+        return ids
+
+    @staticmethod
+    def _may_be_match_page(future) -> bool:
+        """Whether a probe found a match, or failed to fetch and so can't rule one out."""
+        try:
+            match_data = future.result()
+        except MatchFetchError:
+            return True
+        except Exception:
+            return False
+        return bool(match_data and match_data.get("home_team"))
+
+    def _save_volleymsk_matches(self, matches: List[Dict]) -> int:
+        """Save probed matches in one transaction, one by one if that fails."""
+        if not matches:
+            return 0
+        try:
+            with self.db.session() as session:
+                DataService(session).save_matches(matches)
+        except Exception as e:
+            if len(matches) == 1:
+                logger.error("VolleyMSK: error saving %d: %s", matches[0]["site_id"], e)
+                return 0
+            return sum(self._save_volleymsk_matches([m]) for m in matches)
+        self._on_saved("vm")
+        for match_data in matches:
+            logger.info("VolleyMSK: new match %d", match_data["site_id"])
+        return len(matches)
+
+    def _fetch_concurrently(self, fetch: Callable, items: Iterable) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+        """Run fetch(item) on a thread pool, BC_FETCH_WORKERS items at a time.
+
+        Items are consumed lazily, so at most BC_FETCH_WORKERS are in flight.
+        Yields (item, result, error) in input order; stops early on stop().
+        """
+        items = iter(items)
+        with ThreadPoolExecutor(max_workers=BC_FETCH_WORKERS, thread_name_prefix="bc-fetch") as executor:
+            while not self._stop_flag.is_set():
+                batch = list(islice(items, BC_FETCH_WORKERS))
+                if not batch:
+                    return
+                futures = [executor.submit(fetch, item) for item in batch]
+                for item, future in zip(batch, futures):
+                    try:
+                        result = future.result()
+                    except CircuitOpenError:
+                        raise  # the rest would fail the same way
+                    except Exception as e:
+                        yield item, None, e
+                    else:
+                        yield item, result, None
+
+    def _save_bc(self, kind: str, items: List[Tuple[int, Dict]],
+                 save: Callable[[BCDataService, int, Dict], Any]) -> int:
+        """Call save(svc, site_id, data) for all items in one transaction.
+
+        If that fails, items are saved one by one so only the bad ones are lost.
+        """
+        if not items:
+            return 0
+        try:
+            with self.db.session() as session:
+                svc = BCDataService(session)
+                for site_id, data in items:
+                    save(svc, site_id, data)
+        except Exception as e:
+            if len(items) == 1:
+                logger.error("BC: %s %d save error: %s", kind, items[0][0], e)
+                return 0
+            return sum(self._save_bc(kind, [item], save) for item in items)
+        self._on_saved("bc")
+        return len(items)
+
+    @staticmethod
+    def _save_bc_player(svc: BCDataService, site_id: int, pdata: Dict):
+        svc.get_or_create_player(
+            site_id=site_id,
+            last_name=pdata.get("last_name", ""),
+            first_name=pdata.get("first_name", ""),
+            birth_date=pdata.get("birth_date"),
+            height=pdata.get("height"),
+            weight=pdata.get("weight"),
+            position=pdata.get("position"),
+            photo_url=pdata.get("photo_url"),
+        )
+
+    def _parse_season_cached(self, season_num: int) -> Optional[Dict]:
+        """Parse a season page at most once per run."""
+        if season_num not in self._season_cache:
+            season_data = self._bc_season_parser.parse_season(season_num)
+            if not season_data:
+                return season_data
+            self._season_cache[season_num] = season_data
+        return self._season_cache[season_num]
+
     def _update_bc(self) -> str:
         """Check for new BC matches in latest season and detect new seasons."""
-        season_parser = BCSeasonParser()
-        schedule_parser = BCScheduleParser()
-        match_parser = BCMatchDetailParser()
-        team_parser = BCTeamParser()
-        player_parser = BCPlayerParser()
-        referee_parser = BCRefereeParser()
+        self._ensure_parsers()
 
         # Find latest season in DB
+        self._season_cache.clear()
+
         with self.db.session() as session:
             max_season = session.query(func.max(BCSeason.number)).scalar() or 0
 
+        if max_season == 0:
+            return self._bc_bootstrap()
+
         total_new = 0
 
-        # Only check the current max season (for new matches within it)
-        # and one season ahead (to detect a brand-new season)
-        seasons_to_check = [max_season] if max_season > 0 else []
+        # Check the current max season (for new matches within it) and up to
+        # BC_SEASON_LOOKAHEAD seasons ahead (to detect brand-new ones)
+        seasons_to_check = [max_season]
 
-        # Check if next season exists by comparing season name
-        next_season = max_season + 1
-        try:
-            next_data = season_parser.parse_season(next_season)
-            if next_data and next_data.get("name"):
-                # Get current season name for comparison
-                with self.db.session() as session:
-                    current = session.query(BCSeason).filter_by(number=max_season).first()
-                    current_name = current.name if current else ""
+        # Past the last season the site serves the latest one again, so a
+        # season ahead is new only if its name differs from the one before it
+        with self.db.session() as session:
+            current = session.query(BCSeason).filter_by(number=max_season).first()
+            last_name = current.name if current else ""
 
-                # If names differ, it's a real new season
-                if next_data["name"] != current_name:
-                    seasons_to_check.append(next_season)
-                    logger.info("BC: detected new season %d: '%s'", next_season, next_data["name"])
-                else:
-                    logger.debug("BC: season %d has same name as %d, skipping", next_season, max_season)
-        except Exception as e:
-            logger.debug("BC: season %d check failed: %s", next_season, e)
+        last_checked = max_season
+        for next_season in range(max_season + 1, max_season + BC_SEASON_LOOKAHEAD + 1):
+            last_checked = next_season
+            try:
+                next_data = self._parse_season_cached(next_season)
+            except Exception as e:
+                logger.debug("BC: season %d check failed: %s", next_season, e)
+                break
+            name = next_data.get("name") if next_data else None
+            if not name or name == last_name:
+                logger.debug("BC: season %d is missing or repeats season %d, stopping",
+                             next_season, next_season - 1)
+                break
+            seasons_to_check.append(next_season)
+            logger.info("BC: detected new season %d: '%s'", next_season, name)
+            last_name = name
 
         for season_num in seasons_to_check:
             if self._stop_flag.is_set():
                 break
 
-            new_in_season = self._update_bc_season(
-                season_num, season_parser, schedule_parser,
-                match_parser, team_parser, player_parser, referee_parser
-            )
+            new_in_season = self._update_bc_season(season_num)
             total_new += new_in_season
 
-        return f"+{total_new} matches (checked seasons {max_season}-{max_season + BC_SEASON_LOOKAHEAD})"
+        result = f"+{total_new} matches (checked seasons {max_season}-{last_checked})"
+        if self._bc_breaker.is_open:
+            result += " (circuit open)"
+        return result
+
+    def _bc_bootstrap(self) -> str:
+        """First run on an empty DB: walk seasons from 1 until BC_SEASON_LOOKAHEAD misses in a row."""
+        total_new = 0
+        season_num = 1
+        misses = 0
+        last_name = None
 
-    def _update_bc_season(self, season_num, season_parser, schedule_parser,
-                          match_parser, team_parser, player_parser,
-                          referee_parser) -> int:
+        while misses < BC_SEASON_LOOKAHEAD and not self._stop_flag.is_set():
+            try:
+                season_data = self._parse_season_cached(season_num)
+            except Exception as e:
+                logger.debug("BC: season %d check failed: %s", season_num, e)
+                season_data = None
+
+            # Past the last season the site serves the latest one again
+            name = season_data.get("name") if season_data else None
+            if name and name != last_name:
+                logger.info("BC: bootstrapping season %d: '%s'", season_num, name)
+                total_new += self._update_bc_season(season_num)
+                last_name = name
+                misses = 0
+            else:
+                misses += 1
+            season_num += 1
+
+        result = f"+{total_new} matches (bootstrapped seasons 1-{season_num - 1})"
+        if self._bc_breaker.is_open:
+            result += " (circuit open)"
+        return result
+
+    def _update_bc_season(self, season_num: int) -> int:
         """Update a single BC season. Returns count of new matches."""
         logger.info("BC: checking season %d", season_num)
 
         try:
-            # Parse schedule
-            championship = schedule_parser.parse_schedule(season_num, "championship")
-            cup = schedule_parser.parse_schedule(season_num, "cup")
-            all_schedule = championship + cup
-
-            if not all_schedule:
+            # Parse schedule; pages unchanged since the last run come back as None
+            validators = {
+                kind: dict(self._schedule_validators.get(f"{season_num}:{kind}", {}))
+                for kind in ("championship", "cup")
+            }
+            championship = self._bc_schedule_parser.parse_schedule(season_num, "championship", validators["championship"])
+            cup = self._bc_schedule_parser.parse_schedule(season_num, "cup", validators["cup"])
+            all_schedule = (championship or []) + (cup or [])
+            if championship is None and cup is None:
+                logger.info("BC: season %d schedule unchanged", season_num)
+            elif not all_schedule:
                 logger.info("BC: season %d has no matches in schedule", season_num)
-                return 0
 
-            # Save season and schedule
+            # Save season and schedule. Matches to parse are the ones never
+            # saved in full: the inserted ones plus any whose parse failed or
+            # was cut short on an earlier run, which are looked up even when
+            # the schedule is unchanged.
             with self.db.session() as session:
                 svc = BCDataService(session)
-                season = svc.get_or_create_season(season_num)
-
-                # Update season name
-                season_data = season_parser.parse_season(season_num)
-                if season_data and season_data.get("name"):
-                    season.name = season_data["name"]
-
-                # Save schedule entries and find new matches
-                new_stubs = []
-                for m in all_schedule:
-                    m_site_id = m.get("site_id")
-                    if not m_site_id:
-                        continue
+                if all_schedule:
+                    season = svc.get_or_create_season(season_num)
 
-                    m["tournament_type"] = m.get("tournament_type", "championship")
-                    svc.save_schedule_match(m, season.id)
+                    # Update season name
+                    season_data = self._parse_season_cached(season_num)
+                    if season_data and season_data.get("name"):
+                        season.name = season_data["name"]
 
-                    # Check if match is already fully parsed
-                    existing_match = session.query(BCMatch).filter_by(
-                        site_id=m_site_id
-                    ).first()
-                    if existing_match and existing_match.home_score is not None:
-                        continue  # Already parsed with score
-                    if not existing_match:
-                        new_stubs.append(m)
+                    for m in all_schedule:
+                        m["tournament_type"] = m.get("tournament_type", "championship")
+                    svc.save_schedule_matches(all_schedule, season.id)
+                else:
+                    season = session.query(BCSeason).filter_by(number=season_num).first()
+                    if season is None:
+                        return 0
+                season_id = season.id
+                new_stubs = svc.get_unparsed_match_stubs(season_id)
+
+            # Only remembered once the schedule is stored
+            if all_schedule:
+                with self._state_lock:
+                    for kind, kind_validators in validators.items():
+                        self._schedule_validators[f"{season_num}:{kind}"] = kind_validators
 
             if not new_stubs:
                 logger.info("BC: season %d - no new matches to parse", season_num)
@@ -246,7 +667,7 @@ class AutoUpdater:
 
             # Parse teams
             try:
-                teams = team_parser.parse_teams_listing(season_num)
+                teams = self._bc_team_parser.parse_teams_listing(season_num)
                 with self.db.session() as session:
                     svc = BCDataService(session)
                     for td in teams:
@@ -258,29 +679,34 @@ class AutoUpdater:
             except Exception as e:
                 logger.error("BC: teams parse error for season %d: %s", season_num, e)
 
-            # Parse new matches
-            new_count = 0
-            for stub in new_stubs:
-                if self._stop_flag.is_set():
-                    break
-
-                m_site_id = stub.get("site_id")
-                try:
-                    match_data = match_parser.parse_match(season_num, m_site_id)
-                    if match_data:
-                        match_data.setdefault("tournament_type", stub.get("tournament_type"))
-                        match_data.setdefault("division_name", stub.get("division_name"))
-                        match_data.setdefault("round_name", stub.get("round_name"))
-                        match_data.setdefault("venue", stub.get("venue"))
-
-                        with self.db.session() as session:
-                            svc = BCDataService(session)
-                            season = svc.get_or_create_season(season_num)
-                            svc.save_match(match_data, season.id)
-                            new_count += 1
+            # Parse new matches concurrently, saving every BC_SAVE_BATCH of them
+            # in one transaction
+            def save_match(svc, site_id, match_data):
+                svc.save_match(match_data, season_id)
 
-                except Exception as e:
-                    logger.error("BC: match %d parse error: %s", m_site_id, e)
+            new_count = 0
+            parsed = []
+            fetched = self._fetch_concurrently(
+                lambda stub: self._bc_match_parser.parse_match(season_num, stub.site_id), new_stubs
+            )
+            try:
+                for stub, match_data, error in fetched:
+                    if error is not None:
+                        logger.error("BC: match %d parse error: %s", stub.site_id, error)
+                    elif match_data:
+                        stub.fill(match_data)
+                        parsed.append((stub.site_id, match_data))
+
+                    if len(parsed) >= BC_SAVE_BATCH:
+                        new_count += self._save_bc("match", parsed, save_match)
+                        parsed = []
+            except CircuitOpenError:
+                # Keep what was parsed; the rest stays unparsed and is picked up next run
+                new_count += self._save_bc("match", parsed, save_match)
+                logger.warning("BC: season %d - circuit open, stopped after %d matches",
+                               season_num, new_count)
+                return new_count
+            new_count += self._save_bc("match", parsed, save_match)
 
             # Parse players for new matches
             if new_count > 0:
@@ -291,32 +717,32 @@ class AutoUpdater:
                         season = svc.get_or_create_season(season_num)
                         player_site_ids = svc.get_season_player_ids(season.id)
 
-                    for pid in player_site_ids:
-                        if self._stop_flag.is_set():
-                            break
-                        try:
-                            pdata = player_parser.parse_player(season_num, pid)
-                            if pdata:
-                                with self.db.session() as session:
-                                    svc = BCDataService(session)
-                                    svc.get_or_create_player(
-                                        site_id=pid,
-                                        last_name=pdata.get("last_name", ""),
-                                        first_name=pdata.get("first_name", ""),
-                                        birth_date=pdata.get("birth_date"),
-                                        height=pdata.get("height"),
-                                        weight=pdata.get("weight"),
-                                        position=pdata.get("position"),
-                                        photo_url=pdata.get("photo_url"),
-                                    )
-                        except Exception as e:
-                            logger.error("BC: player %d error: %s", pid, e)
+                    # Player pages are fetched concurrently and saved BC_SAVE_BATCH
+                    # per transaction, so only one batch is held in memory
+                    players = []
+                    fetched = self._fetch_concurrently(
+                        lambda pid: self._bc_player_parser.parse_player(season_num, pid), player_site_ids
+                    )
+                    try:
+                        for pid, pdata, error in fetched:
+                            if error is not None:
+                                logger.error("BC: player %d error: %s", pid, error)
+                            elif pdata:
+                                players.append((pid, pdata))
+                            if len(players) >= BC_SAVE_BATCH:
+                                self._save_bc("player", players, self._save_bc_player)
+                                players = []
+                    finally:
+                        self._save_bc("player", players, self._save_bc_player)
+                except CircuitOpenError:
+                    logger.warning("BC: season %d - circuit open, skipping the rest of the update", season_num)
+                    return new_count
                 except Exception as e:
                     logger.error("BC: players step error: %s", e)
 
                 # Referees
                 try:
-                    refs = referee_parser.parse_referees_listing(season_num)
+                    refs = self._bc_referee_parser.parse_referees_listing(season_num)
                     with self.db.session() as session:
                         svc = BCDataService(session)
                         for rd in refs:
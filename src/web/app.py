@@ -1,15 +1,33 @@
 """Flask web application for volleyball parser."""
 
 import os
+import time
+import functools
+import threading
+import base64
+import binascii
 import logging
+from datetime import datetime
+from typing import Optional, Tuple
+
+import orjson
 from flask import Flask, render_template, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import (
+    or_, and_, func, case, select, union_all, text, column, extract, exists, false, DateTime,
+)
+from sqlalchemy.orm import selectinload, joinedload, load_only, aliased
 
 from src.database.db import Database
+from src.database.models import (
+    Team, Player, Referee, Match, MatchPlayer, BestPlayer, TeamRoster,
+    BCSeason, BCTeam, BCPlayer, BCReferee, BCMatch, BCMatchPlayerStats, BCBestPlayer, BCMatchReferee,
+)
 from src.services.parsing_service import ParsingService
 from src.services.data_service import DataService
 from src.services.bc_parsing_service import BCParsingService
 from src.services.bc_data_service import BCDataService
-from src.services.scheduler import AutoUpdater
+from src.services.scheduler import AutoUpdater, AUTOUPDATE_IN_WEB
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +37,75 @@ parsing_service: ParsingService = None
 bc_parsing_service: BCParsingService = None
 auto_updater: AutoUpdater = None
 
+# Derived data (dashboard stats, list totals, name lookups) only changes
+# when parsing or the auto-updater commits; cache it per process
+CACHE_TTL = 60  # seconds, bounds staleness from a standalone auto-updater
+CACHE_MAX_ENTRIES = 512  # list totals are keyed by search term
+_cache: dict = {}
+_cache_lock = threading.Lock()  # request threads evict concurrently (see wsgi.py)
+
+
+def _cached(key, compute):
+    """Return compute() cached under key until TTL expiry or new parsed data."""
+    version = (parsing_service.data_version, bc_parsing_service.data_version)
+    now = time.monotonic()
+    entry = _cache.get(key)
+    if entry and entry[0] == version and now - entry[1] < CACHE_TTL:
+        return entry[2]
+    value = compute()
+    with _cache_lock:
+        if len(_cache) >= CACHE_MAX_ENTRIES:
+            for k, (v, t, _) in list(_cache.items()):
+                if v != version or now - t >= CACHE_TTL:
+                    del _cache[k]
+            if len(_cache) >= CACHE_MAX_ENTRIES:
+                _cache.clear()
+        _cache[key] = (version, now, value)
+    return value
+
+
+def _page_total(key, query, page: int, per_page: int, rows: list) -> int:
+    """Row count of query for a page of rows from it.
+
+    A short first page is the whole result; otherwise the count is cached
+    under key, which names the filters but not the page.
+    """
+    if page == 1 and len(rows) < per_page:
+        return len(rows)
+    return _cached(key, query.count)
+
+
+def _revalidated(response):
+    """Polled status response: clients revalidate it by ETag and get a bodiless 304 while unchanged."""
+    response.add_etag()
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def _get_stats():
+    with db.session() as session:
+        return DataService(session).get_stats()
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """jsonify via orjson: several times faster than json on the large detail payloads.
+
+    Datetimes are left to orjson, whose output for naive values matches isoformat().
+    """
+
+    OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=self.OPTIONS).decode()
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        # Hand the bytes straight to the response instead of round-tripping through str
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self.OPTIONS), mimetype=self.mimetype
+        )
+
 
 def create_app(db_path: str = None) -> Flask:
     """Create and configure Flask application."""
@@ -27,6 +114,7 @@ def create_app(db_path: str = None) -> Flask:
     app = Flask(__name__,
                 template_folder=os.path.join(os.path.dirname(__file__), 'templates'),
                 static_folder=os.path.join(os.path.dirname(__file__), 'static'))
+    app.json = ORJSONProvider(app)
 
     # Initialize database
     if db_path is None:
@@ -40,9 +128,15 @@ def create_app(db_path: str = None) -> Flask:
     parsing_service = ParsingService(db)
     bc_parsing_service = BCParsingService(db)
 
-    # Start auto-updater daemon
-    auto_updater = AutoUpdater(db)
-    auto_updater.start()
+    # Start auto-updater daemon, unless it runs as a separate process.
+    # Its saves bump the data versions like parse commits, so _cached drops stale values
+    def on_autoupdate_saved(source: str):
+        service = parsing_service if source == "vm" else bc_parsing_service
+        service.data_version += 1
+
+    auto_updater = AutoUpdater(db, on_saved=on_autoupdate_saved)
+    if AUTOUPDATE_IN_WEB:
+        auto_updater.start()
 
     # Register routes
     register_routes(app)
@@ -51,50 +145,192 @@ def create_app(db_path: str = None) -> Flask:
     return app
 
 
+# Keyset pagination. A sort order is a list of (expression, descending)
+# pairs ending in the primary key; the cursor is the last row's key values.
+
+def _order_by(keys) -> list:
+    return [expr.desc() if descending else expr.asc() for expr, descending in keys]
+
+
+def _key_columns(keys) -> list:
+    """The sort keys as extra result columns, read back by _row_cursor."""
+    return [expr.label(f'sort_key_{i}') for i, (expr, _) in enumerate(keys)]
+
+
+def _row_cursor(row, keys) -> str:
+    """Opaque cursor pointing after row, which carries the _key_columns."""
+    values = [getattr(row, f'sort_key_{i}') for i in range(len(keys))]
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode()
+
+
+def _decode_cursor(cursor: str, keys) -> list:
+    """Inverse of _row_cursor; raises ValueError on a malformed cursor."""
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError('cursor does not fit the sort order')
+        return [
+            datetime.fromisoformat(v) if v is not None and isinstance(expr.type, DateTime) else v
+            for (expr, _), v in zip(keys, values)
+        ]
+    except (binascii.Error, TypeError) as e:
+        raise ValueError(str(e))
+
+
+def _seek_after(keys, values):
+    """Filter for rows strictly after values in keys order.
+
+    SQLite sorts NULL lowest: first when ascending, last when descending.
+    """
+    clauses = []
+    for i, ((expr, descending), value) in enumerate(zip(keys, values)):
+        if value is None:
+            after = false() if descending else expr.isnot(None)
+        elif descending:
+            after = or_(expr < value, expr.is_(None))
+        else:
+            after = expr > value
+        ties = [e.is_(None) if v is None else e == v for (e, _), v in zip(keys[:i], values[:i])]
+        clauses.append(and_(*ties, after))
+    return or_(*clauses)
+
+
+def _seek_page(query, keys, after, per_page: int) -> Tuple[list, Optional[str]]:
+    """Rows of the ordered query after the decoded cursor, and the next cursor.
+
+    Seeks past the cursor instead of skipping rows, and never counts.
+    """
+    rows = query.add_columns(*_key_columns(keys)).filter(
+        _seek_after(keys, after)
+    ).limit(per_page + 1).all()
+    if len(rows) <= per_page:
+        return rows, None
+    rows = rows[:per_page]
+    return rows, _row_cursor(rows[-1], keys)
+
+
+# Rowid lookups into the FTS tables, built once; the phrase is bound per call
+_FTS_MATCH = {
+    table: text(f"SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH :phrase").columns(column('rowid'))
+    for table in Database.SEARCH_INDEXES
+}
+
+
+def _name_search(model, search: str):
+    """Filter matching search as a substring of any of model's indexed name columns.
+
+    Uses the trigram FTS index (see Database.SEARCH_INDEXES), which needs at
+    least three characters; shorter terms fall back to ILIKE.
+    """
+    table = model.__tablename__
+    if db.search_enabled and len(search) >= 3:
+        phrase = '"' + search.replace('"', '""') + '"'
+        return model.id.in_(_FTS_MATCH[table].bindparams(phrase=phrase))
+    return or_(*(getattr(model, c).ilike(f'%{search}%') for c in Database.SEARCH_INDEXES[table]))
+
+
+def _bc_match_rows(query, *columns):
+    """Column rows of the BC matches in query: columns plus the outer-joined
+    home_team / away_team names, so no BCMatch or BCTeam objects are loaded."""
+    home_team, away_team = aliased(BCTeam), aliased(BCTeam)
+    return query.with_entities(
+        *columns, home_team.name.label('home_team'), away_team.name.label('away_team'),
+    ).outerjoin(
+        home_team, BCMatch.home_team_id == home_team.id
+    ).outerjoin(
+        away_team, BCMatch.away_team_id == away_team.id
+    )
+
+
+# Player-is-referee lookups get their own LRU cache: one key per player name
+# would otherwise fill _cache and keep clearing the dashboard entries
+REFEREE_ID_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=REFEREE_ID_CACHE_SIZE)
+def _referee_id_lookup(last_name: str, first_name: str, version, ttl_window: int) -> Optional[int]:
+    with db.session() as session:
+        return session.query(Referee.id).filter(
+            Referee.last_name == last_name,
+            Referee.first_name == first_name
+        ).limit(1).scalar()
+
+
+def _referee_id_by_name(last_name: str, first_name: str) -> Optional[int]:
+    """Id of the VM referee with this name, if any (cached like _cached, mostly misses)."""
+    version = (parsing_service.data_version, bc_parsing_service.data_version)
+    return _referee_id_lookup(last_name, first_name, version, int(time.monotonic() // CACHE_TTL))
+
+
+def _get_monthly_stats():
+
+    with db.session() as session:
+        rows = session.query(
+            extract('year', Match.date_time).label('year'),
+            extract('month', Match.date_time).label('month'),
+            func.count(Match.id).label('count')
+        ).filter(
+            Match.date_time.isnot(None)
+        ).group_by('year', 'month').order_by('year', 'month').all()
+
+        result = [{'year': int(r.year), 'month': int(r.month), 'count': r.count} for r in rows]
+        years = sorted(set(r.year for r in rows))
+
+    return {'data': result, 'years': [int(y) for y in years]}
+
+
+def _get_bc_stats():
+    with db.session() as session:
+        return BCDataService(session).get_stats()
+
+
+def _get_bc_monthly_stats():
+    with db.session() as session:
+        data = session.query(
+            extract('year', BCMatch.date_time).label('year'),
+            extract('month', BCMatch.date_time).label('month'),
+            func.count(BCMatch.id).label('count')
+        ).filter(BCMatch.date_time.isnot(None)
+        ).group_by('year', 'month'
+        ).order_by('year', 'month').all()
+        result = [{'year': int(r.year), 'month': int(r.month), 'count': r.count} for r in data]
+        # Rows come ordered by year: distinct years in first-seen order are sorted
+        years = list(dict.fromkeys(r['year'] for r in result))
+    return {'data': result, 'years': years}
+
+
+def _get_bc_seasons():
+    with db.session() as session:
+        seasons = session.query(BCSeason).order_by(BCSeason.number.desc()).all()
+        return {'seasons': [{
+            'id': s.id, 'number': s.number, 'name': s.name
+        } for s in seasons]}
+
+
 def register_routes(app: Flask):
     """Register all routes."""
 
     @app.route('/')
     def index():
         """Main page."""
-        with db.session() as session:
-            data_service = DataService(session)
-            stats = data_service.get_stats()
+        stats = _cached('stats', _get_stats)
         return render_template('index.html', stats=stats)
 
     @app.route('/api/stats')
     def api_stats():
         """Get database statistics."""
-        with db.session() as session:
-            data_service = DataService(session)
-            stats = data_service.get_stats()
-        return jsonify(stats)
+        return jsonify(_cached('stats', _get_stats))
 
     @app.route('/api/stats/monthly')
     def api_stats_monthly():
         """Get match count by year-month for the chart."""
-        from src.database.models import Match
-        from sqlalchemy import func, extract
-
-        with db.session() as session:
-            rows = session.query(
-                extract('year', Match.date_time).label('year'),
-                extract('month', Match.date_time).label('month'),
-                func.count(Match.id).label('count')
-            ).filter(
-                Match.date_time.isnot(None)
-            ).group_by('year', 'month').order_by('year', 'month').all()
-
-            result = [{'year': int(r.year), 'month': int(r.month), 'count': r.count} for r in rows]
-            years = sorted(set(r.year for r in rows))
-
-        return jsonify({'data': result, 'years': [int(y) for y in years]})
+        return jsonify(_cached('monthly', _get_monthly_stats))
 
     @app.route('/api/progress')
     def api_progress():
         """Get current parsing progress."""
         progress = parsing_service.progress
-        return jsonify({
+        return _revalidated(jsonify({
             'job_type': progress.job_type,
             'start_id': progress.start_id,
             'end_id': progress.end_id,
@@ -104,7 +340,7 @@ def register_routes(app: Flask):
             'status': progress.status,
             'last_error': progress.last_error,
             'progress_percent': round(progress.progress_percent, 1),
-        })
+        }))
 
     @app.route('/api/parse/matches', methods=['POST'])
     def api_parse_matches():
@@ -159,326 +395,375 @@ def register_routes(app: Flask):
 
     @app.route('/api/matches')
     def api_matches():
-        """Get list of matches with optional search by team name."""
-        from src.database.models import Match, Team
-        from sqlalchemy import or_
+        """Get list of matches with optional search by team name.
+
+        Pages by ?page= (with a total) or by the ?cursor= returned as
+        next_cursor, which seeks instead of skipping rows and skips the count.
+        """
 
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 50, type=int)
         search = request.args.get('search', '').strip()
+        cursor = request.args.get('cursor')
+
+        # Newest first; undated matches sort last
+        keys = [(Match.date_time, True), (Match.id, True)]
+        after = None
+        if cursor:
+            try:
+                after = _decode_cursor(cursor, keys)
+            except ValueError:
+                return jsonify({'error': 'Invalid cursor'}), 400
 
         with db.session() as session:
             query = session.query(Match)
             if search:
-                # Join with teams to search by name
-                home_team = session.query(Team).filter(Team.name.ilike(f'%{search}%')).subquery()
-                away_team = session.query(Team).filter(Team.name.ilike(f'%{search}%')).subquery()
+                # Semi-join on the matching teams: unlike a join it never
+                # duplicates a match, so counting it stays exact
+                team_ids = select(Team.id).where(_name_search(Team, search))
                 query = query.filter(or_(
-                    Match.home_team_id.in_(session.query(Team.id).filter(Team.name.ilike(f'%{search}%'))),
-                    Match.away_team_id.in_(session.query(Team.id).filter(Team.name.ilike(f'%{search}%')))
+                    Match.home_team_id.in_(team_ids), Match.away_team_id.in_(team_ids)
                 ))
-            query = query.order_by(Match.date_time.desc())
-            total = query.count()
-            matches = query.offset((page - 1) * per_page).limit(per_page).all()
 
-            result = []
-            for m in matches:
-                result.append({
-                    'id': m.id,
-                    'site_id': m.site_id,
-                    'date_time': m.date_time.isoformat() if m.date_time else None,
-                    'home_team': m.home_team.name if m.home_team else None,
-                    'away_team': m.away_team.name if m.away_team else None,
-                    'home_score': m.home_score,
-                    'away_score': m.away_score,
-                    'set_scores': m.set_scores,
-                    'status': m.status,
-                    'referee': m.referee.full_name if m.referee else None,
-                })
+            # Plain column rows with the team and referee names joined in:
+            # no ORM objects or relationship loads for a read-only list
+            home_team, away_team = aliased(Team), aliased(Team)
+            page_query = query.with_entities(
+                Match.id,
+                Match.site_id,
+                Match.date_time,
+                home_team.name.label('home_team'),
+                away_team.name.label('away_team'),
+                Match.home_score,
+                Match.away_score,
+                Match.set_scores,
+                Match.status,
+                Referee.full_name.label('referee'),
+            ).outerjoin(
+                home_team, Match.home_team_id == home_team.id
+            ).outerjoin(
+                away_team, Match.away_team_id == away_team.id
+            ).outerjoin(
+                Referee, Match.referee_id == Referee.id
+            ).order_by(*_order_by(keys))
 
+            if after:
+                total = None
+                rows, next_cursor = _seek_page(page_query, keys, after, per_page)
+                has_more = next_cursor is not None
+            else:
+                rows = page_query.add_columns(
+                    *_key_columns(keys)
+                ).offset((page - 1) * per_page).limit(per_page).all()
+                total = _page_total(('matches_total', search), query, page, per_page, rows)
+                has_more = page * per_page < total
+                next_cursor = _row_cursor(rows[-1], keys) if has_more and rows else None
+
+            result = [{
+                'id': r.id,
+                'site_id': r.site_id,
+                'date_time': r.date_time,
+                'home_team': r.home_team,
+                'away_team': r.away_team,
+                'home_score': r.home_score,
+                'away_score': r.away_score,
+                'set_scores': r.set_scores,
+                'status': r.status,
+                'referee': r.referee,
+            } for r in rows]
+
+        if after:
+            return jsonify({
+                'matches': result,
+                'per_page': per_page,
+                'has_more': has_more,
+                'next_cursor': next_cursor,
+            })
         return jsonify({
             'matches': result,
             'total': total,
             'page': page,
             'per_page': per_page,
-            'pages': (total + per_page - 1) // per_page
+            'pages': (total + per_page - 1) // per_page,
+            'has_more': has_more,
+            'next_cursor': next_cursor,
         })
 
     @app.route('/api/teams')
     def api_teams():
         """Get list of teams with stats, sorting, pagination, gender filter."""
-        from src.database.models import Team, Match
-        from sqlalchemy import func
 
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 50, type=int)
         search = request.args.get('search', '').strip()
         sort = request.args.get('sort', 'name')
         gender = request.args.get('gender', '').strip()
+        cursor = request.args.get('cursor')
 
         with db.session() as session:
-            # Subqueries for match counts (home + away)
-            home_count_sq = session.query(
-                Match.home_team_id.label('team_id'),
-                func.count(Match.id).label('cnt')
-            ).filter(Match.home_team_id.isnot(None)).group_by(Match.home_team_id).subquery()
-
-            away_count_sq = session.query(
-                Match.away_team_id.label('team_id'),
-                func.count(Match.id).label('cnt')
-            ).filter(Match.away_team_id.isnot(None)).group_by(Match.away_team_id).subquery()
-
-            # Subqueries for wins
-            home_wins_sq = session.query(
-                Match.home_team_id.label('team_id'),
-                func.count(Match.id).label('cnt')
-            ).filter(
-                Match.home_team_id.isnot(None),
-                Match.home_score > Match.away_score
-            ).group_by(Match.home_team_id).subquery()
-
-            away_wins_sq = session.query(
-                Match.away_team_id.label('team_id'),
-                func.count(Match.id).label('cnt')
-            ).filter(
-                Match.away_team_id.isnot(None),
-                Match.away_score > Match.home_score
-            ).group_by(Match.away_team_id).subquery()
-
-            match_count_expr = (
-                func.coalesce(home_count_sq.c.cnt, 0) +
-                func.coalesce(away_count_sq.c.cnt, 0)
-            )
-            wins_expr = (
-                func.coalesce(home_wins_sq.c.cnt, 0) +
-                func.coalesce(away_wins_sq.c.cnt, 0)
-            )
-
+            # match_count / wins are cached on the team row at save time
             query = session.query(
-                Team,
-                match_count_expr.label('match_count'),
-                wins_expr.label('wins'),
-            ).outerjoin(
-                home_count_sq, Team.id == home_count_sq.c.team_id
-            ).outerjoin(
-                away_count_sq, Team.id == away_count_sq.c.team_id
-            ).outerjoin(
-                home_wins_sq, Team.id == home_wins_sq.c.team_id
-            ).outerjoin(
-                away_wins_sq, Team.id == away_wins_sq.c.team_id
+                Team.id,
+                Team.site_id,
+                Team.name,
+                Team.gender,
+                Team.match_count,
+                Team.wins,
             )
 
             if search:
-                query = query.filter(Team.name.ilike(f'%{search}%'))
+                query = query.filter(_name_search(Team, search))
             if gender:
                 query = query.filter(Team.gender == gender)
 
             if sort == 'matches':
-                query = query.order_by(match_count_expr.desc())
+                keys = [(Team.match_count, True)]
             elif sort == 'wins':
-                query = query.order_by(wins_expr.desc())
+                keys = [(Team.wins, True)]
             elif sort == 'win_rate':
-                query = query.order_by(
-                    (wins_expr * 100.0 / func.nullif(match_count_expr, 0)).desc()
-                )
+                keys = [(Team.wins * 100.0 / func.nullif(Team.match_count, 0), True)]
             else:
-                query = query.order_by(Team.name)
-
-            total = query.count()
-            rows = query.offset((page - 1) * per_page).limit(per_page).all()
+                keys = [(Team.name, False)]
+            keys.append((Team.id, False))
+            page_query = query.order_by(*_order_by(keys))
+
+            if cursor:
+                try:
+                    after = _decode_cursor(cursor, keys)
+                except ValueError:
+                    return jsonify({'error': 'Invalid cursor'}), 400
+                total = None
+                rows, next_cursor = _seek_page(page_query, keys, after, per_page)
+                has_more = next_cursor is not None
+            else:
+                rows = page_query.add_columns(
+                    *_key_columns(keys)
+                ).offset((page - 1) * per_page).limit(per_page).all()
+                total = _page_total(('teams_total', search, gender), query, page, per_page, rows)
+                has_more = page * per_page < total
+                next_cursor = _row_cursor(rows[-1], keys) if has_more and rows else None
 
             result = []
             for r in rows:
                 mc = r.match_count
                 w = r.wins
                 result.append({
-                    'id': r.Team.id,
-                    'site_id': r.Team.site_id,
-                    'name': r.Team.name,
-                    'gender': r.Team.gender,
+                    'id': r.id,
+                    'site_id': r.site_id,
+                    'name': r.name,
+                    'gender': r.gender,
                     'match_count': mc,
                     'wins': w,
                     'losses': mc - w,
                     'win_rate': round(w / mc * 100, 1) if mc > 0 else 0,
                 })
 
+        if cursor:
+            return jsonify({
+                'teams': result,
+                'per_page': per_page,
+                'has_more': has_more,
+                'next_cursor': next_cursor,
+            })
         return jsonify({
             'teams': result,
             'total': total,
             'page': page,
             'per_page': per_page,
+            'has_more': has_more,
+            'next_cursor': next_cursor,
         })
 
     @app.route('/api/players')
     def api_players():
         """Get list of players with MVP count, match count, gender filter."""
-        from src.database.models import Player, BestPlayer, MatchPlayer, Team
-        from sqlalchemy import or_, func
 
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 50, type=int)
         search = request.args.get('search', '').strip()
         sort = request.args.get('sort', 'mvp')
         gender = request.args.get('gender', '').strip()
+        cursor = request.args.get('cursor')
 
         with db.session() as session:
-            # Subqueries for stats
-            mvp_sq = session.query(
-                BestPlayer.player_id,
-                func.count(BestPlayer.id).label('mvp_count')
-            ).filter(BestPlayer.player_id.isnot(None)).group_by(BestPlayer.player_id).subquery()
-
-            match_sq = session.query(
-                MatchPlayer.player_id,
-                func.count(MatchPlayer.id).label('match_count')
-            ).group_by(MatchPlayer.player_id).subquery()
-
+            # mvp_count / match_count are cached on the player row at save time
             query = session.query(
-                Player,
-                func.coalesce(mvp_sq.c.mvp_count, 0).label('mvp_count'),
-                func.coalesce(match_sq.c.match_count, 0).label('match_count')
-            ).outerjoin(
-                mvp_sq, Player.id == mvp_sq.c.player_id
-            ).outerjoin(
-                match_sq, Player.id == match_sq.c.player_id
+                Player.id,
+                Player.site_id,
+                Player.full_name,
+                Player.birth_year,
+                Player.height,
+                Player.position,
+                Player.mvp_count,
+                Player.match_count,
             )
 
             if search:
-                query = query.filter(or_(
-                    Player.last_name.ilike(f'%{search}%'),
-                    Player.first_name.ilike(f'%{search}%'),
-                    Player.patronymic.ilike(f'%{search}%')
-                ))
+                query = query.filter(_name_search(Player, search))
 
             if gender:
-                # Filter players by team gender via MatchPlayer
-                gender_player_ids = session.query(
-                    MatchPlayer.player_id
-                ).join(
-                    Team, MatchPlayer.team_id == Team.id
-                ).filter(
-                    Team.gender == gender
-                ).distinct().subquery()
-                query = query.filter(Player.id.in_(
-                    session.query(gender_player_ids.c.player_id)
+                # Players who appeared for a team of this gender: a correlated
+                # EXISTS probes the player's appearances as rows are read in
+                # sort order, instead of first materializing every such player
+                query = query.filter(exists().where(
+                    MatchPlayer.player_id == Player.id,
+                    MatchPlayer.team_id == Team.id,
+                    Team.gender == gender,
                 ))
 
             if sort == 'mvp':
-                query = query.order_by(func.coalesce(mvp_sq.c.mvp_count, 0).desc())
+                keys = [(Player.mvp_count, True)]
             elif sort == 'matches':
-                query = query.order_by(func.coalesce(match_sq.c.match_count, 0).desc())
+                keys = [(Player.match_count, True)]
             else:
-                query = query.order_by(Player.last_name)
-
-            total = query.count()
-            rows = query.offset((page - 1) * per_page).limit(per_page).all()
-
-            result = []
-            for r in rows:
-                result.append({
-                    'id': r.Player.id,
-                    'site_id': r.Player.site_id,
-                    'full_name': r.Player.full_name,
-                    'birth_year': r.Player.birth_year,
-                    'height': r.Player.height,
-                    'position': r.Player.position,
-                    'mvp_count': r.mvp_count,
-                    'match_count': r.match_count,
-                })
+                keys = [(Player.last_name, False)]
+            keys.append((Player.id, False))
+            page_query = query.order_by(*_order_by(keys))
+
+            if cursor:
+                try:
+                    after = _decode_cursor(cursor, keys)
+                except ValueError:
+                    return jsonify({'error': 'Invalid cursor'}), 400
+                total = None
+                rows, next_cursor = _seek_page(page_query, keys, after, per_page)
+                has_more = next_cursor is not None
+            else:
+                rows = page_query.add_columns(
+                    *_key_columns(keys)
+                ).offset((page - 1) * per_page).limit(per_page).all()
+                total = _page_total(('players_total', search, gender), query, page, per_page, rows)
+                has_more = page * per_page < total
+                next_cursor = _row_cursor(rows[-1], keys) if has_more and rows else None
 
+            result = [{
+                'id': p.id,
+                'site_id': p.site_id,
+                'full_name': p.full_name,
+                'birth_year': p.birth_year,
+                'height': p.height,
+                'position': p.position,
+                'mvp_count': p.mvp_count,
+                'match_count': p.match_count,
+            } for p in rows]
+
+        if cursor:
+            return jsonify({
+                'players': result,
+                'per_page': per_page,
+                'has_more': has_more,
+                'next_cursor': next_cursor,
+            })
         return jsonify({
             'players': result,
             'total': total,
             'page': page,
             'per_page': per_page,
+            'has_more': has_more,
+            'next_cursor': next_cursor,
         })
 
     @app.route('/api/referees')
     def api_referees():
-        """Get list of referees with match count and average rating."""
-        from src.database.models import Referee, Match
-        from sqlalchemy import or_, func
+        """Get list of referees with match count and average rating, most active first."""
 
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', 100, type=int)
         search = request.args.get('search', '').strip()
+        cursor = request.args.get('cursor')
 
+        keys = [(Referee.match_count, True), (Referee.id, False)]
         with db.session() as session:
-            # Subquery for match count per referee
-            match_count_sq = session.query(
-                Match.referee_id,
-                func.count(Match.id).label('match_count')
-            ).filter(Match.referee_id.isnot(None)).group_by(Match.referee_id).subquery()
-
-            # Subquery for avg rating per referee
-            # Each match can have 0-2 ratings (home + away), avg all non-null
-            avg_rating_sq = session.query(
-                Match.referee_id,
-                (func.sum(
-                    func.coalesce(Match.referee_rating_home, 0) * (Match.referee_rating_home != None) +
-                    func.coalesce(Match.referee_rating_away, 0) * (Match.referee_rating_away != None)
-                ) * 1.0 / func.nullif(
-                    func.sum(
-                        (Match.referee_rating_home != None) + (Match.referee_rating_away != None)
-                    ), 0
-                )).label('avg_rating')
-            ).filter(Match.referee_id.isnot(None)).group_by(Match.referee_id).subquery()
-
+            # match_count / avg_rating are cached on the referee row at save time
             query = session.query(
-                Referee,
-                func.coalesce(match_count_sq.c.match_count, 0).label('match_count'),
-                avg_rating_sq.c.avg_rating
-            ).outerjoin(
-                match_count_sq, Referee.id == match_count_sq.c.referee_id
-            ).outerjoin(
-                avg_rating_sq, Referee.id == avg_rating_sq.c.referee_id
+                Referee.id,
+                Referee.full_name,
+                Referee.match_count,
+                Referee.avg_rating,
             )
 
             if search:
-                query = query.filter(or_(
-                    Referee.last_name.ilike(f'%{search}%'),
-                    Referee.first_name.ilike(f'%{search}%'),
-                    Referee.patronymic.ilike(f'%{search}%')
-                ))
+                query = query.filter(_name_search(Referee, search))
+            page_query = query.order_by(*_order_by(keys))
+
+            if cursor:
+                try:
+                    after = _decode_cursor(cursor, keys)
+                except ValueError:
+                    return jsonify({'error': 'Invalid cursor'}), 400
+                total = None
+                rows, next_cursor = _seek_page(page_query, keys, after, per_page)
+                has_more = next_cursor is not None
+            else:
+                rows = page_query.add_columns(
+                    *_key_columns(keys)
+                ).offset((page - 1) * per_page).limit(per_page).all()
+                total = _page_total(('referees_total', search), query, page, per_page, rows)
+                has_more = page * per_page < total
+                next_cursor = _row_cursor(rows[-1], keys) if has_more and rows else None
 
-            rows = query.order_by(func.coalesce(match_count_sq.c.match_count, 0).desc()).all()
             result = [{
-                'id': r.Referee.id,
-                'full_name': r.Referee.full_name,
+                'id': r.id,
+                'full_name': r.full_name,
                 'match_count': r.match_count,
                 'avg_rating': round(r.avg_rating, 1) if r.avg_rating else None,
             } for r in rows]
 
-        return jsonify({'referees': result, 'total': len(result)})
+        if cursor:
+            return jsonify({
+                'referees': result,
+                'per_page': per_page,
+                'has_more': has_more,
+                'next_cursor': next_cursor,
+            })
+        return jsonify({
+            'referees': result,
+            'total': total,
+            'page': page,
+            'per_page': per_page,
+            'has_more': has_more,
+            'next_cursor': next_cursor,
+        })
 
     @app.route('/api/referees/<int:referee_id>')
     def api_referee_detail(referee_id):
         """Get detailed referee info with match history."""
-        from src.database.models import Referee, Match
-        from sqlalchemy import or_, func
+
+        limit = request.args.get('limit', type=int)
 
         with db.session() as session:
             referee = session.query(Referee).filter_by(id=referee_id).first()
             if not referee:
                 return jsonify({'error': 'Referee not found'}), 404
 
-            # All matches for this referee
-            matches = session.query(Match).filter_by(
-                referee_id=referee_id
-            ).order_by(Match.date_time.desc()).all()
-
-            # Compute ratings
-            ratings = []
-            for m in matches:
-                if m.referee_rating_home is not None:
-                    ratings.append(m.referee_rating_home)
-                if m.referee_rating_away is not None:
-                    ratings.append(m.referee_rating_away)
+            # Unpivot home/away ratings into one column: each match gives two rows
+            ratings = union_all(
+                select(Match.referee_rating_home.label('rating')).where(Match.referee_id == referee_id),
+                select(Match.referee_rating_away.label('rating')).where(Match.referee_id == referee_id),
+            ).subquery()
+            rating = ratings.c.rating
+            stats = session.query(
+                func.count().label('rows'),
+                func.avg(rating).label('avg'),
+                func.count(rating).label('total'),
+                *[func.coalesce(func.sum(case((rating == k, 1), else_=0)), 0).label(f'rating_{k}')
+                  for k in range(5, 0, -1)],
+            ).one()
+
+            matches_query = session.query(Match).options(
+                selectinload(Match.home_team),
+                selectinload(Match.away_team),
+            ).filter_by(referee_id=referee_id).order_by(Match.date_time.desc())
+            if limit:
+                matches_query = matches_query.limit(limit)
+            matches = matches_query.all()
 
             matches_list = []
             for m in matches:
                 matches_list.append({
                     'id': m.id,
                     'site_id': m.site_id,
-                    'date_time': m.date_time.isoformat() if m.date_time else None,
+                    'date_time': m.date_time,
                     'home_team': m.home_team.name if m.home_team else '?',
                     'away_team': m.away_team.name if m.away_team else '?',
                     'home_team_id': m.home_team_id,
@@ -499,14 +784,14 @@ def register_routes(app: Flask):
                 'last_name': referee.last_name,
                 'patronymic': referee.patronymic,
                 'stats': {
-                    'total_matches': len(matches),
-                    'avg_rating': round(sum(ratings) / len(ratings), 1) if ratings else None,
-                    'total_ratings': len(ratings),
-                    'rating_5': sum(1 for r in ratings if r == 5),
-                    'rating_4': sum(1 for r in ratings if r == 4),
-                    'rating_3': sum(1 for r in ratings if r == 3),
-                    'rating_2': sum(1 for r in ratings if r == 2),
-                    'rating_1': sum(1 for r in ratings if r == 1),
+                    'total_matches': stats.rows // 2,
+                    'avg_rating': round(stats.avg, 1) if stats.avg is not None else None,
+                    'total_ratings': stats.total,
+                    'rating_5': stats.rating_5,
+                    'rating_4': stats.rating_4,
+                    'rating_3': stats.rating_3,
+                    'rating_2': stats.rating_2,
+                    'rating_1': stats.rating_1,
                 },
                 'matches': matches_list,
             }
@@ -516,10 +801,18 @@ def register_routes(app: Flask):
     @app.route('/api/matches/<int:match_id>')
     def api_match_detail(match_id):
         """Get detailed match info including rosters."""
-        from src.database.models import Match, MatchPlayer, BestPlayer
 
         with db.session() as session:
-            match = session.query(Match).filter_by(id=match_id).first()
+            # Teams and referee ride along in the match row itself; the
+            # collections follow in one IN query per level
+            match = session.query(Match).options(
+                joinedload(Match.home_team),
+                joinedload(Match.away_team),
+                joinedload(Match.referee),
+                selectinload(Match.players).selectinload(MatchPlayer.player),
+                selectinload(Match.best_players).selectinload(BestPlayer.player),
+                selectinload(Match.best_players).selectinload(BestPlayer.team),
+            ).filter_by(id=match_id).first()
             if not match:
                 return jsonify({'error': 'Match not found'}), 404
 
@@ -553,7 +846,7 @@ def register_routes(app: Flask):
             result = {
                 'id': match.id,
                 'site_id': match.site_id,
-                'date_time': match.date_time.isoformat() if match.date_time else None,
+                'date_time': match.date_time,
                 'home_team': {
                     'id': match.home_team.id,
                     'site_id': match.home_team.site_id,
@@ -587,42 +880,43 @@ def register_routes(app: Flask):
     @app.route('/api/teams/<int:team_id>')
     def api_team_detail(team_id):
         """Get detailed team info."""
-        from src.database.models import Team, Match, MatchPlayer, TeamRoster
-        from sqlalchemy import or_, func
 
         with db.session() as session:
             team = session.query(Team).filter_by(id=team_id).first()
             if not team:
                 return jsonify({'error': 'Team not found'}), 404
 
-            # Get match stats
-            home_matches = session.query(Match).filter_by(home_team_id=team_id).count()
-            away_matches = session.query(Match).filter_by(away_team_id=team_id).count()
-            total_matches = home_matches + away_matches
-
-            # Get wins/losses
-            home_wins = session.query(Match).filter(
-                Match.home_team_id == team_id,
-                Match.home_score > Match.away_score
-            ).count()
-            away_wins = session.query(Match).filter(
-                Match.away_team_id == team_id,
-                Match.away_score > Match.home_score
-            ).count()
-            total_wins = home_wins + away_wins
-
-            # Get players who played for this team
-            players_query = session.query(MatchPlayer).filter_by(team_id=team_id).all()
-            player_ids = set(mp.player_id for mp in players_query)
-
-            from src.database.models import Player
-            players = session.query(Player).filter(Player.id.in_(player_ids)).all() if player_ids else []
+            # Get match stats and wins in one pass over the team's matches
+            is_home = Match.home_team_id == team_id
+            is_away = Match.away_team_id == team_id
+            counts = session.query(
+                func.sum(case((is_home, 1), else_=0)).label('home'),
+                func.sum(case((is_away, 1), else_=0)).label('away'),
+                func.sum(case((and_(is_home, Match.home_score > Match.away_score), 1), else_=0)).label('home_wins'),
+                func.sum(case((and_(is_away, Match.away_score > Match.home_score), 1), else_=0)).label('away_wins'),
+            ).filter(or_(is_home, is_away)).one()
+            total_matches = (counts.home or 0) + (counts.away or 0)
+            total_wins = (counts.home_wins or 0) + (counts.away_wins or 0)
+
+            # Get players who played for this team, as plain column rows
+            player_ids = session.query(MatchPlayer.player_id).filter_by(team_id=team_id).distinct()
+            players = session.query(
+                Player.id, Player.site_id, Player.full_name,
+                Player.height, Player.position, Player.birth_year, Player.photo_url,
+            ).filter(Player.id.in_(player_ids)).all()
 
             # Get roster info (from members.php)
-            roster_entries = session.query(TeamRoster).filter_by(team_id=team_id).all()
-
-            # Recent matches
-            recent_matches = session.query(Match).filter(
+            roster_entries = session.query(TeamRoster).options(
+                selectinload(TeamRoster.player)
+            ).filter_by(team_id=team_id).all()
+
+            # Recent matches, with both teams' names in one IN query each
+            recent_matches = session.query(Match).options(
+                load_only(Match.id, Match.site_id, Match.date_time, Match.home_team_id,
+                          Match.away_team_id, Match.home_score, Match.away_score),
+                selectinload(Match.home_team).load_only(Team.name),
+                selectinload(Match.away_team).load_only(Team.name),
+            ).filter(
                 or_(Match.home_team_id == team_id, Match.away_team_id == team_id)
             ).order_by(Match.date_time.desc()).limit(10).all()
 
@@ -655,7 +949,7 @@ def register_routes(app: Flask):
                 'recent_matches': [{
                     'id': m.id,
                     'site_id': m.site_id,
-                    'date_time': m.date_time.isoformat() if m.date_time else None,
+                    'date_time': m.date_time,
                     'opponent': m.away_team.name if m.home_team_id == team_id else m.home_team.name,
                     'score': f"{m.home_score}:{m.away_score}" if m.home_team_id == team_id else f"{m.away_score}:{m.home_score}",
                     'is_win': (m.home_score > m.away_score) if m.home_team_id == team_id else (m.away_score > m.home_score),
@@ -668,77 +962,57 @@ def register_routes(app: Flask):
     @app.route('/api/players/<int:player_id>')
     def api_player_detail(player_id):
         """Get detailed player info."""
-        from src.database.models import Player, MatchPlayer, Match, BestPlayer, Referee
-        from sqlalchemy import func
 
         with db.session() as session:
             player = session.query(Player).filter_by(id=player_id).first()
             if not player:
                 return jsonify({'error': 'Player not found'}), 404
 
-            # Get match entries with team info
-            match_entries = session.query(MatchPlayer).filter_by(player_id=player_id).all()
-            match_team_map = {mp.match_id: mp.team_id for mp in match_entries}
-            team_ids = set(mp.team_id for mp in match_entries)
+            # All matches with the team the player was on (sorted by date desc)
+            rows = session.query(Match, MatchPlayer.team_id).join(
+                MatchPlayer, MatchPlayer.match_id == Match.id
+            ).filter(
+                MatchPlayer.player_id == player_id
+            ).options(
+                selectinload(Match.home_team),
+                selectinload(Match.away_team),
+            ).order_by(Match.date_time.desc()).all()
 
-            from src.database.models import Team
-            teams = session.query(Team).filter(Team.id.in_(team_ids)).all() if team_ids else []
-            teams_map = {t.id: t.name for t in teams}
+            # The player's teams are already in the identity map via the matches
+            team_ids = sorted(set(team_id for _, team_id in rows))
+            teams = [session.get(Team, team_id) for team_id in team_ids]
+            teams_map = {t.id: t.name for t in teams if t}
 
             # Get best player awards
             best_player_count = session.query(BestPlayer).filter_by(player_id=player_id).count()
 
-            # All matches (sorted by date desc)
-            match_ids = [mp.match_id for mp in match_entries]
-            all_matches = session.query(Match).filter(
-                Match.id.in_(match_ids)
-            ).order_by(Match.date_time.desc()).all() if match_ids else []
-
-            # Calculate wins/losses
-            wins = 0
-            losses = 0
-            for m in all_matches:
-                if m.home_score is not None and m.away_score is not None:
-                    player_team_id = match_team_map.get(m.id)
-                    if player_team_id == m.home_team_id:
-                        if m.home_score > m.away_score:
-                            wins += 1
-                        else:
-                            losses += 1
-                    else:
-                        if m.away_score > m.home_score:
-                            wins += 1
-                        else:
-                            losses += 1
-
             # Check if player is also a referee (by name match)
             referee_stats = None
-            referee = session.query(Referee).filter(
-                Referee.last_name == player.last_name,
-                Referee.first_name == player.first_name
-            ).first()
-
-            if referee:
-                # Get referee matches and ratings
-                ref_matches = session.query(Match).filter_by(referee_id=referee.id).all()
-                if ref_matches:
-                    ratings = []
-                    for rm in ref_matches:
-                        if rm.referee_rating_home is not None:
-                            ratings.append(rm.referee_rating_home)
-                        if rm.referee_rating_away is not None:
-                            ratings.append(rm.referee_rating_away)
+            referee_id = _referee_id_by_name(player.last_name, player.first_name)
 
+            if referee_id is not None:
+                # Unpivot home/away ratings: each refereed match gives two rows
+                ratings = union_all(
+                    select(Match.referee_rating_home.label('rating')).where(Match.referee_id == referee_id),
+                    select(Match.referee_rating_away.label('rating')).where(Match.referee_id == referee_id),
+                ).subquery()
+                ref = session.query(
+                    func.count().label('rows'),
+                    func.avg(ratings.c.rating).label('avg'),
+                    func.count(ratings.c.rating).label('total'),
+                ).one()
+                if ref.rows:
                     referee_stats = {
-                        'matches_refereed': len(ref_matches),
-                        'avg_rating': round(sum(ratings) / len(ratings), 2) if ratings else None,
-                        'total_ratings': len(ratings),
+                        'matches_refereed': ref.rows // 2,
+                        'avg_rating': round(ref.avg, 2) if ref.avg is not None else None,
+                        'total_ratings': ref.total,
                     }
 
-            # Build matches list with detailed info
+            # Build matches list with detailed info, counting wins/losses on the way
+            wins = 0
+            losses = 0
             matches_list = []
-            for m in all_matches:
-                player_team_id = match_team_map.get(m.id)
+            for m, player_team_id in rows:
                 is_home = player_team_id == m.home_team_id
                 player_team = teams_map.get(player_team_id, '?')
 
@@ -751,10 +1025,16 @@ def register_routes(app: Flask):
                     is_win = m.away_score > m.home_score if m.away_score is not None else None
                     score = f"{m.away_score}:{m.home_score}"
 
+                if m.home_score is not None and m.away_score is not None:
+                    if is_win:
+                        wins += 1
+                    else:
+                        losses += 1
+
                 matches_list.append({
                     'id': m.id,
                     'site_id': m.site_id,
-                    'date_time': m.date_time.isoformat() if m.date_time else None,
+                    'date_time': m.date_time,
                     'player_team': player_team,
                     'opponent': opponent,
                     'score': score,
@@ -775,7 +1055,7 @@ def register_routes(app: Flask):
                 'birth_year': player.birth_year,
                 'photo_url': player.photo_url,
                 'stats': {
-                    'total_matches': len(match_entries),
+                    'total_matches': len(rows),
                     'wins': wins,
                     'losses': losses,
                     'win_rate': round(wins / (wins + losses) * 100, 1) if (wins + losses) > 0 else 0,
@@ -785,7 +1065,7 @@ def register_routes(app: Flask):
                 'teams': [{
                     'id': t.id,
                     'name': t.name,
-                } for t in teams],
+                } for t in teams if t],
                 'matches': matches_list,
             }
 
@@ -793,7 +1073,15 @@ def register_routes(app: Flask):
 
     @app.route('/api/autoupdate/status')
     def api_autoupdate_status():
-        return jsonify(auto_updater.get_status())
+        return _revalidated(jsonify(auto_updater.get_status()))
+
+    @app.route('/api/autoupdate/run', methods=['POST'])
+    def api_autoupdate_run():
+        """Start an update now instead of waiting for the interval."""
+        if not auto_updater.is_running:
+            return jsonify({'error': 'Auto-updater runs out of process (python run.py updater)'}), 409
+        auto_updater.trigger_now()
+        return jsonify({'status': 'triggered'})
 
 
 def register_bc_routes(app: Flask):
@@ -803,7 +1091,7 @@ def register_bc_routes(app: Flask):
 
     @app.route('/api/bc/progress')
     def api_bc_progress():
-        return jsonify(bc_parsing_service.get_progress())
+        return _revalidated(jsonify(bc_parsing_service.get_progress()))
 
     @app.route('/api/bc/parse/full-season', methods=['POST'])
     def api_bc_parse_full_season():
@@ -900,51 +1188,39 @@ def register_bc_routes(app: Flask):
 
     @app.route('/api/bc/stats')
     def api_bc_stats():
-        with db.session() as session:
-            svc = BCDataService(session)
-            return jsonify(svc.get_stats())
+        return jsonify(_cached('bc_stats', _get_bc_stats))
 
     @app.route('/api/bc/stats/monthly')
     def api_bc_stats_monthly():
-        from src.database.models import BCMatch
-        from sqlalchemy import func, extract
-        with db.session() as session:
-            data = session.query(
-                extract('year', BCMatch.date_time).label('year'),
-                extract('month', BCMatch.date_time).label('month'),
-                func.count(BCMatch.id).label('count')
-            ).filter(BCMatch.date_time.isnot(None)
-            ).group_by('year', 'month'
-            ).order_by('year', 'month').all()
-            result = [{'year': int(r.year), 'month': int(r.month), 'count': r.count} for r in data]
-            years = sorted(set(r['year'] for r in result))
-            return jsonify({'data': result, 'years': years})
+        return jsonify(_cached('bc_monthly', _get_bc_monthly_stats))
 
     @app.route('/api/bc/seasons')
     def api_bc_seasons():
-        from src.database.models import BCSeason
-        with db.session() as session:
-            seasons = session.query(BCSeason).order_by(BCSeason.number.desc()).all()
-            return jsonify({'seasons': [{
-                'id': s.id, 'number': s.number, 'name': s.name
-            } for s in seasons]})
+        return jsonify(_cached('bc_seasons', _get_bc_seasons))
 
     @app.route('/api/bc/matches')
     def api_bc_matches():
-        from src.database.models import BCMatch, BCTeam
-        from sqlalchemy import or_
+        """BC matches, paged by ?page= or by the ?cursor= returned as next_cursor."""
 
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 50, type=int)
         search = request.args.get('search', '').strip()
         season = request.args.get('season', '', type=str)
         division = request.args.get('division', '').strip()
+        cursor = request.args.get('cursor')
+
+        keys = [(BCMatch.date_time, True), (BCMatch.id, True)]
+        after = None
+        if cursor:
+            try:
+                after = _decode_cursor(cursor, keys)
+            except ValueError:
+                return jsonify({'error': 'Invalid cursor'}), 400
 
         with db.session() as session:
             query = session.query(BCMatch)
 
             if season:
-                from src.database.models import BCSeason
                 s = session.query(BCSeason).filter_by(number=int(season)).first()
                 if s:
                     query = query.filter(BCMatch.season_id == s.id)
@@ -953,47 +1229,81 @@ def register_bc_routes(app: Flask):
                 query = query.filter(BCMatch.division_name == division)
 
             if search:
-                team_ids = session.query(BCTeam.id).filter(
-                    BCTeam.name.ilike(f'%{search}%')
-                ).subquery()
+                team_ids = select(BCTeam.id).where(_name_search(BCTeam, search))
                 query = query.filter(or_(
                     BCMatch.home_team_id.in_(team_ids),
                     BCMatch.away_team_id.in_(team_ids)
                 ))
 
-            query = query.order_by(BCMatch.date_time.desc())
-            total = query.count()
-            matches = query.offset((page - 1) * per_page).limit(per_page).all()
+            page_query = _bc_match_rows(
+                query,
+                BCMatch.id,
+                BCMatch.site_id,
+                BCMatch.date_time,
+                BCMatch.home_score,
+                BCMatch.away_score,
+                BCMatch.set_scores,
+                BCMatch.division_name,
+                BCMatch.round_name,
+                BCMatch.tournament_type,
+                BCMatch.venue,
+                BCMatch.status,
+            ).order_by(*_order_by(keys))
+
+            if after:
+                total = None
+                rows, next_cursor = _seek_page(page_query, keys, after, per_page)
+                has_more = next_cursor is not None
+            else:
+                rows = page_query.add_columns(
+                    *_key_columns(keys)
+                ).offset((page - 1) * per_page).limit(per_page).all()
+                total = _page_total(('bc_matches_total', season, division, search),
+                                    query, page, per_page, rows)
+                has_more = page * per_page < total
+                next_cursor = _row_cursor(rows[-1], keys) if has_more and rows else None
 
-            result = []
-            for m in matches:
-                result.append({
-                    'id': m.id,
-                    'site_id': m.site_id,
-                    'date_time': m.date_time.isoformat() if m.date_time else None,
-                    'home_team': m.home_team.name if m.home_team else None,
-                    'away_team': m.away_team.name if m.away_team else None,
-                    'home_score': m.home_score,
-                    'away_score': m.away_score,
-                    'set_scores': m.set_scores,
-                    'division_name': m.division_name,
-                    'round_name': m.round_name,
-                    'tournament_type': m.tournament_type,
-                    'venue': m.venue,
-                    'status': m.status,
-                })
+            result = [{
+                'id': r.id,
+                'site_id': r.site_id,
+                'date_time': r.date_time,
+                'home_team': r.home_team,
+                'away_team': r.away_team,
+                'home_score': r.home_score,
+                'away_score': r.away_score,
+                'set_scores': r.set_scores,
+                'division_name': r.division_name,
+                'round_name': r.round_name,
+                'tournament_type': r.tournament_type,
+                'venue': r.venue,
+                'status': r.status,
+            } for r in rows]
 
+        if after:
+            return jsonify({
+                'matches': result, 'per_page': per_page,
+                'has_more': has_more, 'next_cursor': next_cursor,
+            })
         return jsonify({
             'matches': result, 'total': total,
             'page': page, 'per_page': per_page,
-            'pages': (total + per_page - 1) // per_page
+            'pages': (total + per_page - 1) // per_page,
+            'has_more': has_more, 'next_cursor': next_cursor,
         })
 
     @app.route('/api/bc/matches/<int:match_id>')
     def api_bc_match_detail(match_id):
-        from src.database.models import BCMatch, BCSeason
         with db.session() as session:
-            match = session.query(BCMatch).filter_by(id=match_id).first()
+            # Teams and season join into the match row; stats, best players and
+            # referees (with their players/referees) take one query each
+            match = session.query(BCMatch).options(
+                joinedload(BCMatch.home_team),
+                joinedload(BCMatch.away_team),
+                joinedload(BCMatch.season),
+                selectinload(BCMatch.player_stats).joinedload(BCMatchPlayerStats.player),
+                selectinload(BCMatch.best_players).joinedload(BCBestPlayer.player),
+                selectinload(BCMatch.referees).joinedload(BCMatchReferee.referee),
+            ).filter_by(id=match_id).first()
             if not match:
                 return jsonify({'error': 'Match not found'}), 404
 
@@ -1025,15 +1335,11 @@ def register_bc_routes(app: Flask):
                 'id': mr.referee.id, 'full_name': mr.referee.full_name,
             } for mr in match.referees]
 
-            season_num = 30
-            if match.season_id:
-                season = session.query(BCSeason).filter_by(id=match.season_id).first()
-                if season:
-                    season_num = season.number
+            season_num = match.season.number if match.season else 30
 
             result = {
                 'id': match.id, 'site_id': match.site_id, 'season_num': season_num,
-                'date_time': match.date_time.isoformat() if match.date_time else None,
+                'date_time': match.date_time,
                 'home_team': {'id': match.home_team.id, 'name': match.home_team.name} if match.home_team else None,
                 'away_team': {'id': match.away_team.id, 'name': match.away_team.name} if match.away_team else None,
                 'home_score': match.home_score, 'away_score': match.away_score,
@@ -1050,8 +1356,6 @@ def register_bc_routes(app: Flask):
 
     @app.route('/api/bc/teams')
     def api_bc_teams():
-        from src.database.models import BCTeam, BCMatch
-        from sqlalchemy import func
 
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 50, type=int)
@@ -1059,47 +1363,29 @@ def register_bc_routes(app: Flask):
         sort = request.args.get('sort', 'name')
 
         with db.session() as session:
-            home_sq = session.query(
-                BCMatch.home_team_id.label('tid'), func.count(BCMatch.id).label('cnt')
-            ).filter(BCMatch.home_team_id.isnot(None)).group_by(BCMatch.home_team_id).subquery()
-            away_sq = session.query(
-                BCMatch.away_team_id.label('tid'), func.count(BCMatch.id).label('cnt')
-            ).filter(BCMatch.away_team_id.isnot(None)).group_by(BCMatch.away_team_id).subquery()
-            home_wins = session.query(
-                BCMatch.home_team_id.label('tid'), func.count(BCMatch.id).label('cnt')
-            ).filter(BCMatch.home_team_id.isnot(None), BCMatch.home_score > BCMatch.away_score
-            ).group_by(BCMatch.home_team_id).subquery()
-            away_wins = session.query(
-                BCMatch.away_team_id.label('tid'), func.count(BCMatch.id).label('cnt')
-            ).filter(BCMatch.away_team_id.isnot(None), BCMatch.away_score > BCMatch.home_score
-            ).group_by(BCMatch.away_team_id).subquery()
-
-            mc_expr = func.coalesce(home_sq.c.cnt, 0) + func.coalesce(away_sq.c.cnt, 0)
-            wins_expr = func.coalesce(home_wins.c.cnt, 0) + func.coalesce(away_wins.c.cnt, 0)
-
-            query = session.query(BCTeam, mc_expr.label('mc'), wins_expr.label('wins')
-            ).outerjoin(home_sq, BCTeam.id == home_sq.c.tid
-            ).outerjoin(away_sq, BCTeam.id == away_sq.c.tid
-            ).outerjoin(home_wins, BCTeam.id == home_wins.c.tid
-            ).outerjoin(away_wins, BCTeam.id == away_wins.c.tid)
+            # Counts come from the cached columns kept up to date on save
+            query = session.query(
+                BCTeam.id, BCTeam.site_id, BCTeam.name, BCTeam.is_women,
+                BCTeam.match_count.label('mc'), BCTeam.wins,
+            )
 
             if search:
-                query = query.filter(BCTeam.name.ilike(f'%{search}%'))
+                query = query.filter(_name_search(BCTeam, search))
             if sort == 'matches':
-                query = query.order_by(mc_expr.desc())
+                query = query.order_by(BCTeam.match_count.desc(), BCTeam.id)
             elif sort == 'wins':
-                query = query.order_by(wins_expr.desc())
+                query = query.order_by(BCTeam.wins.desc(), BCTeam.id)
             else:
-                query = query.order_by(BCTeam.name)
+                query = query.order_by(BCTeam.name, BCTeam.id)
 
-            total = query.count()
             rows = query.offset((page - 1) * per_page).limit(per_page).all()
+            total = _page_total(('bc_teams_total', search), query, page, per_page, rows)
             result = []
             for r in rows:
                 mc = r.mc; w = r.wins
                 result.append({
-                    'id': r.BCTeam.id, 'site_id': r.BCTeam.site_id,
-                    'name': r.BCTeam.name, 'is_women': r.BCTeam.is_women,
+                    'id': r.id, 'site_id': r.site_id,
+                    'name': r.name, 'is_women': r.is_women,
                     'match_count': mc, 'wins': w, 'losses': mc - w,
                     'win_rate': round(w / mc * 100, 1) if mc > 0 else 0,
                 })
@@ -1108,31 +1394,23 @@ def register_bc_routes(app: Flask):
 
     @app.route('/api/bc/teams/<int:team_id>')
     def api_bc_team_detail(team_id):
-        from src.database.models import BCTeam, BCMatch, BCMatchPlayerStats, BCPlayer, BCSeason
-        from sqlalchemy import or_, func, distinct
 
         with db.session() as session:
             team = session.query(BCTeam).filter_by(id=team_id).first()
             if not team:
                 return jsonify({'error': 'Team not found'}), 404
 
-            total = session.query(BCMatch).filter(or_(
-                BCMatch.home_team_id == team_id, BCMatch.away_team_id == team_id)).count()
-            wins = session.query(BCMatch).filter(or_(
-                (BCMatch.home_team_id == team_id) & (BCMatch.home_score > BCMatch.away_score),
-                (BCMatch.away_team_id == team_id) & (BCMatch.away_score > BCMatch.home_score))).count()
-
-            # Seasons the team played in
-            season_ids = session.query(distinct(BCMatch.season_id)).filter(
-                or_(BCMatch.home_team_id == team_id, BCMatch.away_team_id == team_id),
-                BCMatch.season_id.isnot(None)
-            ).all()
-            seasons_list = []
-            for (sid,) in season_ids:
-                s = session.query(BCSeason).filter_by(id=sid).first()
-                if s:
-                    seasons_list.append({'id': s.id, 'number': s.number, 'name': s.name})
-            seasons_list.sort(key=lambda x: x['number'], reverse=True)
+            # Cached on the row when the team's matches are saved
+            total, wins = team.match_count, team.wins
+
+            # Seasons the team played in, loaded in one query
+            season_ids = select(BCMatch.season_id).where(
+                or_(BCMatch.home_team_id == team_id, BCMatch.away_team_id == team_id)
+            )
+            seasons = session.query(BCSeason).filter(
+                BCSeason.id.in_(season_ids)
+            ).order_by(BCSeason.number.desc()).all()
+            seasons_list = [{'id': s.id, 'number': s.number, 'name': s.name} for s in seasons]
 
             players = session.query(
                 BCPlayer,
@@ -1146,9 +1424,14 @@ def register_bc_routes(app: Flask):
             ).group_by(BCPlayer.id
             ).order_by(func.sum(BCMatchPlayerStats.points).desc()).all()
 
-            recent = session.query(BCMatch).filter(or_(
-                BCMatch.home_team_id == team_id, BCMatch.away_team_id == team_id
-            )).order_by(BCMatch.date_time.desc()).limit(20).all()
+            recent = _bc_match_rows(
+                session.query(BCMatch).filter(or_(
+                    BCMatch.home_team_id == team_id, BCMatch.away_team_id == team_id
+                )),
+                BCMatch.id, BCMatch.site_id, BCMatch.date_time,
+                BCMatch.home_team_id, BCMatch.away_team_id,
+                BCMatch.home_score, BCMatch.away_score,
+            ).order_by(BCMatch.date_time.desc()).limit(20).all()
 
             result = {
                 'id': team.id, 'site_id': team.site_id, 'name': team.name,
@@ -1161,18 +1444,16 @@ def register_bc_routes(app: Flask):
                     'total_points': p.points, 'total_attacks': p.attacks,
                     'total_serves': p.serves, 'total_blocks': p.blocks} for p in players],
                 'recent_matches': [{'id': m.id, 'site_id': m.site_id,
-                    'date_time': m.date_time.isoformat() if m.date_time else None,
-                    'opponent': m.away_team.name if m.home_team_id == team_id else (m.home_team.name if m.home_team else '?'),
+                    'date_time': m.date_time,
+                    'opponent': m.away_team if m.home_team_id == team_id else m.home_team,
                     'score': f"{m.home_score}:{m.away_score}" if m.home_team_id == team_id else f"{m.away_score}:{m.home_score}",
                     'is_win': (m.home_score > m.away_score) if m.home_team_id == team_id else (m.away_score > m.home_score) if m.away_score is not None else None,
-                } for m in recent if m.home_team and m.away_team],
+                } for m in recent if m.home_team_id is not None and m.away_team_id is not None],
             }
         return jsonify(result)
 
     @app.route('/api/bc/players')
     def api_bc_players():
-        from src.database.models import BCPlayer, BCMatchPlayerStats, BCBestPlayer
-        from sqlalchemy import func, or_
 
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 50, type=int)
@@ -1180,112 +1461,83 @@ def register_bc_routes(app: Flask):
         sort = request.args.get('sort', 'mvp')
 
         with db.session() as session:
-            stats_sq = session.query(
-                BCMatchPlayerStats.player_id,
-                func.count(BCMatchPlayerStats.id).label('games'),
-                func.coalesce(func.sum(BCMatchPlayerStats.points), 0).label('pts'),
-                func.coalesce(func.sum(BCMatchPlayerStats.attacks), 0).label('atk'),
-                func.coalesce(func.sum(BCMatchPlayerStats.serves), 0).label('srv'),
-                func.coalesce(func.sum(BCMatchPlayerStats.blocks), 0).label('blk'),
-            ).group_by(BCMatchPlayerStats.player_id).subquery()
-
-            mvp_sq = session.query(
-                BCBestPlayer.player_id,
-                func.count(BCBestPlayer.id).label('mvp')
-            ).filter(BCBestPlayer.player_id.isnot(None)
-            ).group_by(BCBestPlayer.player_id).subquery()
-
+            # Totals come from the cached columns kept up to date on save
             query = session.query(
-                BCPlayer, stats_sq.c.games, stats_sq.c.pts,
-                stats_sq.c.atk, stats_sq.c.srv, stats_sq.c.blk,
-                func.coalesce(mvp_sq.c.mvp, 0).label('mvp')
-            ).outerjoin(stats_sq, BCPlayer.id == stats_sq.c.player_id
-            ).outerjoin(mvp_sq, BCPlayer.id == mvp_sq.c.player_id)
+                BCPlayer.id, BCPlayer.site_id, BCPlayer.last_name, BCPlayer.first_name,
+                BCPlayer.height, BCPlayer.weight, BCPlayer.match_count,
+                BCPlayer.total_points, BCPlayer.total_attacks, BCPlayer.total_serves,
+                BCPlayer.total_blocks, BCPlayer.mvp_count,
+            )
 
             if search:
-                query = query.filter(or_(
-                    BCPlayer.last_name.ilike(f'%{search}%'),
-                    BCPlayer.first_name.ilike(f'%{search}%')))
-
-            if sort == 'mvp':
-                query = query.order_by(func.coalesce(mvp_sq.c.mvp, 0).desc())
-            elif sort == 'points':
-                query = query.order_by(func.coalesce(stats_sq.c.pts, 0).desc())
-            elif sort == 'matches':
-                query = query.order_by(func.coalesce(stats_sq.c.games, 0).desc())
-            elif sort == 'attacks':
-                query = query.order_by(func.coalesce(stats_sq.c.atk, 0).desc())
-            elif sort == 'serves':
-                query = query.order_by(func.coalesce(stats_sq.c.srv, 0).desc())
-            elif sort == 'blocks':
-                query = query.order_by(func.coalesce(stats_sq.c.blk, 0).desc())
+                query = query.filter(_name_search(BCPlayer, search))
+
+            sort_columns = {
+                'mvp': BCPlayer.mvp_count,
+                'points': BCPlayer.total_points,
+                'matches': BCPlayer.match_count,
+                'attacks': BCPlayer.total_attacks,
+                'serves': BCPlayer.total_serves,
+                'blocks': BCPlayer.total_blocks,
+            }
+            if sort in sort_columns:
+                query = query.order_by(sort_columns[sort].desc(), BCPlayer.id)
             else:
-                query = query.order_by(BCPlayer.last_name)
+                query = query.order_by(BCPlayer.last_name, BCPlayer.id)
 
-            total = query.count()
             rows = query.offset((page - 1) * per_page).limit(per_page).all()
-            result = [{'id': r.BCPlayer.id, 'site_id': r.BCPlayer.site_id,
-                'full_name': r.BCPlayer.full_name,
-                'height': r.BCPlayer.height, 'weight': r.BCPlayer.weight,
-                'match_count': r.games or 0, 'total_points': r.pts or 0,
-                'total_attacks': r.atk or 0, 'total_serves': r.srv or 0, 'total_blocks': r.blk or 0,
-                'mvp_count': r.mvp,
+            total = _page_total(('bc_players_total', search), query, page, per_page, rows)
+            result = [{'id': r.id, 'site_id': r.site_id,
+                'full_name': f"{r.last_name} {r.first_name}",
+                'height': r.height, 'weight': r.weight,
+                'match_count': r.match_count, 'total_points': r.total_points,
+                'total_attacks': r.total_attacks, 'total_serves': r.total_serves,
+                'total_blocks': r.total_blocks, 'mvp_count': r.mvp_count,
             } for r in rows]
 
         return jsonify({'players': result, 'total': total, 'page': page, 'per_page': per_page})
 
     @app.route('/api/bc/players/<int:player_id>')
     def api_bc_player_detail(player_id):
-        from src.database.models import BCPlayer, BCMatchPlayerStats, BCMatch, BCBestPlayer, BCTeam
-        from sqlalchemy import func, distinct
 
         with db.session() as session:
             player = session.query(BCPlayer).filter_by(id=player_id).first()
             if not player:
                 return jsonify({'error': 'Player not found'}), 404
 
-            stats = session.query(
-                func.count(BCMatchPlayerStats.id).label('games'),
-                func.coalesce(func.sum(BCMatchPlayerStats.points), 0).label('points'),
-                func.coalesce(func.sum(BCMatchPlayerStats.attacks), 0).label('attacks'),
-                func.coalesce(func.sum(BCMatchPlayerStats.serves), 0).label('serves'),
-                func.coalesce(func.sum(BCMatchPlayerStats.blocks), 0).label('blocks'),
-            ).filter(BCMatchPlayerStats.player_id == player_id).first()
-
-            best_count = session.query(BCBestPlayer).filter_by(player_id=player_id).count()
-
-            # Teams the player played for
-            team_ids = session.query(distinct(BCMatchPlayerStats.team_id)).filter(
+            # Teams the player played for, loaded in one query
+            team_ids = select(BCMatchPlayerStats.team_id).where(
                 BCMatchPlayerStats.player_id == player_id
-            ).all()
-            teams_list = []
-            for (tid,) in team_ids:
-                if tid:
-                    t = session.query(BCTeam).filter_by(id=tid).first()
-                    if t:
-                        teams_list.append({'id': t.id, 'name': t.name, 'site_id': t.site_id})
-
-            match_stats = session.query(BCMatchPlayerStats, BCMatch).join(
-                BCMatch, BCMatch.id == BCMatchPlayerStats.match_id
-            ).filter(BCMatchPlayerStats.player_id == player_id
+            )
+            teams = session.query(BCTeam).filter(BCTeam.id.in_(team_ids)).all()
+            teams_list = [{'id': t.id, 'name': t.name, 'site_id': t.site_id} for t in teams]
+            team_names = {t.id: t.name for t in teams}
+
+            match_stats = _bc_match_rows(
+                session.query(BCMatchPlayerStats).join(
+                    BCMatch, BCMatch.id == BCMatchPlayerStats.match_id
+                ).filter(BCMatchPlayerStats.player_id == player_id),
+                BCMatchPlayerStats.team_id, BCMatchPlayerStats.points, BCMatchPlayerStats.attacks,
+                BCMatchPlayerStats.serves, BCMatchPlayerStats.blocks,
+                BCMatch.id, BCMatch.date_time, BCMatch.home_team_id, BCMatch.away_team_id,
+                BCMatch.home_score, BCMatch.away_score, BCMatch.division_name, BCMatch.round_name,
             ).order_by(BCMatch.date_time.desc()).all()
 
             matches_list = []
-            for ps, m in match_stats:
-                is_home = ps.team_id == m.home_team_id
-                team_name = ''
-                if ps.team_id:
-                    for t in teams_list:
-                        if t['id'] == ps.team_id:
-                            team_name = t['name']; break
-                opponent = m.away_team.name if is_home and m.away_team else (m.home_team.name if m.home_team else '?')
+            for r in match_stats:
+                is_home = r.team_id == r.home_team_id
+                team_name = team_names.get(r.team_id, '')
+                if is_home and r.away_team_id is not None:
+                    opponent = r.away_team
+                else:
+                    opponent = r.home_team if r.home_team_id is not None else '?'
                 matches_list.append({
-                    'match_id': m.id,
-                    'date_time': m.date_time.isoformat() if m.date_time else None,
+                    'match_id': r.id,
+                    'date_time': r.date_time,
                     'team_name': team_name, 'opponent': opponent,
-                    'division': m.division_name, 'round': m.round_name,
-                    'points': ps.points, 'attacks': ps.attacks, 'serves': ps.serves, 'blocks': ps.blocks,
-                    'score': f"{m.home_score}:{m.away_score}" if is_home else f"{m.away_score}:{m.home_score}",
+                    'division': r.division_name, 'round': r.round_name,
+                    'points': r.points, 'attacks': r.attacks, 'serves': r.serves, 'blocks': r.blocks,
+                    'score': f"{r.home_score}:{r.away_score}" if is_home else f"{r.away_score}:{r.home_score}",
                 })
 
             result = {
@@ -1295,9 +1547,10 @@ def register_bc_routes(app: Flask):
                 'height': player.height, 'weight': player.weight,
                 'birth_date': player.birth_date, 'position': player.position,
                 'photo_url': player.photo_url,
-                'stats': {'total_matches': stats.games, 'total_points': stats.points,
-                    'total_attacks': stats.attacks, 'total_serves': stats.serves,
-                    'total_blocks': stats.blocks, 'best_player_awards': best_count},
+                # Totals are cached on the row when the player's matches are saved
+                'stats': {'total_matches': player.match_count, 'total_points': player.total_points,
+                    'total_attacks': player.total_attacks, 'total_serves': player.total_serves,
+                    'total_blocks': player.total_blocks, 'best_player_awards': player.mvp_count},
                 'teams': teams_list,
                 'matches': matches_list,
             }
@@ -1305,8 +1558,6 @@ def register_bc_routes(app: Flask):
 
     @app.route('/api/bc/referees')
     def api_bc_referees():
-        from src.database.models import BCReferee, BCMatchReferee
-        from sqlalchemy import func, or_
 
         search = request.args.get('search', '').strip()
         with db.session() as session:
@@ -1317,9 +1568,7 @@ def register_bc_routes(app: Flask):
                 BCReferee, func.coalesce(mc_sq.c.mc, 0).label('mc')
             ).outerjoin(mc_sq, BCReferee.id == mc_sq.c.referee_id)
             if search:
-                query = query.filter(or_(
-                    BCReferee.last_name.ilike(f'%{search}%'),
-                    BCReferee.first_name.ilike(f'%{search}%')))
+                query = query.filter(_name_search(BCReferee, search))
             rows = query.order_by(func.coalesce(mc_sq.c.mc, 0).desc()).all()
             result = [{'id': r.BCReferee.id, 'full_name': r.BCReferee.full_name,
                 'match_count': r.mc} for r in rows]
@@ -1327,22 +1576,25 @@ def register_bc_routes(app: Flask):
 
     @app.route('/api/bc/referees/<int:referee_id>')
     def api_bc_referee_detail(referee_id):
-        from src.database.models import BCReferee, BCMatchReferee, BCMatch
         with db.session() as session:
             referee = session.query(BCReferee).filter_by(id=referee_id).first()
             if not referee:
                 return jsonify({'error': 'Referee not found'}), 404
-            assignments = session.query(BCMatchReferee, BCMatch).join(
-                BCMatch, BCMatch.id == BCMatchReferee.match_id
-            ).filter(BCMatchReferee.referee_id == referee_id
+            assignments = _bc_match_rows(
+                session.query(BCMatchReferee).join(
+                    BCMatch, BCMatch.id == BCMatchReferee.match_id
+                ).filter(BCMatchReferee.referee_id == referee_id),
+                BCMatch.id, BCMatch.site_id, BCMatch.date_time,
+                BCMatch.home_team_id, BCMatch.away_team_id,
+                BCMatch.home_score, BCMatch.away_score, BCMatch.division_name, BCMatch.round_name,
             ).order_by(BCMatch.date_time.desc()).all()
             matches_list = [{'id': m.id, 'site_id': m.site_id,
-                'date_time': m.date_time.isoformat() if m.date_time else None,
-                'home_team': m.home_team.name if m.home_team else '?',
-                'away_team': m.away_team.name if m.away_team else '?',
+                'date_time': m.date_time,
+                'home_team': m.home_team if m.home_team_id is not None else '?',
+                'away_team': m.away_team if m.away_team_id is not None else '?',
                 'home_score': m.home_score, 'away_score': m.away_score,
                 'division': m.division_name, 'round': m.round_name,
-            } for mr, m in assignments]
+            } for m in assignments]
             result = {
                 'id': referee.id, 'full_name': referee.full_name,
                 'photo_url': referee.photo_url,
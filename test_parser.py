@@ -2,72 +2,120 @@
 """Test script for the parser."""
 
 import sys
-import json
-import io
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 
 # Fix Windows console encoding
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 # Add src to path
 sys.path.insert(0, '.')
 
-from src.parser.match_parser import MatchParser
+from src.parser.match_parser import MatchParser, MatchFetchError
 from src.database.db import Database
 from src.services.data_service import DataService
 
 
+def key_field_checks(data: dict) -> list:
+    """(name, value) of the fields every parsed match should have."""
+    return [
+        ("site_id", data.get("site_id")),
+        ("date_time", data.get("date_time")),
+        ("home_team", data.get("home_team")),
+        ("away_team", data.get("away_team")),
+        ("home_score", data.get("home_score")),
+        ("away_score", data.get("away_score")),
+        ("set_scores", data.get("set_scores")),
+        ("referee", data.get("referee")),
+        ("referee_rating_home", data.get("referee_rating_home")),
+        ("referee_rating_away", data.get("referee_rating_away")),
+        ("best_players count", len(data.get("best_players", []))),
+        ("home_roster count", len(data.get("home_roster", []))),
+        ("away_roster count", len(data.get("away_roster", []))),
+    ]
+
+
 def test_parse_single_match(match_id: int):
-    """Test parsing a single match."""
+    """Test parsing a single match. Returns the parsed data, or None on failure."""
     print(f"\n{'='*60}")
     print(f"Testing match_id={match_id}")
     print('='*60)
 
     parser = MatchParser()
-    data = parser.parse_match(match_id)
+    try:
+        data = parser.parse_match(match_id)
+    except MatchFetchError as e:
+        print(f"ERROR: {e}")
+        return None
 
     if data is None:
-        print("ERROR: Failed to parse match (returned None)")
-        return False
+        print("ERROR: Match not found or failed to parse (returned None)")
+        return None
 
     # Remove raw_html for cleaner output
     data_clean = {k: v for k, v in data.items() if k != 'raw_html'}
 
     print("\nParsed data:")
-    print(json.dumps(data_clean, indent=2, ensure_ascii=False, default=str))
+    print(orjson.dumps(data_clean, option=orjson.OPT_INDENT_2, default=str).decode())
 
     # Check key fields
     print("\n--- Key fields check ---")
-    checks = [
-        ("site_id", data.get("site_id")),
-        ("date_time", data.get("date_time")),
-        ("home_team", data.get("home_team")),
-        ("away_team", data.get("away_team")),
-        ("home_score", data.get("home_score")),
-        ("away_score", data.get("away_score")),
-        ("set_scores", data.get("set_scores")),
-        ("referee", data.get("referee")),
-        ("referee_rating_home", data.get("referee_rating_home")),
-        ("referee_rating_away", data.get("referee_rating_away")),
-        ("best_players count", len(data.get("best_players", []))),
-        ("home_roster count", len(data.get("home_roster", []))),
-        ("away_roster count", len(data.get("away_roster", []))),
-    ]
-
-    for name, value in checks:
+    for name, value in key_field_checks(data):
         status = "OK" if value else "MISSING"
         print(f"  {name}: {value} [{status}]")
 
-    return True
+    return data
 
 
-def test_save_to_db(match_id: int):
-    """Test saving parsed data to database."""
+def test_parse_many(match_ids: list, workers: int) -> int:
+    """Parse several matches concurrently and report missing key fields per match.
+
+    One parser (and its pooled HTTP session) is shared by the workers; its
+    rate limit still applies. Returns the number of matches parsed.
+    """
     print(f"\n{'='*60}")
-    print(f"Testing save to DB for match_id={match_id}")
+    print(f"Testing {len(match_ids)} matches with {workers} workers")
     print('='*60)
 
     parser = MatchParser()
-    data = parser.parse_match(match_id)
+    parsed = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(parser.parse_match, match_id) for match_id in match_ids]
+        for match_id, future in zip(match_ids, futures):
+            try:
+                data = future.result()
+            except MatchFetchError:
+                print(f"  {match_id}: FETCH FAILED")
+                continue
+            if data is None:
+                print(f"  {match_id}: FAILED")
+                continue
+            parsed += 1
+            missing = [name for name, value in key_field_checks(data) if not value]
+            print(f"  {match_id}: {'MISSING ' + ', '.join(missing) if missing else 'OK'}")
+
+    print(f"\nParsed {parsed}/{len(match_ids)}")
+    return parsed
+
+
+def test_save_to_db(match_id: int, data: dict = None):
+    """Test saving parsed data to database.
+
+    data: the match as already parsed by test_parse_single_match; the page
+    is only fetched again if it is not given.
+    """
+    print(f"\n{'='*60}")
+    print(f"Testing save to DB for match_id={match_id}")
+    print('='*60)
+
+    if data is None:
+        try:
+            data = MatchParser().parse_match(match_id)
+        except MatchFetchError as e:
+            print(f"ERROR: {e}")
+            return False
 
     if data is None:
         print("ERROR: Failed to parse match")
@@ -91,21 +139,28 @@ def test_save_to_db(match_id: int):
 
 
 if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='VolleyMSK parser test')
     # Test match ID (from user's example)
-    test_match_id = 42131
-
-    if len(sys.argv) > 1:
-        test_match_id = int(sys.argv[1])
+    arg_parser.add_argument('match_id', type=int, nargs='?', default=42131,
+                            help='Match to parse and save')
+    arg_parser.add_argument('--ids', help='Comma-separated match IDs to parse concurrently (no DB save)')
+    arg_parser.add_argument('--workers', type=int, default=16, help='Concurrent fetches for --ids')
+    args = arg_parser.parse_args()
 
     print("VolleyMSK Parser Test")
-    print(f"Testing with match_id={test_match_id}")
 
-    # Test 1: Parse single match
-    success = test_parse_single_match(test_match_id)
+    if args.ids:
+        test_parse_many([int(i) for i in args.ids.split(',') if i.strip()], args.workers)
+    else:
+        test_match_id = args.match_id
+        print(f"Testing with match_id={test_match_id}")
+
+        # Test 1: Parse single match
+        data = test_parse_single_match(test_match_id)
 
-    if success:
-        # Test 2: Save to database
-        test_save_to_db(test_match_id)
+        if data is not None:
+            # Test 2: Save the same parsed data to database
+            test_save_to_db(test_match_id, data)
 
     print("\n" + "="*60)
     print("Test completed!")
@@ -0,0 +1,19 @@
+"""WSGI entry point for running the web interface under a production server.
+
+    gunicorn -w 1 --threads 8 -b 127.0.0.1:8080 wsgi:app
+
+Use a single worker process with threads: parsing jobs, their progress and
+the auto-updater live in the process, so every extra worker would start its
+own copies of them.
+"""
+
+import logging
+
+from src.web import create_app
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+)
+
+app = create_app()